@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark a shared DerivedCache for multi-threaded exploration.
+
+Builds a few synthetic documents, then has a thread pool serve simulated
+requests against them: each request explores a random document's record
+collection, reads its field counts and child keys, and resolves a path
+into a random record. The same requests are served without a cache and
+with one ``DerivedCache`` shared by all threads. Checks that both give
+identical answers and prints the timings and cache statistics.
+
+Usage: python scripts/benchmark_derived_cache.py [--records N] [--documents D]
+       [--threads T] [--requests R]
+"""
+
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from jsonanatomy import DerivedCache, Xplore
+
+
+def make_document(count, seed):
+    """Create a document with ``count`` records of varying schema."""
+    rng = random.Random(seed)
+    optional = ["email", "phone", "nickname", "manager", "office"]
+    records = []
+    for i in range(count):
+        record = {"id": i, "name": f"user-{i}", "profile": {"city": "Springfield", "age": 20 + i % 50}}
+        for field in rng.sample(optional, rng.randint(0, len(optional))):
+            record[field] = f"{field}-{i}"
+        records.append(record)
+    return {"meta": {"seed": seed}, "records": records}
+
+
+def serve(documents, cache, requests, seed):
+    """Serve ``requests`` simulated requests and return their answers."""
+    rng = random.Random(seed)
+    answers = []
+    for _ in range(requests):
+        document = documents[rng.randrange(len(documents))]
+        records = Xplore(document, cache=cache)["records"]
+        counts = records.explore.field_counts()
+        keys = records.keys()
+        record = rng.randrange(len(keys))
+        answers.append((sorted(counts.items()), len(keys), records[record]["profile"]["city"].value()))
+    return answers
+
+
+def run(documents, cache, threads, requests):
+    """Serve requests from every thread and return the elapsed time and answers."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        futures = [pool.submit(serve, documents, cache, requests, seed) for seed in range(threads)]
+        answers = [future.result() for future in futures]
+    return time.perf_counter() - start, answers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--documents", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=50, help="requests per thread")
+    args = parser.parse_args()
+
+    documents = [make_document(args.records, seed) for seed in range(args.documents)]
+    plain_time, plain_answers = run(documents, None, args.threads, args.requests)
+    cache = DerivedCache()
+    cached_time, cached_answers = run(documents, cache, args.threads, args.requests)
+    assert plain_answers == cached_answers, "cached and uncached answers differ"
+
+    total = args.threads * args.requests
+    print(f"{args.documents} documents x {args.records} records, {args.threads} threads x {args.requests} requests")
+    print(f"  no cache     : {plain_time:8.3f} s  ({total / plain_time:8.0f} requests/s)")
+    print(f"  DerivedCache : {cached_time:8.3f} s  ({total / cached_time:8.0f} requests/s, "
+          f"{cache.hits} hits, {cache.misses} misses, {cache.size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Check that importing jsonanatomy stays within a startup time budget.
+
+Imports the package in fresh interpreters with ``-X importtime`` and takes
+the median cumulative import time of each statement. Also checks that a
+bare ``import jsonanatomy`` does not load submodules or heavy standard
+library modules that are only needed by some features. Exits with status 1
+if a budget is exceeded or an unexpected module is loaded, so it can run in
+CI.
+
+Usage: python scripts/benchmark_import_time.py [--runs N] [--budget-ms MS]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import jsonanatomy": 1.0,
+    "from jsonanatomy import Maybe": 2.0,
+}
+# Modules that a bare "import jsonanatomy" must not load.
+DEFERRED_MODULES = [
+    "jsonanatomy.Explore",
+    "jsonanatomy.file_reader",
+    "jsonanatomy._scan",
+    "xml.etree.ElementTree",
+    "json",
+    "glob",
+    "mmap",
+    "multiprocessing",
+]
+
+
+def import_time_ms(statement):
+    """Run a statement in a fresh interpreter and return the jsonanatomy import time."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        # Lines look like "import time:   self |   cumulative | name"; the
+        # cumulative times of top-level jsonanatomy entries are summed.
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit() and not parts[2].startswith("  "):
+            name = parts[2].strip()
+            if name == "jsonanatomy" or name.startswith("jsonanatomy."):
+                total += int(parts[1])
+    return total / 1000
+
+
+def loaded_modules(statement):
+    """Return the modules loaded by a statement in a fresh interpreter."""
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return set(output.split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=15.0,
+                        help="budget for a bare 'import jsonanatomy'; other statements scale it")
+    args = parser.parse_args()
+
+    failed = False
+    for statement, factor in STATEMENTS.items():
+        budget = args.budget_ms * factor
+        median = statistics.median(import_time_ms(statement) for _ in range(args.runs))
+        status = "ok" if median <= budget else "OVER BUDGET"
+        failed = failed or median > budget
+        print(f"{statement:35s} {median:7.2f} ms  (budget {budget:.1f} ms)  {status}")
+
+    unexpected = sorted(loaded_modules("import jsonanatomy").intersection(DEFERRED_MODULES))
+    if unexpected:
+        failed = True
+        print(f"'import jsonanatomy' loaded deferred modules: {', '.join(unexpected)}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark PathExtractor against equivalent chained Maybe lookups.
+
+Builds synthetic order records, extracts the same set of fields with one
+``Maybe(record)[...]...value()`` chain per field and with a single
+``PathExtractor``, checks that both produce identical results and prints
+the timings.
+
+Usage: python scripts/benchmark_path_extractor.py [--records N] [--repeat R]
+"""
+
+import argparse
+import random
+import time
+
+from jsonanatomy import Maybe, PathExtractor
+
+
+def make_records(count, seed=0):
+    """Create synthetic nested order records with some optional fields."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        record = {
+            "id": i,
+            "status": rng.choice(["new", "paid", "shipped"]),
+            "customer": {
+                "id": rng.randrange(10000),
+                "name": f"customer-{i}",
+                "address": {"city": "Springfield", "zip": f"{rng.randrange(99999):05d}", "country": "US"},
+                "contact": {"email": f"c{i}@example.com", "phone": "555-0100"},
+            },
+            "items": [
+                {"sku": f"SKU-{rng.randrange(500)}", "qty": rng.randrange(1, 5), "price": {"amount": rng.randrange(100, 10000), "currency": "USD"}}
+                for _ in range(rng.randrange(1, 4))
+            ],
+            "shipping": {"method": "ground", "cost": {"amount": 499, "currency": "USD"}},
+        }
+        if rng.random() < 0.5:
+            record["coupon"] = {"code": "SAVE10", "discount": {"percent": 10}}
+        records.append(record)
+    return records
+
+
+PATHS = [
+    ("id",), ("status",),
+    ("customer", "id"), ("customer", "name"),
+    ("customer", "address", "city"), ("customer", "address", "zip"), ("customer", "address", "country"),
+    ("customer", "contact", "email"), ("customer", "contact", "phone"), ("customer", "contact", "fax"),
+    ("items", 0, "sku"), ("items", 0, "qty"), ("items", 0, "price", "amount"), ("items", 0, "price", "currency"),
+    ("items", 1, "sku"), ("items", 1, "qty"), ("items", 1, "price", "amount"), ("items", 1, "price", "currency"),
+    ("items", 2, "sku"), ("items", 2, "qty"), ("items", 2, "price", "amount"), ("items", 2, "price", "currency"),
+    ("shipping", "method"), ("shipping", "cost", "amount"), ("shipping", "cost", "currency"),
+    ("coupon", "code"), ("coupon", "discount", "percent"), ("coupon", "discount", "amount"),
+    ("missing",), ("missing", "deeper", "still"),
+]
+
+
+def extract_with_maybe(records):
+    """Extract every path with its own chained Maybe lookup."""
+    results = []
+    for record in records:
+        row = []
+        for path in PATHS:
+            maybe = Maybe(record)
+            for key in path:
+                maybe = maybe[key]
+            row.append(maybe.value())
+        results.append(tuple(row))
+    return results
+
+
+def best_time(func, repeat):
+    """Return the best wall-clock time of ``repeat`` calls and the last result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    extractor = PathExtractor(PATHS)
+
+    maybe_time, maybe_result = best_time(lambda: extract_with_maybe(records), args.repeat)
+    extractor_time, extractor_result = best_time(lambda: extractor.extract_many(records), args.repeat)
+    assert maybe_result == extractor_result, "PathExtractor and Maybe results differ"
+
+    print(f"{args.records} records x {len(PATHS)} paths")
+    print(f"  chained Maybe : {maybe_time:8.3f} s")
+    print(f"  PathExtractor : {extractor_time:8.3f} s  ({maybe_time / extractor_time:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark SharedDocument handoff against pickling a document to each worker.
+
+Builds a synthetic document of order records, then has a process pool count
+order statuses over disjoint slices of it, once passing the document itself
+to every task (so it is pickled and unpickled per worker) and once passing a
+``SharedDocument`` (so only the segment name is pickled). Checks that both
+produce identical results and prints the timings and per-task payload sizes.
+
+Usage: python scripts/benchmark_shared_document.py [--records N] [--workers W]
+"""
+
+import argparse
+import pickle
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from jsonanatomy import Maybe, SharedDocument
+
+
+def make_document(count):
+    """Create a synthetic document with ``count`` nested order records."""
+    statuses = ["new", "paid", "shipped", "returned"]
+    return {
+        "meta": {"source": "benchmark", "count": count},
+        "orders": [
+            {
+                "id": i,
+                "status": statuses[i % len(statuses)],
+                "customer": {"name": f"customer-{i}", "address": {"city": "Springfield", "country": "US"}},
+                "items": [{"sku": f"SKU-{(i + j) % 500}", "qty": j + 1} for j in range(i % 3 + 1)],
+                "total": {"amount": i % 10000, "currency": "USD"},
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def count_statuses(document, part, parts):
+    """Count the order statuses in one slice of a plain or shared document."""
+    root = document.root if isinstance(document, SharedDocument) else document
+    orders = Maybe(root)["orders"]
+    size = len(orders.value())
+    counts = Counter()
+    for index in range(part * size // parts, (part + 1) * size // parts):
+        counts[orders[index]["status"].value()] += 1
+    return counts
+
+
+def run(pool, document, parts):
+    """Run one task per slice and merge the counts."""
+    total = Counter()
+    for counts in pool.map(count_statuses, [document] * parts, range(parts), [parts] * parts):
+        total.update(counts)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    document = make_document(args.records)
+    with ProcessPoolExecutor(args.workers) as pool:
+        pool.submit(len, []).result()  # Start the workers before timing
+
+        start = time.perf_counter()
+        pickled_result = run(pool, document, args.workers)
+        pickled_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with SharedDocument.publish(document) as shared:
+            publish_time = time.perf_counter() - start
+            shared_result = run(pool, shared, args.workers)
+            shared_time = time.perf_counter() - start
+            shared_size = shared.size
+            shared_payload = len(pickle.dumps(shared))
+
+    assert pickled_result == shared_result, "pickled and shared results differ"
+    pickled_payload = len(pickle.dumps(document, protocol=pickle.HIGHEST_PROTOCOL))
+
+    print(f"{args.records} records, {args.workers} workers")
+    print(f"  pickled copy   : {pickled_time:8.3f} s  ({pickled_payload / 1e6:.1f} MB pickled per task)")
+    print(f"  SharedDocument : {shared_time:8.3f} s  (publish {publish_time:.3f} s, "
+          f"{shared_size / 1e6:.1f} MB shared once, {shared_payload} bytes pickled per task)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark XMLQuery against SimpleXML.to_dict followed by Maybe navigation.
+
+Builds a synthetic catalog document with a header and many item elements,
+parses it with each available backend (ElementTree, and lxml if installed),
+then reads the header fields both by converting the whole tree with
+``to_dict`` and navigating it with ``Maybe``, and with compiled
+``XMLQuery`` objects. Checks that both give the same values and prints the
+timings. Also times extracting one attribute of every item, which
+``to_dict`` cannot express because it keeps only the last repeated element.
+
+Usage: python scripts/benchmark_xml_query.py [--items N] [--repeat R]
+"""
+
+import argparse
+import time
+
+from jsonanatomy import Maybe, SimpleXML, XMLQuery
+from jsonanatomy.SimpleXML import _import_lxml
+
+FIELDS = ["header/title", "header/updated", "header/owner/name"]
+
+
+def make_document(count):
+    """Create a catalog XML document with ``count`` items."""
+    items = "".join(
+        f'<item sku="SKU-{i}"><name>Item {i}</name><price currency="USD">{i % 1000}.99</price>'
+        f"<tags><tag>a</tag><tag>b</tag></tags><stock>{i % 50}</stock></item>"
+        for i in range(count)
+    )
+    return (
+        "<catalog><header><title>Benchmark catalog</title><updated>2026-01-01</updated>"
+        f"<owner><name>Ops</name></owner></header><items>{items}</items></catalog>"
+    )
+
+
+def best_of(repeat, function):
+    """Return the fastest of ``repeat`` timings of ``function`` and its result."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def with_to_dict(document):
+    """Read the header fields by converting the whole tree."""
+    data = Maybe(document.to_dict())
+    return [
+        data["header"]["title"].value(),
+        data["header"]["updated"].value(),
+        data["header"]["owner"]["name"].value(),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    xml_string = make_document(args.items)
+    queries = [XMLQuery(path) for path in FIELDS]
+    skus = XMLQuery("items/item/@sku")
+    backends = ["etree"] + (["lxml"] if _import_lxml() is not None else [])
+    print(f"{args.items} items, {len(xml_string) / 1e6:.1f} MB")
+
+    for backend in backends:
+        parse_time, document = best_of(args.repeat, lambda: SimpleXML(xml_string, parser=backend))
+        dict_time, dict_values = best_of(args.repeat, lambda: with_to_dict(document))
+        query_time, query_values = best_of(args.repeat, lambda: [query.first(document) for query in queries])
+        assert dict_values == query_values, f"to_dict and XMLQuery results differ: {dict_values} {query_values}"
+        sku_time, sku_values = best_of(args.repeat, lambda: skus.find_all(document))
+        assert len(sku_values) == args.items
+
+        print(f"  {backend:5s} parse              : {parse_time * 1000:10.2f} ms")
+        print(f"  {backend:5s} to_dict + Maybe    : {dict_time * 1000:10.2f} ms  ({len(FIELDS)} header fields)")
+        print(f"  {backend:5s} XMLQuery           : {query_time * 1000:10.2f} ms  ({len(FIELDS)} header fields)")
+        print(f"  {backend:5s} XMLQuery all SKUs  : {sku_time * 1000:10.2f} ms  ({len(sku_values)} values)")
+
+
+if __name__ == "__main__":
+    main()
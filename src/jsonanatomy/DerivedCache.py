@@ -0,0 +1,291 @@
+"""
+Thread-safe LRU cache for results derived from read-only documents.
+
+This module provides the DerivedCache class, a memoization layer that
+``Explore`` and ``Xplore`` can share between threads, so that child key
+lists, field counts and resolved paths of hot documents are computed once
+instead of once per request. Entries are keyed by document identity, the
+kind of result and the path of the explored value below the document. The
+cache is bounded by an approximate memory budget for its entries and by
+the number of documents it keeps alive.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+# Approximate bytes used by an entry besides its key path and value: the key
+# and entry tuples and the ordered dictionaries' bookkeeping.
+_ENTRY_OVERHEAD = 200
+_MISSING = object()
+
+
+class DerivedCache:
+    """
+    A memory-capped, thread-safe LRU memo of results derived from documents.
+
+    Results are keyed by ``(id(document), kind, path)``. The cache holds a
+    reference to each document with cached entries, so the identity of a
+    cached document cannot be reused by another object while its entries
+    exist. Plain dicts and lists cannot be weakly referenced, so instead at
+    most ``max_documents`` documents are kept alive: caching a result of
+    another document evicts every entry of the least recently used one.
+    Lookups and updates take an internal lock; computations run outside
+    it, so threads missing the same entry at the same time may compute it
+    concurrently and the first result stored is kept.
+
+    Every entry is charged against ``max_bytes``: a fixed overhead, the
+    shallow size of its key path and the shallow size of its result. For
+    results that are part of a document, such as resolved paths, this is
+    the size of the value itself, not of everything below it. The
+    documents kept alive are bounded by ``max_documents`` rather than
+    measured.
+
+    The cache never inspects documents for changes. It is meant for
+    documents that are not modified while cached; after modifying one,
+    call ``invalidate`` with it, or results computed before the change are
+    returned.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        The approximate memory budget of the entries, by default 32 MiB.
+        Entries larger than the budget are not cached.
+    max_documents : int, optional
+        The largest number of documents with cached entries, by default 16.
+
+    Attributes
+    ----------
+    max_bytes : int
+        The memory budget of the entries.
+    max_documents : int
+        The largest number of documents kept alive.
+    hits : int
+        The number of lookups answered from the cache.
+    misses : int
+        The number of lookups that computed their result.
+
+    Raises
+    ------
+    ValueError
+        If ``max_documents`` is not positive.
+
+    Examples
+    --------
+    >>> cache = DerivedCache(max_bytes=8 * 1024 * 1024)
+    >>> document = {'users': [{'name': 'Alice'}, {'name': 'Bob', 'age': 30}]}
+    >>> Explore(document, cache=cache).child('users').field_counts()
+    {'name': 2, 'age': 1}
+    >>> Xplore(document, cache=cache)['users'].explore.field_counts()  # cached
+    {'name': 2, 'age': 1}
+
+    >>> document['users'].append({'email': 'c@example.com'})
+    >>> cache.invalidate(document)
+    5
+    """
+    def __init__(self, max_bytes=32 * 1024 * 1024, max_documents=16):
+        if max_documents < 1:
+            raise ValueError("max_documents must be a positive integer")
+        self.max_bytes = max_bytes
+        self.max_documents = max_documents
+        self.hits = 0
+        self.misses = 0
+        self._bytes = 0
+        # Key -> (result, size), in least recently used order.
+        self._entries = OrderedDict()
+        # id(document) -> (document, set of keys), in least recently used order.
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """
+        Return a string representation of the DerivedCache object.
+
+        Returns
+        -------
+        str
+            A formatted string showing the number of entries, their
+            approximate size and the number of documents kept alive.
+        """
+        return (f"DerivedCache[entries={len(self._entries)}, bytes={self._bytes}/{self.max_bytes}, "
+                f"documents={len(self._documents)}/{self.max_documents}]")
+
+    def __len__(self):
+        """
+        Get the number of cached results.
+
+        Returns
+        -------
+        int
+            The number of entries.
+        """
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """
+        Get the approximate memory charged for the cached entries.
+
+        Returns
+        -------
+        int
+            The estimated size in bytes.
+        """
+        return self._bytes
+
+    def get(self, document, kind, path, compute, size=None):
+        """
+        Get a derived result, computing and caching it on a miss.
+
+        Parameters
+        ----------
+        document : any
+            The document the result is derived from; it identifies the
+            entry together with ``kind`` and ``path``.
+        kind : str
+            The kind of result, such as ``"keys"`` or ``"field_counts"``.
+        path : tuple
+            The path below ``document`` of the value the result describes.
+            Its components are compared with ``==``, so keys that are equal
+            but of different types (``1``, ``1.0`` and ``True``) should be
+            tagged, as ``Explore`` and ``Xplore`` do with ``(type, key)``.
+        compute : callable
+            A function of no arguments returning the result. Results should
+            be immutable or treated as read-only by callers, since every
+            hit returns the same object.
+        size : int, optional
+            The bytes charged for the result, by default its shallow
+            ``sys.getsizeof``. The entry overhead and the size of ``path``
+            are always added.
+
+        Returns
+        -------
+        any
+            The cached or newly computed result.
+        """
+        key = (id(document), kind, path)
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                self._entries.move_to_end(key)
+                self._documents.move_to_end(key[0])
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        value = compute()
+        size = _ENTRY_OVERHEAD + _path_size(path) + (sys.getsizeof(value) if size is None else size)
+        if size > self.max_bytes:
+            return value
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                return entry[0]
+            record = self._documents.get(key[0])
+            if record is None:
+                record = self._documents[key[0]] = (document, set())
+            self._documents.move_to_end(key[0])
+            record[1].add(key)
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._evict(next(iter(self._entries)))
+            while len(self._documents) > self.max_documents:
+                self._evict_document(next(iter(self._documents)))
+        return value
+
+    def invalidate(self, document):
+        """
+        Drop every cached result derived from a document.
+
+        Call this after modifying a cached document (or any value inside
+        it), since the cache does not detect changes. The cache then no
+        longer keeps the document alive.
+
+        Parameters
+        ----------
+        document : any
+            The document passed as ``document`` to ``get``; for ``Explore``
+            and ``Xplore`` this is the object the root explorer was created
+            with.
+
+        Returns
+        -------
+        int
+            The number of entries removed.
+        """
+        with self._lock:
+            record = self._documents.get(id(document))
+            if record is None or record[0] is not document:
+                return 0
+            return self._evict_document(id(document))
+
+    def _evict(self, key):
+        """
+        Remove one entry, releasing its document if it was the last one.
+
+        The caller must hold the lock.
+
+        Parameters
+        ----------
+        key : tuple
+            The entry key.
+        """
+        self._bytes -= self._entries.pop(key)[1]
+        keys = self._documents[key[0]][1]
+        keys.discard(key)
+        if not keys:
+            del self._documents[key[0]]
+
+    def _evict_document(self, document_id):
+        """
+        Remove every entry of a document and release the document.
+
+        The caller must hold the lock.
+
+        Parameters
+        ----------
+        document_id : int
+            The ``id`` of the document.
+
+        Returns
+        -------
+        int
+            The number of entries removed.
+        """
+        _, keys = self._documents.pop(document_id)
+        for key in keys:
+            self._bytes -= self._entries.pop(key)[1]
+        return len(keys)
+
+    def clear(self):
+        """
+        Drop every cached result and reset the hit and miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._documents.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+def _path_size(path):
+    """
+    Estimate the memory of a key path.
+
+    Parameters
+    ----------
+    path : tuple
+        The path, whose components may be ``(type, key)`` pairs.
+
+    Returns
+    -------
+    int
+        The shallow size of the tuple and its components.
+    """
+    size = sys.getsizeof(path)
+    for component in path:
+        size += sys.getsizeof(component)
+        if type(component) is tuple:
+            size += sum(sys.getsizeof(part) for part in component if type(part) is not type)
+    return size
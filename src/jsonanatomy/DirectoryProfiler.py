@@ -0,0 +1,249 @@
+"""
+Incremental field profiling for directories of JSON files.
+
+This module provides the DirectoryProfiler class, which keeps the field
+counts of every file in a directory together with a size/mtime fingerprint,
+so that repeated profiling only reparses files that were added or changed.
+"""
+
+import os
+
+from .Explore import Explore
+from .file_reader import get_json_file_paths, read_json_file
+
+
+class DirectoryProfiler:
+    """
+    Incrementally maintained field counts for a directory of JSON files.
+
+    Each file is profiled with ``Explore(data).field_counts()`` and the
+    per-file result is stored next to the file's size and modification time.
+    Calling ``refresh()`` rescans the directory, reparses only new or
+    modified files, subtracts the contributions of deleted or changed files
+    and updates the merged aggregate, so a refresh costs time proportional
+    to the change rather than to the whole directory. Files that cannot be
+    read or parsed are recorded in ``errors`` and left out of the aggregate
+    until they change again.
+
+    Parameters
+    ----------
+    base_path : str
+        The directory containing the JSON files to profile.
+    pattern : str, optional
+        The glob pattern used to select files, by default "*.json".
+    recursive : bool, optional
+        If True, also profile files in nested subdirectories, by default False.
+    encoding : str, optional
+        The file encoding to use when reading, by default "utf-8".
+
+    Attributes
+    ----------
+    base_path : str
+        The profiled directory.
+    pattern : str
+        The file selection pattern.
+    recursive : bool
+        Whether nested subdirectories are scanned.
+    encoding : str
+        The file encoding used when reading.
+    files : dict
+        A mapping of file path to ``((size, mtime_ns), counts)`` for every
+        profiled file.
+    counts : dict
+        The merged field counts across all profiled files.
+    errors : dict
+        A mapping of file path to ``((size, mtime_ns), message)`` for every
+        file that could not be profiled at its current fingerprint.
+
+    Examples
+    --------
+    >>> profiler = DirectoryProfiler('/path/to/data')
+    >>> changes = profiler.refresh()  # First call parses every file
+    >>> print(profiler.field_counts())
+    {'name': 120, 'age': 87, 'email': 45}
+
+    >>> changes = profiler.refresh()  # Later calls only parse changed files
+    >>> print(changes)
+    {'added': [], 'modified': ['/path/to/data/users.json'], 'removed': [], 'failed': []}
+
+    Notes
+    -----
+    A file is considered unchanged when both its size and its modification
+    time (in nanoseconds) are identical to the previous refresh. Rewriting a
+    file with identical size within the filesystem's timestamp resolution
+    will therefore not be detected.
+    """
+    def __init__(self, base_path, pattern="*.json", recursive=False, encoding="utf-8"):
+        self.base_path = base_path
+        self.pattern = pattern
+        self.recursive = recursive
+        self.encoding = encoding
+        self.files = {}
+        self.counts = {}
+        self.errors = {}
+
+    def __repr__(self):
+        """
+        Return a string representation of the DirectoryProfiler object.
+
+        Returns
+        -------
+        str
+            A formatted string showing the directory and number of profiled files.
+        """
+        return f"DirectoryProfiler({self.base_path!r}[files={len(self.files)}, errors={len(self.errors)}])"
+
+    def refresh(self):
+        """
+        Rescan the directory and update the aggregate for changed files.
+
+        A new or modified file that cannot be read or is not valid JSON
+        does not stop the refresh: it is recorded in ``errors``, any counts
+        of a previous version are subtracted, and it is retried once its
+        size or modification time changes.
+
+        Returns
+        -------
+        dict
+            A dictionary with the keys ``'added'``, ``'modified'``,
+            ``'removed'`` and ``'failed'``, each mapping to the list of
+            affected file paths. A failing file that parses again is
+            reported as added.
+
+        Examples
+        --------
+        >>> profiler = DirectoryProfiler('/path/to/data')
+        >>> changes = profiler.refresh()
+        >>> print(sorted(changes))
+        ['added', 'failed', 'modified', 'removed']
+        """
+        added = []
+        modified = []
+        failed = []
+        seen = set()
+        for file_path in get_json_file_paths(self.base_path, self.pattern, recursive=self.recursive):
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                # Deleted between the directory scan and the stat call.
+                continue
+            seen.add(file_path)
+            fingerprint = (stat.st_size, stat.st_mtime_ns)
+            entry = self.files.get(file_path)
+            if entry is not None and entry[0] == fingerprint:
+                continue
+            error = self.errors.get(file_path)
+            if error is not None and error[0] == fingerprint:
+                continue
+
+            try:
+                file_counts = self._profile_file(file_path)
+            except (OSError, ValueError) as exc:
+                # Invalid or half-written JSON (including undecodable text)
+                # or a file that became unreadable.
+                if entry is not None:
+                    self._subtract(self.files.pop(file_path)[1])
+                self.errors[file_path] = (fingerprint, str(exc))
+                failed.append(file_path)
+                continue
+            self.errors.pop(file_path, None)
+            if entry is None:
+                added.append(file_path)
+            else:
+                self._subtract(entry[1])
+                modified.append(file_path)
+            self._add(file_counts)
+            self.files[file_path] = (fingerprint, file_counts)
+
+        removed = [file_path for file_path in self.files if file_path not in seen]
+        for file_path in removed:
+            self._subtract(self.files.pop(file_path)[1])
+        for file_path in [file_path for file_path in self.errors if file_path not in seen]:
+            del self.errors[file_path]
+            removed.append(file_path)
+
+        return {"added": added, "modified": modified, "removed": removed, "failed": failed}
+
+    def field_counts(self):
+        """
+        Get the merged field counts across all profiled files.
+
+        Returns
+        -------
+        dict
+            A copy of the aggregate mapping field names to occurrence counts.
+            Call ``refresh()`` first to bring the aggregate up to date.
+
+        Examples
+        --------
+        >>> profiler = DirectoryProfiler('/path/to/data')
+        >>> profiler.refresh()
+        >>> counts = profiler.field_counts()  # {'name': 120, 'age': 87}
+        """
+        return dict(self.counts)
+
+    def file_counts(self, file_path):
+        """
+        Get the stored field counts of a single profiled file.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of a file returned by the directory scan.
+
+        Returns
+        -------
+        dict or None
+            A copy of the file's field counts, or None if the file has not
+            been profiled.
+        """
+        entry = self.files.get(file_path)
+        if entry is None:
+            return None
+        return dict(entry[1])
+
+    def _profile_file(self, file_path):
+        """
+        Parse a single file and compute its field counts.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the JSON file to profile.
+
+        Returns
+        -------
+        dict
+            The field counts of the file as produced by ``Explore.field_counts``.
+        """
+        return Explore(read_json_file(file_path, self.encoding)).field_counts()
+
+    def _add(self, file_counts):
+        """
+        Add a file's field counts to the aggregate.
+
+        Parameters
+        ----------
+        file_counts : dict
+            The field counts to add (the aggregate is modified in place).
+        """
+        for field, count in file_counts.items():
+            self.counts[field] = self.counts.get(field, 0) + count
+
+    def _subtract(self, file_counts):
+        """
+        Remove a file's field counts from the aggregate.
+
+        Fields whose count drops to zero are removed from the aggregate.
+
+        Parameters
+        ----------
+        file_counts : dict
+            The field counts to subtract (the aggregate is modified in place).
+        """
+        for field, count in file_counts.items():
+            remaining = self.counts.get(field, 0) - count
+            if remaining > 0:
+                self.counts[field] = remaining
+            else:
+                self.counts.pop(field, None)
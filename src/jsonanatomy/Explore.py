@@ -5,6 +5,8 @@ This module provides the Explore class for basic inspection and navigation
 of nested JSON data structures (dictionaries and lists).
 """
 
+from ._nodes import OBJECT_TYPES, ARRAY_TYPES
+
 class Explore:
     """
     A lightweight explorer for inspecting JSON object structures.
@@ -17,6 +19,11 @@ class Explore:
     ----------
     json_object : dict, list, or any
         The JSON object to explore. Can be a dictionary, list, or any other type.
+    cache : DerivedCache, optional
+        A cache shared between explorers (and threads) for child key lists,
+        resolved children and field counts. Entries are keyed by
+        ``json_object`` and the path of each explored child below it; call
+        ``cache.invalidate(json_object)`` after modifying it.
 
     Attributes
     ----------
@@ -24,6 +31,8 @@ class Explore:
         The original JSON object being explored.
     child_keys : list
         A list of keys (for dicts) or indices (for lists) of direct children.
+    cache : DerivedCache or None
+        The shared cache, if any.
 
     Examples
     --------
@@ -36,13 +45,59 @@ class Explore:
     >>> print(users_explorer.get_child_keys())
     [0, 1]
     """
-    def __init__(self, json_object):
+    def __init__(self, json_object, cache=None):
+        self._bind(json_object, json_object, (), cache)
+
+    @classmethod
+    def _at(cls, json_object, root, path, cache):
+        """
+        Create an explorer for a value at a path below a cached root.
+
+        Parameters
+        ----------
+        json_object : any
+            The value to explore.
+        root : any
+            The document the cache entries of this explorer are keyed by.
+        path : tuple
+            The path of ``json_object`` below ``root``, as ``(type, key)``
+            pairs so that equal keys of different types stay apart.
+        cache : DerivedCache or None
+            The shared cache.
+
+        Returns
+        -------
+        Explore
+            The new explorer.
+        """
+        explore = cls.__new__(cls)
+        explore._bind(json_object, root, path, cache)
+        return explore
+
+    def _bind(self, json_object, root, path, cache):
+        """
+        Initialize the explorer, taking the child keys from the cache if any.
+
+        Parameters
+        ----------
+        json_object : any
+            The value to explore.
+        root : any
+            The document the cache entries of this explorer are keyed by.
+        path : tuple
+            The path of ``json_object`` below ``root``, as ``(type, key)``
+            pairs so that equal keys of different types stay apart.
+        cache : DerivedCache or None
+            The shared cache.
+        """
         self.data = json_object
-        self.child_keys = []
-        if type(self.data) is dict:
-            self.child_keys = list(self.data.keys())
-        if type(self.data) is list:
-            self.child_keys = [idx for idx in range(len(self.data))]
+        self.cache = cache
+        self._root = root
+        self._path = path
+        if cache is None:
+            self.child_keys = _child_keys(json_object)
+        else:
+            self.child_keys = list(cache.get(root, "keys", path, lambda: tuple(_child_keys(json_object))))
 
     def __repr__(self):
         """
@@ -120,9 +175,15 @@ class Explore:
         >>> print(type(child.data))
         <class 'list'>
         """
-        if child_key in self.child_keys:
-            return Explore(self.data[child_key])
-        return Explore(None)
+        if self.cache is None:
+            if child_key in self.child_keys:
+                return Explore(self.data[child_key])
+            return Explore(None)
+        # Keys are tagged with their type, since 1, 1.0 and True are equal.
+        path = self._path + ((type(child_key), child_key),)
+        value = self.cache.get(self._root, "child", path,
+                               lambda: self.data[child_key] if child_key in self.child_keys else None)
+        return Explore._at(value, self._root, path, self.cache)
     
     def field_counts(self, verbose=False):
         """
@@ -159,7 +220,27 @@ class Explore:
         Notes
         -----
         This method is particularly useful for analyzing collections where
-        objects may have varying schemas or optional properties.
+        objects may have varying schemas or optional properties. With a
+        cache, the counts are computed once per explored value and a copy
+        is returned; verbose calls always recompute.
+        """
+        if self.cache is not None and not verbose:
+            return dict(self.cache.get(self._root, "field_counts", self._path, self._count_fields))
+        return self._count_fields(verbose)
+
+    def _count_fields(self, verbose=False):
+        """
+        Count the field names of the children, as for ``field_counts``.
+
+        Parameters
+        ----------
+        verbose : bool, optional
+            If True, print detailed exploration progress, by default False.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping field names to their occurrence counts.
         """
         if verbose:
             print(f"Exploring grandchildren of type: {type(self.child_keys)} (size={len(self.data)}) with keys: {self.keys()}")
@@ -167,7 +248,9 @@ class Explore:
         for child_key in self.child_keys:
             if verbose:
                 print(f"Exploring child key: {child_key}")
-            expChild = self.child(child_key)
+            # Children are explored without the cache so that counting does
+            # not fill it with one key list per child.
+            expChild = Explore(self.data[child_key])
             if verbose:
                 print(f"  Child type: {type(expChild.data)} with keys: {expChild.keys()}")
             for grandChildKey in expChild.keys():
@@ -178,4 +261,56 @@ class Explore:
                 else:
                     counts[grandChildKey] = 1
             
-        return counts
\ No newline at end of file
+        return counts
+
+    def value_index(self, tokens=False):
+        """
+        Build an inverted index from the scalar values below this object to
+        their paths.
+
+        Parameters
+        ----------
+        tokens : bool, optional
+            If True, also index the word tokens of string values, by default
+            False.
+
+        Returns
+        -------
+        ValueIndex
+            The index, with paths relative to this object.
+
+        Examples
+        --------
+        >>> data = {'users': [{'id': 'u1'}, {'id': 'u2', 'manager': 'u1'}]}
+        >>> index = Explore(data).value_index()
+        >>> index.lookup('u1')
+        [('users', 0, 'id'), ('users', 1, 'manager')]
+
+        Notes
+        -----
+        The index is a snapshot: it does not see later changes to the data.
+        """
+        from .ValueIndex import ValueIndex
+
+        return ValueIndex(self.data, tokens)
+
+
+def _child_keys(json_object):
+    """
+    List the keys or indices of the direct children of a value.
+
+    Parameters
+    ----------
+    json_object : any
+        The value.
+
+    Returns
+    -------
+    list
+        Object keys, array indices, or an empty list for other values.
+    """
+    if type(json_object) in OBJECT_TYPES:
+        return list(json_object.keys())
+    if type(json_object) in ARRAY_TYPES:
+        return list(range(len(json_object)))
+    return []
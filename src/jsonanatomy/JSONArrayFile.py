@@ -0,0 +1,349 @@
+"""
+Random access to the elements of a large top-level JSON array file.
+
+This module provides the JSONArrayFile class, which memory-maps a file whose
+top-level value is a JSON array, indexes the byte offsets of its elements on
+first use and then decodes only the element ranges that are requested.
+"""
+
+import json
+import mmap
+import os
+from array import array
+
+from ._scan import array_spans, skip_whitespace
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+class JSONArrayFile:
+    """
+    Range and batch access to a file containing one large JSON array.
+
+    The file is memory-mapped rather than read, and the first operation that
+    needs element positions performs a single structural scan that records
+    the start and end byte offset of every top-level element. Subsequent
+    reads slice the mapped file at those offsets and decode only the
+    requested elements, so reading elements 1_000_000 to 1_010_000 does not
+    reparse anything before them.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to a JSON file whose top-level value is an array.
+    encoding : str, optional
+        The file encoding used to decode elements, by default "utf-8".
+        Must be ASCII-compatible, since structural characters are located
+        at the byte level.
+
+    Attributes
+    ----------
+    file_path : str
+        The path of the mapped file.
+    encoding : str
+        The encoding used to decode elements.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the specified file does not exist.
+    ValueError
+        If the file is empty or its top-level value is not an array.
+
+    Examples
+    --------
+    >>> with JSONArrayFile('/path/to/events.json') as events:
+    ...     print(len(events))
+    ...     window = events.read_range(1_000_000, 1_010_000)
+    ...     first_name = Maybe(events[0])['name'].value()
+    25000000
+
+    >>> with JSONArrayFile('/path/to/events.json') as events:
+    ...     for batch in events.iter_batches(batch_size=5000):
+    ...         counts = Explore(batch).field_counts()
+    """
+    def __init__(self, file_path, encoding="utf-8"):
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found at {file_path}")
+
+        self.file_path = file_path
+        self.encoding = encoding
+        self._starts = None
+        self._ends = None
+        self._file = open(file_path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"File at {file_path} is empty")
+
+        offset = len(_UTF8_BOM) if self._map[:len(_UTF8_BOM)] == _UTF8_BOM else 0
+        self._array_start = skip_whitespace(self._map, offset)
+        if self._map[self._array_start:self._array_start + 1] != b"[":
+            self.close()
+            raise ValueError(f"File at {file_path} does not contain a top-level JSON array")
+
+    def __repr__(self):
+        """
+        Return a string representation of the JSONArrayFile object.
+
+        Returns
+        -------
+        str
+            A formatted string showing the file path and element count, if
+            the index has been built.
+        """
+        size = len(self._starts) if self._starts is not None else "?"
+        return f"JSONArrayFile({self.file_path!r}[size={size}])"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Release the memory map and the underlying file handle.
+        """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def build_index(self):
+        """
+        Scan the file once and record the byte offsets of every element.
+
+        Called automatically by the first operation that needs element
+        positions; calling it again has no effect.
+
+        Returns
+        -------
+        JSONArrayFile
+            This instance, to allow chaining.
+
+        Raises
+        ------
+        ValueError
+            If the array is not terminated.
+        """
+        if self._starts is None:
+            starts = array("q")
+            ends = array("q")
+            for element_start, element_end in array_spans(self._map, self._array_start):
+                starts.append(element_start)
+                ends.append(element_end)
+            self._starts = starts
+            self._ends = ends
+        return self
+
+    def __len__(self):
+        """
+        Get the number of elements in the array.
+
+        Returns
+        -------
+        int
+            The number of top-level elements.
+        """
+        self.build_index()
+        return len(self._starts)
+
+    def __getitem__(self, key):
+        """
+        Decode a single element or a slice of elements.
+
+        Parameters
+        ----------
+        key : int or slice
+            The element index (negative indices count from the end) or a
+            slice of indices.
+
+        Returns
+        -------
+        any or list
+            The decoded element for an integer key, or a list of decoded
+            elements for a slice.
+
+        Raises
+        ------
+        IndexError
+            If an integer index is out of range.
+
+        Examples
+        --------
+        >>> events = JSONArrayFile('/path/to/events.json')
+        >>> last = events[-1]
+        >>> window = events[100:200]
+        """
+        self.build_index()
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self._starts))
+            if step == 1:
+                return self.read_range(start, stop)
+            return [self._decode_range(i, i + 1)[0] for i in range(start, stop, step)]
+        size = len(self._starts)
+        index = key + size if key < 0 else key
+        if not 0 <= index < size:
+            raise IndexError("JSONArrayFile index out of range")
+        return self._decode_range(index, index + 1)[0]
+
+    def __iter__(self):
+        """
+        Iterate over all elements, decoding them one batch at a time.
+
+        Yields
+        ------
+        any
+            Each decoded element in order.
+        """
+        for batch in self.iter_batches():
+            for element in batch:
+                yield element
+
+    def read_range(self, start, stop):
+        """
+        Decode a contiguous range of elements.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first element to decode.
+        stop : int
+            The index one past the last element to decode. Values beyond the
+            array length are clamped, as with list slicing.
+
+        Returns
+        -------
+        list
+            The decoded elements, or an empty list if the range is empty.
+
+        Examples
+        --------
+        >>> events = JSONArrayFile('/path/to/events.json')
+        >>> window = events.read_range(1_000_000, 1_010_000)
+        >>> print(len(window))
+        10000
+        """
+        self.build_index()
+        size = len(self._starts)
+        start = max(0, start)
+        stop = min(stop, size)
+        if start >= stop:
+            return []
+        return self._decode_range(start, stop)
+
+    def iter_batches(self, batch_size=1000, start=0, stop=None):
+        """
+        Iterate over the elements in decoded batches.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            The maximum number of elements per batch, by default 1000.
+        start : int, optional
+            The index of the first element, by default 0.
+        stop : int, optional
+            The index one past the last element, by default the array length.
+
+        Yields
+        ------
+        list
+            Consecutive batches of decoded elements.
+
+        Raises
+        ------
+        ValueError
+            If ``batch_size`` is not positive.
+
+        Examples
+        --------
+        >>> events = JSONArrayFile('/path/to/events.json')
+        >>> for batch in events.iter_batches(batch_size=10000):
+        ...     process(batch)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        self.build_index()
+        size = len(self._starts)
+        stop = size if stop is None else min(stop, size)
+        for batch_start in range(max(0, start), stop, batch_size):
+            yield self._decode_range(batch_start, min(batch_start + batch_size, stop))
+
+    def filter(self, where):
+        """
+        Decode only the elements that satisfy a declarative predicate.
+
+        Uses the element index, so repeated filtered reads of the same file
+        do not rescan it, and rejects most non-matching elements at the byte
+        level with ``Predicate.prefilter`` before decoding them.
+
+        Parameters
+        ----------
+        where : dict or Predicate
+            The conditions elements must satisfy (see ``Predicate``).
+
+        Returns
+        -------
+        list
+            The matching elements in file order, as
+            ``Maybe(self[:]).filter(Predicate(where)).value()`` would return.
+
+        Examples
+        --------
+        >>> events = JSONArrayFile('/path/to/events.json')
+        >>> errors = events.filter({'level': 'error', 'ts': {'>=': 1735689600}})
+        """
+        from .Predicate import Predicate
+
+        if not isinstance(where, Predicate):
+            where = Predicate(where)
+        self.build_index()
+        buf = self._map
+        results = []
+        for start, end in zip(self._starts, self._ends):
+            if where.prefilter(buf, start, end):
+                element = json.loads(buf[start:end].decode(self.encoding))
+                if where.matches(element):
+                    results.append(element)
+        return results
+
+    def element_span(self, index):
+        """
+        Get the byte span of an element within the file.
+
+        Parameters
+        ----------
+        index : int
+            The element index.
+
+        Returns
+        -------
+        tuple of int
+            ``(start, end)`` byte offsets of the element text, which may
+            include surrounding whitespace.
+        """
+        self.build_index()
+        return (self._starts[index], self._ends[index])
+
+    def _decode_range(self, start, stop):
+        """
+        Decode the elements ``start`` to ``stop - 1`` with one parser call.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first element.
+        stop : int
+            The index one past the last element.
+
+        Returns
+        -------
+        list
+            The decoded elements.
+        """
+        text = self._map[self._starts[start]:self._ends[stop - 1]].decode(self.encoding)
+        return json.loads("[" + text + "]")
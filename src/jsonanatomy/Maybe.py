@@ -7,6 +7,15 @@ pattern for safely accessing nested JSON data without raising exceptions
 when keys or indices don't exist.
 """
 
+import heapq
+
+from ._nodes import OBJECT_TYPES, ARRAY_TYPES
+from ._paths import parse_path, resolve_path
+from .PathExtractor import PathExtractor
+
+_AGGREGATIONS = ("count", "sum", "min", "max", "mean")
+_JOINS = ("inner", "left")
+
 class Maybe:
     """
     A wrapper for safe optional traversal over JSON data structures.
@@ -77,9 +86,9 @@ class Maybe:
         >>> out_of_bounds = maybe_list[5].value()  # None
         """
         if self.data is not None:
-            if type(self.data) is dict and key in self.data:
+            if type(self.data) in OBJECT_TYPES and key in self.data:
                 return Maybe(self.data[key])
-            if type(self.data) is list and isinstance(key, int) and 0 <= key < len(self.data):
+            if type(self.data) in ARRAY_TYPES and isinstance(key, int) and 0 <= key < len(self.data):
                 return Maybe(self.data[key])
         return Maybe(None)
         
@@ -103,7 +112,7 @@ class Maybe:
         >>> name = maybe.field('name').value()  # 'Alice'
         >>> age = maybe.field('age').value()    # None
         """
-        if self.data is not None and type(self.data) is dict and field in self.data:
+        if self.data is not None and type(self.data) in OBJECT_TYPES and field in self.data:
             return Maybe(self.data[field])
         return Maybe(None)
     
@@ -127,7 +136,7 @@ class Maybe:
         >>> first = maybe.index(0).value()  # 1
         >>> fourth = maybe.index(3).value()  # None
         """
-        if self.data is not None and type(self.data) is list and index < len(self.data):
+        if self.data is not None and type(self.data) in ARRAY_TYPES and index < len(self.data):
             return Maybe(self.data[index])
         return Maybe(None)
 
@@ -167,9 +176,9 @@ class Maybe:
         >>> not_array = Maybe(42).array()  # []
         """
         if self.data is not None:
-            if type(self.data) is dict:
+            if type(self.data) in OBJECT_TYPES:
                 return as_type([func(key, obj) for key,obj in self.data.items() if filter(key, obj)])
-            elif type(self.data) is list:
+            elif type(self.data) in ARRAY_TYPES:
                 return as_type([func(idx, obj) for idx,obj in enumerate(self.data) if filter(idx, obj)])
         return []
     
@@ -197,12 +206,289 @@ class Maybe:
         >>> filtered = maybe_list.filter(lambda i,v: v % 2 == 0).value()  # [2, 4]
         """
         if self.data is not None:
-            if type(self.data) is dict:
+            if type(self.data) in OBJECT_TYPES:
                 return Maybe({k: v for k,v in self.data.items() if func(k,v)})
-            elif type(self.data) is list:
+            elif type(self.data) in ARRAY_TYPES:
                 return Maybe([obj for idx,obj in enumerate(self.data) if func(idx, obj)])
         return Maybe(None)
 
+    def group_by(self, key, aggregations=None):
+        """
+        Group the records of a collection by the value at a path.
+
+        Each record is visited once and its key and aggregated fields are
+        read in a single traversal. Records whose key is missing are grouped
+        under None.
+
+        Parameters
+        ----------
+        key : str, int or tuple
+            The path of the grouping value (a dotted string or a tuple of
+            keys). Values of different types stay in separate groups even
+            when they compare equal (``1``, ``1.0`` and ``True``). Object and
+            array values are grouped under a hashable form: a frozenset of
+            their items, or a tuple starting with ``"array"``.
+        aggregations : dict, optional
+            A mapping of output name to ``"count"`` or to an ``(operation,
+            path)`` tuple, where operation is one of ``"count"``, ``"sum"``,
+            ``"min"``, ``"max"`` and ``"mean"``. Missing (None) values are
+            ignored by every operation but a plain ``"count"``; ``"sum"``
+            and ``"mean"`` also ignore values that are not numbers, and
+            ``"min"`` and ``"max"`` those that are neither numbers nor
+            strings, with numbers taking precedence over strings in a group
+            that mixes both. By default each group maps to the list of its
+            records.
+
+        Returns
+        -------
+        Maybe
+            A new Maybe wrapping a dict of group value to the aggregation
+            results (or list of records), or None if not applicable.
+
+        Raises
+        ------
+        ValueError
+            If an aggregation is not recognised, or if group values of
+            different types are equal (such as ``1`` and ``True``) and so
+            cannot both be keys of the result.
+
+        Examples
+        --------
+        >>> orders = Maybe([{'cust': 'a', 'total': 10}, {'cust': 'b', 'total': 5},
+        ...                 {'cust': 'a', 'total': 20}, {'cust': 'a'}])
+        >>> orders.group_by('cust', {'n': 'count', 'spent': ('sum', 'total'),
+        ...                          'avg': ('mean', 'total')}).value()
+        {'a': {'n': 3, 'spent': 30, 'avg': 15.0}, 'b': {'n': 1, 'spent': 5, 'avg': 5.0}}
+
+        >>> orders.group_by('cust').value()['b']
+        [{'cust': 'b', 'total': 5}]
+        """
+        records = self._records()
+        if records is None:
+            return Maybe(None)
+        if aggregations is None:
+            key_path = parse_path(key)
+            groups = {}
+            for record in records:
+                value = resolve_path(record, key_path)
+                group = _freeze(value)
+                entry = groups.get(group)
+                if entry is None:
+                    groups[group] = (value, [record])
+                else:
+                    entry[1].append(record)
+            return Maybe(_by_group_value(groups.values()))
+        return Maybe(_aggregate(records, key, aggregations))
+
+    def aggregate(self, aggregations):
+        """
+        Aggregate fields over all records of a collection in a single pass.
+
+        Parameters
+        ----------
+        aggregations : dict
+            The aggregations, as for ``group_by``.
+
+        Returns
+        -------
+        Maybe
+            A new Maybe wrapping a dict of output name to result, or None if
+            not applicable.
+
+        Raises
+        ------
+        ValueError
+            If an aggregation is not recognised.
+
+        Examples
+        --------
+        >>> Maybe([{'qty': 2}, {'qty': 5}, {}]).aggregate(
+        ...     {'rows': 'count', 'with_qty': ('count', 'qty'), 'most': ('max', 'qty')}).value()
+        {'rows': 3, 'with_qty': 2, 'most': 5}
+        """
+        records = self._records()
+        if records is None:
+            return Maybe(None)
+        return Maybe(_aggregate(records, None, aggregations)[None])
+
+    def join(self, other, on, other_on=None, how="inner"):
+        """
+        Hash-join the records of this collection with another collection.
+
+        The other collection is loaded into a hash table keyed by
+        ``other_on``, and this collection is then scanned once, so the cost
+        is linear in the size of both sides; pass the smaller collection as
+        ``other``. Records with a missing (None) key never match; keys match
+        equal values of the same type (``1`` does not match ``True`` or
+        ``1.0``), including equal objects and arrays.
+
+        Parameters
+        ----------
+        other : list, dict or Maybe
+            The collection to join with (a dict is joined on its values).
+        on : str, int or tuple
+            The path of the join key in this collection's records.
+        other_on : str, int or tuple, optional
+            The path of the join key in ``other``'s records, by default
+            ``on``.
+        how : str, optional
+            ``"inner"`` to keep only matched records, or ``"left"`` to also
+            keep unmatched records of this collection, by default
+            ``"inner"``.
+
+        Returns
+        -------
+        Maybe
+            A new Maybe wrapping a list with one merged dict per matching
+            pair, in this collection's order, where fields of ``other`` win
+            over fields of the same name; or None if not applicable. Records
+            that are not objects are skipped.
+
+        Raises
+        ------
+        ValueError
+            If ``how`` is not supported.
+
+        Examples
+        --------
+        >>> orders = Maybe([{'id': 1, 'customer_id': 'a'}, {'id': 2, 'customer_id': 'z'}])
+        >>> customers = [{'customer_id': 'a', 'name': 'Alice'}]
+        >>> orders.join(customers, 'customer_id').value()
+        [{'id': 1, 'customer_id': 'a', 'name': 'Alice'}]
+        >>> len(orders.join(customers, 'customer_id', how='left').value())
+        2
+        """
+        if how not in _JOINS:
+            raise ValueError(f"Unknown join {how!r}; expected one of {_JOINS}")
+        records = self._records()
+        other_records = (other if isinstance(other, Maybe) else Maybe(other))._records()
+        if records is None or other_records is None:
+            return Maybe(None)
+        left_path = parse_path(on)
+        right_path = left_path if other_on is None else parse_path(other_on)
+
+        table = {}
+        for record in other_records:
+            if type(record) in OBJECT_TYPES:
+                join_key = resolve_path(record, right_path)
+                if join_key is not None:
+                    table.setdefault(_freeze(join_key), []).append(record)
+
+        joined = []
+        for record in records:
+            if type(record) not in OBJECT_TYPES:
+                continue
+            join_key = resolve_path(record, left_path)
+            matches = table.get(_freeze(join_key)) if join_key is not None else None
+            if matches:
+                for match in matches:
+                    merged = dict(record.items())
+                    merged.update(match.items())
+                    joined.append(merged)
+            elif how == "left":
+                joined.append(dict(record.items()))
+        return Maybe(joined)
+
+    def distinct(self, key=None):
+        """
+        Remove duplicate records from a collection, keeping the first.
+
+        Parameters
+        ----------
+        key : str, int or tuple, optional
+            The path whose value identifies a record (records missing it
+            share the None value). By default whole records are compared.
+            Values of different types are distinct, even when they compare
+            equal (``1``, ``1.0`` and ``True``).
+
+        Returns
+        -------
+        Maybe
+            A new Maybe wrapping the list of distinct records in their
+            original order, or None if not applicable.
+
+        Examples
+        --------
+        >>> Maybe([1, 2, 1, 3, 2]).distinct().value()
+        [1, 2, 3]
+        >>> Maybe([{'id': 1, 'v': 'a'}, {'id': 1, 'v': 'b'}]).distinct('id').value()
+        [{'id': 1, 'v': 'a'}]
+        """
+        records = self._records()
+        if records is None:
+            return Maybe(None)
+        key_path = None if key is None else parse_path(key)
+        seen = set()
+        unique = []
+        for record in records:
+            identity = _freeze(record if key_path is None else resolve_path(record, key_path))
+            if identity not in seen:
+                seen.add(identity)
+                unique.append(record)
+        return Maybe(unique)
+
+    def top_k(self, k, key, largest=True):
+        """
+        Select the ``k`` records with the largest (or smallest) value at a path.
+
+        Uses a bounded heap, so only ``k`` records are held while the
+        collection is scanned. Numbers and strings are ranked; records whose
+        value is missing or of another type (booleans, objects, arrays, NaN)
+        are skipped. When a collection mixes numbers and strings, records
+        with numbers are selected first.
+
+        Parameters
+        ----------
+        k : int
+            The number of records to select.
+        key : str, int or tuple
+            The path of the ranking value.
+        largest : bool, optional
+            If True, select the largest values, otherwise the smallest, by
+            default True.
+
+        Returns
+        -------
+        Maybe
+            A new Maybe wrapping the selected records, best first (ties keep
+            their original order), or None if not applicable.
+
+        Examples
+        --------
+        >>> scores = Maybe([{'n': 'a', 's': 3}, {'n': 'b', 's': 9}, {'n': 'c'}, {'n': 'd', 's': 5}])
+        >>> [r['n'] for r in scores.top_k(2, 's').value()]
+        ['b', 'd']
+        """
+        records = self._records()
+        if records is None:
+            return Maybe(None)
+        key_path = parse_path(key)
+        ranked = (
+            (rank, record)
+            for record in records
+            for rank in (_rank_key(resolve_path(record, key_path), largest),)
+            if rank is not None
+        )
+        select = heapq.nlargest if largest else heapq.nsmallest
+        return Maybe([record for _, record in select(k, ranked, key=_rank)])
+
+    def _records(self):
+        """
+        Get the members of the wrapped collection.
+
+        Returns
+        -------
+        iterable or None
+            The elements of an array or the values of an object, or None if
+            the wrapped value is not a collection.
+        """
+        data_type = type(self.data)
+        if data_type in ARRAY_TYPES:
+            return self.data
+        if data_type in OBJECT_TYPES:
+            return self.data.values()
+        return None
+
     def value(self):
         """
         Get the wrapped value.
@@ -222,5 +508,218 @@ class Maybe:
         >>> data = empty.value()  # None
         """
         return self.data
-    
-    
\ No newline at end of file
+
+
+def _rank(pair):
+    """
+    Get the ranking value of a ``(value, record)`` pair for ``top_k``.
+    """
+    return pair[0]
+
+
+def _rank_key(value, largest):
+    """
+    Get a sort key that orders numbers and strings without comparing them.
+
+    Parameters
+    ----------
+    value : any
+        A JSON value.
+    largest : bool
+        Whether the largest keys are selected. Numbers are placed in the
+        bucket that is selected first, so they take precedence over strings
+        either way.
+
+    Returns
+    -------
+    tuple or None
+        ``(bucket, value)`` for numbers and strings, or None for values that
+        are not ranked: None, booleans, objects, arrays and NaN.
+    """
+    value_type = type(value)
+    if value_type is int or value_type is float:
+        if value != value:
+            return None
+        return (1 if largest else 0, value)
+    if value_type is str:
+        return (0 if largest else 1, value)
+    return None
+
+
+def _freeze(value):
+    """
+    Convert a value into a hashable, type-tagged identity.
+
+    Parameters
+    ----------
+    value : any
+        A JSON value.
+
+    Returns
+    -------
+    tuple
+        ``(type, value)`` for scalars, so that equal values of different
+        types (``1``, ``1.0`` and ``True``) are kept apart, and nested
+        tagged tuples and frozensets for arrays and objects.
+    """
+    value_type = type(value)
+    if value_type in OBJECT_TYPES:
+        return (dict, frozenset((key, _freeze(child)) for key, child in value.items()))
+    if value_type in ARRAY_TYPES:
+        return (list,) + tuple(_freeze(child) for child in value)
+    return (value_type, value)
+
+
+def _hashable(value):
+    """
+    Convert a value into the hashable form used as a group key.
+
+    Parameters
+    ----------
+    value : any
+        A JSON value.
+
+    Returns
+    -------
+    any
+        The value itself for scalars, or nested tuples and frozensets for
+        arrays and objects.
+    """
+    value_type = type(value)
+    if value_type in OBJECT_TYPES:
+        return frozenset((key, _hashable(child)) for key, child in value.items())
+    if value_type in ARRAY_TYPES:
+        return ("array",) + tuple(_hashable(child) for child in value)
+    return value
+
+
+def _by_group_value(groups):
+    """
+    Key group results by their group values.
+
+    Parameters
+    ----------
+    groups : iterable of tuple
+        ``(value, result)`` for each group, whose values have distinct
+        types or compare unequal.
+
+    Returns
+    -------
+    dict
+        A mapping of the hashable form of each value to its result.
+
+    Raises
+    ------
+    ValueError
+        If two group values of different types are equal, such as ``1``
+        and ``True``, which a dict cannot hold as separate keys.
+    """
+    results = {}
+    seen = {}
+    for value, result in groups:
+        key = _hashable(value)
+        if key in seen:
+            raise ValueError(
+                f"Group values {seen[key]!r} and {value!r} are equal but of different types and "
+                f"cannot be separate keys; convert them to one type first"
+            )
+        seen[key] = value
+        results[key] = result
+    return results
+
+
+def _aggregate(records, key, aggregations):
+    """
+    Compute aggregations per group in a single pass over the records.
+
+    Parameters
+    ----------
+    records : iterable
+        The records.
+    key : str, int, tuple or None
+        The grouping path, or None to aggregate all records as one None
+        group, which is present even if there are no records.
+    aggregations : dict
+        The aggregations, as for ``Maybe.group_by``.
+
+    Returns
+    -------
+    dict
+        A mapping of group value to a dict of output name to result.
+
+    Raises
+    ------
+    ValueError
+        If an aggregation is not recognised, or as for ``_by_group_value``.
+    """
+    names = []
+    operations = []
+    paths = [() if key is None else parse_path(key)]
+    for name, spec in aggregations.items():
+        if isinstance(spec, str):
+            operation, path = spec, None
+        else:
+            operation, path = spec
+        if operation not in _AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation {operation!r}; expected one of {_AGGREGATIONS}")
+        if path is None and operation != "count":
+            raise ValueError(f"Aggregation {operation!r} for {name!r} requires a path")
+        slot = None
+        if path is not None:
+            slot = len(paths)
+            paths.append(path)
+        names.append(name)
+        operations.append((operation, slot))
+
+    extractor = PathExtractor(paths)
+    # Each group holds one [count, accumulator] pair per aggregation.
+    groups = {}
+    group_values = {}
+    if key is None:
+        groups[None] = [[0, None] for _ in operations]
+        group_values[None] = None
+    for record in records:
+        values = extractor.extract(record)
+        group = None if key is None else _freeze(values[0])
+        states = groups.get(group)
+        if states is None:
+            states = groups[group] = [[0, None] for _ in operations]
+            group_values[group] = values[0]
+        for state, (operation, slot) in zip(states, operations):
+            if slot is None:
+                state[0] += 1
+                continue
+            value = values[slot]
+            if value is None:
+                continue
+            current = state[1]
+            if operation == "count":
+                state[0] += 1
+            elif operation == "sum" or operation == "mean":
+                value_type = type(value)
+                if value_type is int or value_type is float:
+                    state[0] += 1
+                    state[1] = value if current is None else current + value
+            else:
+                # Min and max keep the rank key of their best value.
+                largest = operation == "max"
+                rank = _rank_key(value, largest)
+                if rank is not None and (
+                    current is None or (rank > current if largest else rank < current)
+                ):
+                    state[1] = rank
+
+    results = []
+    for group, states in groups.items():
+        result = {}
+        for name, (operation, _), (count, accumulator) in zip(names, operations, states):
+            if operation == "count":
+                result[name] = count
+            elif operation == "sum":
+                result[name] = 0 if accumulator is None else accumulator
+            elif operation == "mean":
+                result[name] = accumulator / count if count else None
+            else:
+                result[name] = None if accumulator is None else accumulator[1]
+        results.append((group_values[group], result))
+    return _by_group_value(results)
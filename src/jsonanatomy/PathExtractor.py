@@ -0,0 +1,199 @@
+"""
+Single-pass extraction of many paths from JSON records.
+
+This module provides the PathExtractor class, which merges a set of paths
+into a prefix tree and evaluates all of them with one traversal per record,
+instead of walking shared prefixes once per field as separate ``Maybe``
+chains do.
+"""
+
+from ._nodes import OBJECT_TYPES, ARRAY_TYPES
+from ._paths import array_index, parse_path
+
+_MISSING = object()
+
+
+class PathExtractor:
+    """
+    Extract many fields from records in a single traversal per record.
+
+    The paths are merged into a prefix tree when the extractor is created,
+    so a shared prefix such as ``order.customer`` is resolved once per
+    record no matter how many fields are read below it, and no wrapper
+    objects are created along the way. Missing steps follow the ``Maybe``
+    semantics and produce the default value instead of raising.
+
+    Parameters
+    ----------
+    paths : list or dict
+        The paths to extract, as dotted strings (``"a.b.0.c"``) or tuples of
+        keys. If a list is given, ``extract`` returns a tuple in the same
+        order; if a dict mapping output names to paths is given, ``extract``
+        returns a dict keyed by those names.
+    default : any, optional
+        The value used for paths that do not resolve, by default None.
+
+    Attributes
+    ----------
+    paths : list of tuple
+        The parsed paths, in output order.
+    names : list or None
+        The output names when ``paths`` was a dict, None otherwise.
+    default : any
+        The value used for missing paths.
+
+    Examples
+    --------
+    >>> record = {'id': 7, 'user': {'name': 'Alice', 'tags': ['a', 'b']}}
+    >>> extractor = PathExtractor(['id', 'user.name', 'user.tags.1', 'user.email'])
+    >>> extractor.extract(record)
+    (7, 'Alice', 'b', None)
+
+    >>> extractor = PathExtractor({'name': 'user.name', 'first_tag': ('user', 'tags', 0)})
+    >>> extractor.extract_many([record, {}])
+    [{'name': 'Alice', 'first_tag': 'a'}, {'name': None, 'first_tag': None}]
+    """
+    def __init__(self, paths, default=None):
+        if isinstance(paths, dict):
+            self.names = list(paths.keys())
+            specs = list(paths.values())
+        else:
+            self.names = None
+            specs = list(paths)
+        self.paths = [parse_path(spec) for spec in specs]
+        self.default = default
+        self._root_slots, self._root_children = self._build_tree(self.paths)
+
+    def __repr__(self):
+        """
+        Return a string representation of the PathExtractor object.
+
+        Returns
+        -------
+        str
+            A formatted string showing the number of extracted paths.
+        """
+        return f"PathExtractor([paths={len(self.paths)}])"
+
+    @staticmethod
+    def _build_tree(paths):
+        """
+        Merge paths into a compiled prefix tree.
+
+        Parameters
+        ----------
+        paths : list of tuple
+            The parsed paths.
+
+        Returns
+        -------
+        tuple
+            ``(root_slots, root_children)`` where ``root_slots`` lists the
+            output positions of empty paths and each child entry is a tuple
+            ``(key, index, slots, children)``.
+        """
+        root = ([], {})
+        for slot, path in enumerate(paths):
+            node = root
+            for key in path:
+                node = node[1].setdefault(key, ([], {}))
+            node[0].append(slot)
+
+        def compile_children(children):
+            return tuple(
+                (key, array_index(key), tuple(slots), compile_children(grandchildren))
+                for key, (slots, grandchildren) in children.items()
+            )
+
+        return tuple(root[0]), compile_children(root[1])
+
+    def extract(self, record):
+        """
+        Extract all paths from one record.
+
+        Parameters
+        ----------
+        record : any
+            The record to read, typically a dict.
+
+        Returns
+        -------
+        tuple or dict
+            The extracted values in path order, or keyed by output name if
+            the extractor was created from a dict.
+
+        Examples
+        --------
+        >>> PathExtractor(['a.b', 'a.c']).extract({'a': {'b': 1}})
+        (1, None)
+        """
+        out = [self.default] * len(self.paths)
+        for slot in self._root_slots:
+            out[slot] = record
+        if self._root_children:
+            _evaluate(self._root_children, record, out)
+        if self.names is not None:
+            return dict(zip(self.names, out))
+        return tuple(out)
+
+    def extract_many(self, records):
+        """
+        Extract all paths from each record of a collection.
+
+        Parameters
+        ----------
+        records : iterable
+            The records to read, for example a list loaded with
+            ``read_json_file`` or a ``JSONArrayFile``.
+
+        Returns
+        -------
+        list
+            One tuple (or dict) per record, in input order.
+
+        Examples
+        --------
+        >>> PathExtractor(['id']).extract_many([{'id': 1}, {'id': 2}])
+        [(1,), (2,)]
+        """
+        extract = self.extract
+        return [extract(record) for record in records]
+
+
+def _evaluate(children, value, out):
+    """
+    Resolve the children of a prefix tree node against a value.
+
+    Parameters
+    ----------
+    children : tuple
+        Compiled child entries ``(key, index, slots, grandchildren)``.
+    value : any
+        The value reached at the parent node.
+    out : list
+        The output slots, filled in place for every resolved path.
+    """
+    value_type = type(value)
+    if value_type in OBJECT_TYPES:
+        get = value.get
+        for key, index, slots, grandchildren in children:
+            try:
+                child = get(key, _MISSING)
+            except TypeError:
+                continue
+            if child is _MISSING:
+                continue
+            for slot in slots:
+                out[slot] = child
+            if grandchildren:
+                _evaluate(grandchildren, child, out)
+    elif value_type in ARRAY_TYPES:
+        size = len(value)
+        for key, index, slots, grandchildren in children:
+            if index is None or index >= size:
+                continue
+            child = value[index]
+            for slot in slots:
+                out[slot] = child
+            if grandchildren:
+                _evaluate(grandchildren, child, out)
@@ -0,0 +1,677 @@
+"""
+Read-only JSON documents published in shared memory.
+
+This module provides the SharedDocument class, which encodes a loaded
+document once into a compact binary form inside a
+``multiprocessing.shared_memory`` segment. Worker processes attach to the
+segment by name and navigate it through read-only proxies that decode only
+the values they touch, so fanning out analysis of one large document to a
+process pool no longer pickles a full copy for every worker.
+
+The encoding is a sequence of tagged nodes. Containers store a table of
+absolute child offsets, so an element or member is reached without reading
+its siblings, and object keys and short strings are written once and
+referenced from every place they occur.
+"""
+
+import struct
+import threading
+from collections.abc import Mapping, Sequence
+
+from ._nodes import ARRAY_TYPES, OBJECT_TYPES, register_array_type, register_object_type
+
+_MAGIC = b"JAD\x01"
+_HEADER = struct.Struct("<4sIQQ")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+_NULL = ord("N")
+_TRUE = ord("T")
+_FALSE = ord("F")
+_INT = ord("i")
+_BIG_INT = ord("I")
+_FLOAT = ord("f")
+_STRING = ord("s")
+_ARRAY = ord("a")
+_OBJECT = ord("o")
+
+_SHARED_STRING_LENGTH = 64
+_OFFSET_CODES = {4: "I", 8: "Q"}
+_ATTACH_LOCK = threading.Lock()
+
+
+def _import_shared_memory():
+    """
+    Import ``multiprocessing.shared_memory``, which requires Python 3.8.
+
+    Returns
+    -------
+    module
+        The shared_memory module.
+
+    Raises
+    ------
+    ImportError
+        If the running Python does not provide shared memory.
+    """
+    try:
+        from multiprocessing import shared_memory
+    except ImportError as error:
+        raise ImportError("SharedDocument requires Python 3.8 or later (multiprocessing.shared_memory)") from error
+    return shared_memory
+
+
+def _attach_untracked(shared_memory, name):
+    """
+    Attach to a segment without registering it with the resource tracker.
+
+    Before Python 3.13, attaching registers the segment with the resource
+    tracker, which unlinks it when the attaching process exits even though
+    the publisher still owns it. Unregistering afterwards is not enough, as
+    pool workers may share the publisher's tracker and would remove its
+    registration instead, so the registration of this one name is skipped.
+
+    Parameters
+    ----------
+    shared_memory : module
+        The ``multiprocessing.shared_memory`` module.
+    name : str
+        The segment name.
+
+    Returns
+    -------
+    multiprocessing.shared_memory.SharedMemory
+        The attached segment.
+    """
+    from multiprocessing import resource_tracker
+
+    target = name.lstrip("/")
+    with _ATTACH_LOCK:
+        register = resource_tracker.register
+
+        def register_others(resource_name, resource_type):
+            if resource_type != "shared_memory" or resource_name.lstrip("/") != target:
+                register(resource_name, resource_type)
+
+        resource_tracker.register = register_others
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+class SharedDocument:
+    """
+    A JSON document published once in shared memory for many processes.
+
+    ``publish`` encodes the document into a new shared memory segment.
+    Pickling a SharedDocument - for example by passing it as an argument to
+    a ``multiprocessing.Pool`` or ``ProcessPoolExecutor`` task - only
+    transfers the segment name, and the receiving process attaches to the
+    existing segment instead of unpickling a copy of the data. ``root``
+    gives read-only proxies that ``Maybe``, ``Explore`` and ``Xplore``
+    navigate like ``dict`` and ``list`` values.
+
+    The publishing process owns the segment: it must keep the SharedDocument
+    open while workers use it and call ``unlink`` (or leave a ``with``
+    block) once they are done. Proxies must not be used after their document
+    is closed.
+
+    Parameters
+    ----------
+    shm : multiprocessing.shared_memory.SharedMemory
+        The attached segment. Use ``publish`` or ``attach`` rather than
+        calling the constructor directly.
+    owner : bool, optional
+        Whether this instance created the segment and unlinks it on exit,
+        by default False.
+
+    Attributes
+    ----------
+    name : str
+        The name of the shared memory segment.
+    size : int
+        The number of bytes used by the encoded document.
+
+    Raises
+    ------
+    ValueError
+        If the segment does not contain an encoded document.
+
+    Examples
+    --------
+    >>> with SharedDocument.publish(read_json_file('/path/to/big.json')) as doc:
+    ...     with ProcessPoolExecutor(8) as pool:
+    ...         totals = list(pool.map(summarize, [doc] * 8, range(8)))
+
+    >>> def summarize(doc, part):
+    ...     return Xplore(doc.root)['orders'][part]['total'].value()
+    """
+    def __init__(self, shm, owner=False):
+        self._shm = shm
+        self._owner = owner
+        self._buf = shm.buf
+        magic, width, root, size = _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC or width not in _OFFSET_CODES:
+            raise ValueError(f"Shared memory segment {shm.name!r} does not contain a SharedDocument")
+        self.name = shm.name
+        self.size = size
+        self._width = width
+        self._offset_code = _OFFSET_CODES[width]
+        self._offset = struct.Struct("<" + self._offset_code)
+        self._root_offset = root
+        self._keys = {}
+        self._root = None
+
+    @classmethod
+    def publish(cls, data, name=None):
+        """
+        Encode a document into a new shared memory segment.
+
+        Parameters
+        ----------
+        data : any
+            The document: dicts with string keys, lists or tuples, strings,
+            numbers, booleans and None, including registered container
+            proxies such as lazily loaded documents.
+        name : str, optional
+            The segment name, by default a unique name chosen by the system.
+
+        Returns
+        -------
+        SharedDocument
+            The owning document.
+
+        Raises
+        ------
+        TypeError
+            If the document contains a value that is not JSON compatible.
+        ImportError
+            If shared memory is not available (Python 3.7).
+
+        Examples
+        --------
+        >>> doc = SharedDocument.publish({'users': [{'name': 'Alice'}]})
+        >>> doc.root['users'][0]['name']
+        'Alice'
+        >>> doc.unlink()
+        """
+        shared_memory = _import_shared_memory()
+        try:
+            encoded = _encode(data, 4)
+        except OverflowError:
+            encoded = _encode(data, 8)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=len(encoded))
+        try:
+            shm.buf[:len(encoded)] = encoded
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Attach to a document published by another process.
+
+        The attaching process does not take ownership: the segment is not
+        removed when it exits.
+
+        Parameters
+        ----------
+        name : str
+            The segment name, as given by the publisher's ``name``.
+
+        Returns
+        -------
+        SharedDocument
+            A read-only view of the document.
+
+        Raises
+        ------
+        FileNotFoundError
+            If no segment with that name exists.
+        """
+        shared_memory = _import_shared_memory()
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            shm = _attach_untracked(shared_memory, name)
+        return cls(shm)
+
+    def __reduce__(self):
+        return (SharedDocument.attach, (self.name,))
+
+    def __repr__(self):
+        """
+        Return a string representation of the SharedDocument object.
+
+        Returns
+        -------
+        str
+            A formatted string showing the segment name and encoded size.
+        """
+        return f"SharedDocument({self.name!r}[size={self.size}])"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+    @property
+    def root(self):
+        """
+        The document's top-level value.
+
+        Returns
+        -------
+        SharedObject, SharedArray or any
+            A proxy for a top-level object or array, or the scalar value.
+        """
+        if self._root is None:
+            self._root = self._decode(self._root_offset)
+        return self._root
+
+    def materialize(self):
+        """
+        Decode the whole document into plain Python objects.
+
+        Returns
+        -------
+        any
+            The document as ``dict``, ``list`` and scalar values.
+        """
+        return _materialize(self, self._root_offset)
+
+    def close(self):
+        """
+        Detach this process from the segment.
+
+        The segment itself stays available to other processes.
+        """
+        if self._shm is not None:
+            self._root = None
+            self._keys = None
+            self._buf = None
+            self._shm.close()
+            self._shm = None
+
+    def unlink(self):
+        """
+        Close the document and remove the segment.
+
+        Only the publishing process should call this, once every worker is
+        done with the document.
+        """
+        shm = self._shm
+        self.close()
+        if shm is not None:
+            shm.unlink()
+
+    def _decode(self, offset):
+        """
+        Decode the node at an offset, wrapping containers in proxies.
+
+        Parameters
+        ----------
+        offset : int
+            The node offset.
+
+        Returns
+        -------
+        SharedObject, SharedArray or any
+            A proxy for containers, or the decoded scalar value.
+        """
+        buf = self._buf
+        tag = buf[offset]
+        if tag == _OBJECT:
+            return SharedObject(self, offset)
+        if tag == _ARRAY:
+            return SharedArray(self, offset)
+        if tag == _STRING:
+            length = _U32.unpack_from(buf, offset + 1)[0]
+            return str(buf[offset + 5:offset + 5 + length], "utf-8")
+        if tag == _INT:
+            return _I64.unpack_from(buf, offset + 1)[0]
+        if tag == _FLOAT:
+            return _F64.unpack_from(buf, offset + 1)[0]
+        if tag == _NULL:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _BIG_INT:
+            length = _U32.unpack_from(buf, offset + 1)[0]
+            return int(str(buf[offset + 5:offset + 5 + length], "ascii"))
+        raise ValueError(f"Corrupt SharedDocument node at offset {offset}")
+
+    def _key(self, offset):
+        """
+        Decode an object key, caching it since keys are shared.
+
+        Parameters
+        ----------
+        offset : int
+            The offset of the key's string node.
+
+        Returns
+        -------
+        str
+            The key.
+        """
+        keys = self._keys
+        key = keys.get(offset)
+        if key is None:
+            key = keys[offset] = self._decode(offset)
+        return key
+
+
+@register_object_type
+class SharedObject(Mapping):
+    """
+    A read-only mapping over an object of a SharedDocument.
+
+    The key index is built on first use by reading the object's key table;
+    values are decoded when they are read and then cached.
+
+    Parameters
+    ----------
+    doc : SharedDocument
+        The document the object belongs to.
+    offset : int
+        The offset of the object's node.
+    """
+    __slots__ = ("_doc", "_offset", "_members", "_cache")
+
+    def __init__(self, doc, offset):
+        self._doc = doc
+        self._offset = offset
+        self._members = None
+        self._cache = {}
+
+    def __repr__(self):
+        """
+        Return a string representation of the SharedObject.
+
+        Returns
+        -------
+        str
+            A formatted string showing the number of members.
+        """
+        return f"SharedObject[size={len(self)}]"
+
+    def _index(self):
+        """
+        Get the mapping of keys to value offsets, building it on first use.
+
+        Returns
+        -------
+        dict
+            A mapping of key to value node offset.
+        """
+        if self._members is None:
+            doc = self._doc
+            buf = doc._buf
+            count = _U32.unpack_from(buf, self._offset + 1)[0]
+            offsets = struct.unpack_from(f"<{2 * count}{doc._offset_code}", buf, self._offset + 5)
+            key = doc._key
+            self._members = {key(offsets[i]): offsets[count + i] for i in range(count)}
+        return self._members
+
+    def __getitem__(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        value = self._doc._decode(self._index()[key])
+        self._cache[key] = value
+        return value
+
+    def __contains__(self, key):
+        return key in self._index()
+
+    def __iter__(self):
+        return iter(self._index())
+
+    def __len__(self):
+        return _U32.unpack_from(self._doc._buf, self._offset + 1)[0]
+
+    def materialize(self):
+        """
+        Decode the whole object into a plain dictionary.
+
+        Returns
+        -------
+        dict
+            The object with all nested values decoded.
+        """
+        return _materialize(self._doc, self._offset)
+
+
+@register_array_type
+class SharedArray(Sequence):
+    """
+    A read-only sequence over an array of a SharedDocument.
+
+    Elements are located through the array's offset table, so reading one
+    element does not touch the others; decoded elements are cached.
+
+    Parameters
+    ----------
+    doc : SharedDocument
+        The document the array belongs to.
+    offset : int
+        The offset of the array's node.
+    """
+    __slots__ = ("_doc", "_offset", "_size", "_cache")
+
+    def __init__(self, doc, offset):
+        self._doc = doc
+        self._offset = offset
+        self._size = _U32.unpack_from(doc._buf, offset + 1)[0]
+        self._cache = {}
+
+    def __repr__(self):
+        """
+        Return a string representation of the SharedArray.
+
+        Returns
+        -------
+        str
+            A formatted string showing the number of elements.
+        """
+        return f"SharedArray[size={self._size}]"
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        position = index + self._size if index < 0 else index
+        if not 0 <= position < self._size:
+            raise IndexError("SharedArray index out of range")
+        try:
+            return self._cache[position]
+        except KeyError:
+            pass
+        doc = self._doc
+        child = doc._offset.unpack_from(doc._buf, self._offset + 5 + doc._width * position)[0]
+        value = doc._decode(child)
+        self._cache[position] = value
+        return value
+
+    def __iter__(self):
+        for position in range(self._size):
+            yield self[position]
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, SharedArray)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def materialize(self):
+        """
+        Decode the whole array into a plain list.
+
+        Returns
+        -------
+        list
+            The array with all nested values decoded.
+        """
+        return _materialize(self._doc, self._offset)
+
+
+def _materialize(doc, offset):
+    """
+    Decode a node and everything below it into plain Python objects.
+
+    Parameters
+    ----------
+    doc : SharedDocument
+        The document.
+    offset : int
+        The node offset.
+
+    Returns
+    -------
+    any
+        The decoded value.
+    """
+    buf = doc._buf
+    tag = buf[offset]
+    if tag == _OBJECT:
+        count = _U32.unpack_from(buf, offset + 1)[0]
+        offsets = struct.unpack_from(f"<{2 * count}{doc._offset_code}", buf, offset + 5)
+        return {doc._key(offsets[i]): _materialize(doc, offsets[count + i]) for i in range(count)}
+    if tag == _ARRAY:
+        count = _U32.unpack_from(buf, offset + 1)[0]
+        children = struct.unpack_from(f"<{count}{doc._offset_code}", buf, offset + 5)
+        return [_materialize(doc, child) for child in children]
+    return doc._decode(offset)
+
+
+def _encode(data, width):
+    """
+    Encode a document into the SharedDocument binary format.
+
+    Children are written before their parents so that every container's
+    offset table can be filled in directly. Keys and strings of up to
+    ``_SHARED_STRING_LENGTH`` characters, and the constants, are written
+    once and shared.
+
+    Parameters
+    ----------
+    data : any
+        The document.
+    width : int
+        The size of child offsets in bytes, 4 or 8.
+
+    Returns
+    -------
+    bytearray
+        The encoded document, starting with the header.
+
+    Raises
+    ------
+    TypeError
+        If a value is not JSON compatible.
+    OverflowError
+        If the encoding outgrows offsets of ``width`` bytes.
+    """
+    code = _OFFSET_CODES[width]
+    limit = 1 << (8 * width)
+    out = bytearray(_HEADER.size)
+    strings = {}
+    constants = {}
+
+    def string(value):
+        shared = len(value) <= _SHARED_STRING_LENGTH
+        if shared:
+            offset = strings.get(value)
+            if offset is not None:
+                return offset
+        raw = value.encode("utf-8")
+        offset = len(out)
+        out.append(_STRING)
+        out.extend(_U32.pack(len(raw)))
+        out.extend(raw)
+        if shared:
+            strings[value] = offset
+        return offset
+
+    def constant(tag):
+        offset = constants.get(tag)
+        if offset is None:
+            offset = constants[tag] = len(out)
+            out.append(tag)
+        return offset
+
+    def container_offset():
+        # Every child precedes its container, so the offset table of a
+        # container that starts within the limit fits the offset width.
+        offset = len(out)
+        if offset >= limit:
+            raise OverflowError(f"Encoded document exceeds {width}-byte offsets")
+        return offset
+
+    def encode(value):
+        value_type = type(value)
+        if value_type is str:
+            return string(value)
+        if value_type is int:
+            offset = len(out)
+            if -(1 << 63) <= value < (1 << 63):
+                out.append(_INT)
+                out.extend(_I64.pack(value))
+            else:
+                raw = str(value).encode("ascii")
+                out.append(_BIG_INT)
+                out.extend(_U32.pack(len(raw)))
+                out.extend(raw)
+            return offset
+        if value_type is float:
+            offset = len(out)
+            out.append(_FLOAT)
+            out.extend(_F64.pack(value))
+            return offset
+        if value is None:
+            return constant(_NULL)
+        if value is True:
+            return constant(_TRUE)
+        if value is False:
+            return constant(_FALSE)
+        if value_type in OBJECT_TYPES:
+            keys = []
+            values = []
+            for key, child in value.items():
+                if type(key) is not str:
+                    raise TypeError(f"Object keys must be str, not {type(key).__name__}")
+                keys.append(string(key))
+                values.append(encode(child))
+            offset = container_offset()
+            out.append(_OBJECT)
+            out.extend(_U32.pack(len(keys)))
+            out.extend(struct.pack(f"<{2 * len(keys)}{code}", *keys, *values))
+            return offset
+        if value_type in ARRAY_TYPES or value_type is tuple:
+            children = [encode(child) for child in value]
+            offset = container_offset()
+            out.append(_ARRAY)
+            out.extend(_U32.pack(len(children)))
+            out.extend(struct.pack(f"<{len(children)}{code}", *children))
+            return offset
+        raise TypeError(f"Object of type {value_type.__name__} is not JSON serializable")
+
+    root = encode(data)
+    _HEADER.pack_into(out, 0, _MAGIC, width, root, len(out))
+    return out
@@ -3,33 +3,58 @@ Simple XML to dictionary converter.
 
 This module provides a utility class for parsing XML strings and converting
 them to nested dictionary structures for easier JSON-like manipulation.
+Documents are parsed with lxml when it is installed (the ``xml`` extra) and
+with the standard library's ElementTree otherwise.
 """
 
 import xml.etree.ElementTree as ET
 
+PARSERS = ("auto", "lxml", "etree")
+_LXML_MIN_VERSION = (5, 0)
+_lxml = None
+
+
 class SimpleXML:
     """
     A utility class for converting XML strings to nested dictionary structures.
 
     This class provides simple XML parsing capabilities, converting XML
     elements to nested dictionaries and analyzing tag usage patterns.
+    Comments and processing instructions are ignored.
 
     Parameters
     ----------
-    xml_string : str
+    xml_string : str or bytes
         The XML string to parse and convert.
+    parser : {"auto", "lxml", "etree"}, optional
+        The parser backend. "auto" (the default) uses lxml when it is
+        installed and falls back to ElementTree; "lxml" requires lxml.
+        With "auto", installing lxml therefore changes the type of
+        ``root`` from an ElementTree element to an lxml element; pass
+        "etree" when code depends on ElementTree elements.
+    huge_tree : bool, optional
+        If True, lift libxml2's limits on nesting depth, text size and
+        entity expansion when parsing with lxml, by default False. Only
+        enable it for trusted input. ElementTree parses are not affected.
 
     Attributes
     ----------
-    xml_string : str
+    xml_string : str or bytes
         The original XML string.
-    root : xml.etree.ElementTree.Element
-        The parsed XML root element.
+    backend : str
+        The backend that parsed the document, "lxml" or "etree".
+    root : xml.etree.ElementTree.Element or lxml.etree._Element
+        The parsed XML root element, of the type of the ``backend`` used.
 
     Raises
     ------
     xml.etree.ElementTree.ParseError
-        If the XML string is malformed or cannot be parsed.
+        If the XML string is malformed or cannot be parsed, with either
+        backend.
+    ValueError
+        If ``parser`` is not a known backend.
+    ImportError
+        If ``parser="lxml"`` and lxml 5.0 or later is not installed.
 
     Examples
     --------
@@ -38,10 +63,50 @@ class SimpleXML:
     >>> result = parser.to_dict()
     >>> print(result)
     {'user': {'name': 'Alice', 'age': '30'}}
+    >>> SimpleXML(xml_data, parser="etree").backend
+    'etree'
     """
-    def __init__(self, xml_string):
+    def __init__(self, xml_string, parser="auto", huge_tree=False):
+        if parser not in PARSERS:
+            raise ValueError(f"Unknown XML parser {parser!r}; expected one of {', '.join(PARSERS)}")
         self.xml_string = xml_string
-        self.root = ET.fromstring(self.xml_string)
+        lxml_etree = None if parser == "etree" else _import_lxml(required=parser == "lxml")
+        if lxml_etree is None:
+            self.backend = "etree"
+            self.root = ET.fromstring(self.xml_string)
+        else:
+            self.backend = "lxml"
+            self.root = _lxml_fromstring(lxml_etree, self.xml_string, huge_tree)
+
+    def query(self, path, namespaces=None):
+        """
+        Extract the values matching a path without converting the document.
+
+        A shortcut for ``XMLQuery(path, namespaces).find_all(self)``; compile
+        an ``XMLQuery`` once to run the same path over many documents.
+
+        Parameters
+        ----------
+        path : str
+            The path, relative to the root element (see ``XMLQuery``).
+        namespaces : dict, optional
+            Mapping of namespace prefix to URI used in the path.
+
+        Returns
+        -------
+        list
+            The matched values, in document order.
+
+        Examples
+        --------
+        >>> parser = SimpleXML('<users><user id="1"><name>Ann</name></user><user id="2"/></users>')
+        >>> parser.query('user/@id')
+        ['1', '2']
+        >>> parser.query('user/name')
+        ['Ann']
+        """
+        from .XMLQuery import XMLQuery
+        return XMLQuery(path, namespaces).find_all(self)
 
     def to_dict(self):
         """
@@ -70,7 +135,7 @@ class SimpleXML:
 
         Parameters
         ----------
-        element : xml.etree.ElementTree.Element or None
+        element : xml.etree.ElementTree.Element, lxml.etree._Element or None
             The XML element to convert.
 
         Returns
@@ -79,18 +144,8 @@ class SimpleXML:
             A dictionary for elements with children, a string for text content,
             or None for empty elements.
         """
-        if element is None:
-            return None
-
-        result = {}
-        for child in element:
-            result[child.tag] = self._element_to_dict(child)
-
-        if not result:
-            return element.text
+        return _element_to_dict(element)
 
-        return result
-    
     def analyze_tag_usagee(self):
         """
         Analyze the frequency of XML tags in the document.
@@ -134,4 +189,113 @@ class SimpleXML:
             tag_counts[element.tag] = 1
         
         for child in element:
-            self._count_tags(child, tag_counts)
+            if isinstance(child.tag, str):
+                self._count_tags(child, tag_counts)
+
+
+def _element_to_dict(element):
+    """
+    Recursively convert an XML element to a dictionary.
+
+    Comments and processing instructions, whose tags are not strings, are
+    skipped.
+
+    Parameters
+    ----------
+    element : xml.etree.ElementTree.Element, lxml.etree._Element or None
+        The XML element to convert.
+
+    Returns
+    -------
+    dict or str or None
+        A dictionary for elements with children, a string for text content,
+        or None for empty elements.
+    """
+    if element is None:
+        return None
+
+    result = {}
+    for child in element:
+        if isinstance(child.tag, str):
+            result[child.tag] = _element_to_dict(child)
+
+    if not result:
+        return element.text
+
+    return result
+
+
+def _import_lxml(required=False):
+    """
+    Import ``lxml.etree`` if a supported version is installed.
+
+    Versions before 5.0 resolve external entities by default and are not
+    used.
+
+    Parameters
+    ----------
+    required : bool, optional
+        If True, raise instead of returning None, by default False.
+
+    Returns
+    -------
+    module or None
+        The ``lxml.etree`` module, or None if it is unavailable.
+
+    Raises
+    ------
+    ImportError
+        If ``required`` is True and lxml 5.0 or later is not installed.
+    """
+    global _lxml
+    if _lxml is None:
+        try:
+            from lxml import etree as lxml_etree
+        except ImportError:
+            lxml_etree = False
+        else:
+            if lxml_etree.LXML_VERSION[:2] < _LXML_MIN_VERSION:
+                lxml_etree = False
+        _lxml = lxml_etree
+    if not _lxml and required:
+        raise ImportError("The lxml XML parser requires lxml>=5.0; install it with 'pip install json-anatomy[xml]'")
+    return _lxml or None
+
+
+def _lxml_fromstring(lxml_etree, xml_string, huge_tree=False):
+    """
+    Parse an XML string with lxml, reporting errors as ElementTree does.
+
+    Parameters
+    ----------
+    lxml_etree : module
+        The ``lxml.etree`` module.
+    xml_string : str or bytes
+        The XML string.
+    huge_tree : bool, optional
+        Whether to disable libxml2's security limits, by default False.
+
+    Returns
+    -------
+    lxml.etree._Element
+        The root element.
+
+    Raises
+    ------
+    xml.etree.ElementTree.ParseError
+        If the XML string is malformed.
+    """
+    if isinstance(xml_string, str):
+        # lxml rejects str input with an encoding declaration, so the text is
+        # parsed as UTF-8 bytes with the declaration overridden.
+        xml_string = xml_string.encode("utf-8")
+        parser = lxml_etree.XMLParser(encoding="utf-8", resolve_entities="internal", huge_tree=huge_tree)
+    else:
+        parser = lxml_etree.XMLParser(resolve_entities="internal", huge_tree=huge_tree)
+    try:
+        return lxml_etree.fromstring(xml_string, parser)
+    except lxml_etree.XMLSyntaxError as error:
+        parse_error = ET.ParseError(str(error))
+        parse_error.code = error.code
+        parse_error.position = error.position
+        raise parse_error from error
@@ -0,0 +1,378 @@
+"""
+Inverted index from scalar values to the paths where they occur.
+
+This module provides the ValueIndex class, which walks a document once and
+records, for every scalar value (and optionally every word token of string
+values), the paths at which it appears. Exact, prefix and token lookups are
+then dictionary or binary searches instead of a recursive scan of the
+document, and the index can be saved to disk and reloaded for later
+sessions.
+"""
+
+import json
+import re
+from bisect import bisect_left
+
+from ._nodes import OBJECT_TYPES, ARRAY_TYPES
+
+_FORMAT = "jsonanatomy.ValueIndex"
+_VERSION = 1
+_TOKEN = re.compile(r"\w+")
+
+
+class ValueIndex:
+    """
+    An index answering "which paths contain this value" for one document.
+
+    Values are indexed by type as well as value, so ``1``, ``1.0``,
+    ``True`` and ``"1"`` are distinct. Paths are stored as a parent-pointer
+    tree of the document's nodes, so a path is only materialized for the
+    matches a lookup returns. The index reflects the document at build
+    time; rebuild it after the document changes.
+
+    Parameters
+    ----------
+    data : any
+        The document to index.
+    tokens : bool, optional
+        If True, also index the lowercased word tokens of string values for
+        ``lookup_token``, by default False.
+
+    Attributes
+    ----------
+    tokens : bool
+        Whether string tokens are indexed.
+
+    Examples
+    --------
+    >>> data = {'orders': [{'id': 'abc123', 'note': 'Refund for abc123'},
+    ...                    {'id': 'abd999', 'parent': 'abc123'}]}
+    >>> index = ValueIndex(data, tokens=True)
+    >>> index.lookup('abc123')
+    [('orders', 0, 'id'), ('orders', 1, 'parent')]
+    >>> index.lookup_prefix('ab', limit=3)
+    [('orders', 0, 'id'), ('orders', 1, 'id'), ('orders', 1, 'parent')]
+    >>> index.lookup_token('refund')
+    [('orders', 0, 'note')]
+
+    >>> index.save('/path/to/big.index.json')
+    >>> ValueIndex.load('/path/to/big.index.json').lookup('abc123')
+    [('orders', 0, 'id'), ('orders', 1, 'parent')]
+    """
+    def __init__(self, data, tokens=False):
+        self.tokens = tokens
+        self._parents = []
+        self._keys = []
+        self._values = {}
+        self._tokens = {}
+        self._sorted_values = None
+        self._sorted_tokens = None
+        self._build(data)
+
+    def __repr__(self):
+        """
+        Return a string representation of the ValueIndex object.
+
+        Returns
+        -------
+        str
+            A formatted string showing the number of distinct values and
+            indexed nodes.
+        """
+        return f"ValueIndex[values={len(self._values)}, nodes={len(self._parents)}]"
+
+    def __len__(self):
+        """
+        Get the number of distinct indexed values.
+
+        Returns
+        -------
+        int
+            The number of distinct scalar values.
+        """
+        return len(self._values)
+
+    def __contains__(self, value):
+        """
+        Test whether a value occurs anywhere in the document.
+
+        Parameters
+        ----------
+        value : any
+            The scalar value to look for.
+
+        Returns
+        -------
+        bool
+            True if the value was indexed.
+        """
+        return _value_key(value) in self._values
+
+    def _build(self, data):
+        """
+        Walk the document and fill the node tree and postings.
+
+        Parameters
+        ----------
+        data : any
+            The document to index.
+        """
+        parents = self._parents
+        keys = self._keys
+        values = self._values
+        tokens = self._tokens if self.tokens else None
+        # Nodes are numbered in pre-order, so sorting node ids yields
+        # document order.
+        stack = [(-1, _children(data))]
+        while stack:
+            parent, children = stack[-1]
+            for key, child in children:
+                node = len(parents)
+                parents.append(parent)
+                keys.append(key)
+                child_type = type(child)
+                if child_type in OBJECT_TYPES or child_type in ARRAY_TYPES:
+                    stack.append((node, _children(child)))
+                    break
+                value_key = _value_key(child)
+                if value_key is None:
+                    continue
+                postings = values.get(value_key)
+                if postings is None:
+                    values[value_key] = [node]
+                else:
+                    postings.append(node)
+                if tokens is not None and child_type is str:
+                    for token in set(_TOKEN.findall(child.lower())):
+                        postings = tokens.get(token)
+                        if postings is None:
+                            tokens[token] = [node]
+                        else:
+                            postings.append(node)
+            else:
+                stack.pop()
+
+    def lookup(self, value):
+        """
+        Find the paths where a scalar value occurs.
+
+        Parameters
+        ----------
+        value : str, int, float, bool or None
+            The value to look for.
+
+        Returns
+        -------
+        list of tuple
+            The paths in document order, or an empty list.
+        """
+        return self._paths(self._values.get(_value_key(value), ()))
+
+    def lookup_prefix(self, prefix, limit=None):
+        """
+        Find the paths of string values starting with a prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            The prefix to match (case-sensitive).
+        limit : int, optional
+            The maximum number of paths to return, by default all.
+
+        Returns
+        -------
+        list of tuple
+            The paths in document order.
+        """
+        if self._sorted_values is None:
+            self._sorted_values = sorted(key for key in self._values if key[0] == "s")
+        return self._prefix_paths(self._sorted_values, self._values, "s" + prefix, limit)
+
+    def lookup_token(self, token, prefix=False, limit=None):
+        """
+        Find the paths of string values containing a word token.
+
+        Parameters
+        ----------
+        token : str
+            The word to look for; matching is case-insensitive.
+        prefix : bool, optional
+            If True, match every token starting with ``token``, by default
+            False.
+        limit : int, optional
+            The maximum number of paths to return, by default all.
+
+        Returns
+        -------
+        list of tuple
+            The paths in document order.
+
+        Raises
+        ------
+        ValueError
+            If the index was built without ``tokens=True``.
+        """
+        if not self.tokens:
+            raise ValueError("Token lookups require an index built with tokens=True")
+        token = token.lower()
+        if not prefix:
+            return self._paths(self._tokens.get(token, ())[:limit])
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._tokens)
+        return self._prefix_paths(self._sorted_tokens, self._tokens, token, limit)
+
+    def save(self, file_path):
+        """
+        Write the index to a JSON file.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the file to create.
+        """
+        state = {
+            "format": _FORMAT,
+            "version": _VERSION,
+            "tokens": self.tokens,
+            "parents": self._parents,
+            "keys": self._keys,
+            "values": self._values,
+            "token_postings": self._tokens,
+        }
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(state, file, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, file_path):
+        """
+        Read an index written by ``save``.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the index file.
+
+        Returns
+        -------
+        ValueIndex
+            The loaded index.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a saved ValueIndex of a supported version.
+        """
+        with open(file_path, "r", encoding="utf-8") as file:
+            state = json.load(file)
+        if not isinstance(state, dict) or state.get("format") != _FORMAT or state.get("version") != _VERSION:
+            raise ValueError(f"File at {file_path} is not a supported ValueIndex")
+        index = cls(None, tokens=state["tokens"])
+        index._parents = state["parents"]
+        index._keys = state["keys"]
+        index._values = state["values"]
+        index._tokens = state["token_postings"]
+        return index
+
+    def _prefix_paths(self, sorted_keys, postings, prefix, limit):
+        """
+        Collect the paths of every key in a sorted list sharing a prefix.
+
+        Parameters
+        ----------
+        sorted_keys : list of str
+            The sorted keys of ``postings``.
+        postings : dict
+            The mapping of key to node ids.
+        prefix : str
+            The key prefix.
+        limit : int or None
+            The maximum number of paths to return.
+
+        Returns
+        -------
+        list of tuple
+            The paths in document order.
+        """
+        nodes = []
+        position = bisect_left(sorted_keys, prefix)
+        while position < len(sorted_keys) and sorted_keys[position].startswith(prefix):
+            nodes.extend(postings[sorted_keys[position]])
+            position += 1
+        nodes = sorted(set(nodes))
+        return self._paths(nodes[:limit])
+
+    def _paths(self, nodes):
+        """
+        Rebuild the paths of nodes from the parent-pointer tree.
+
+        Parameters
+        ----------
+        nodes : iterable of int
+            The node ids.
+
+        Returns
+        -------
+        list of tuple
+            The path of each node.
+        """
+        parents = self._parents
+        keys = self._keys
+        paths = []
+        for node in nodes:
+            path = []
+            while node >= 0:
+                path.append(keys[node])
+                node = parents[node]
+            paths.append(tuple(reversed(path)))
+        return paths
+
+
+def _children(value):
+    """
+    Iterate over the members of a container as ``(key, child)`` pairs.
+
+    Parameters
+    ----------
+    value : any
+        The value.
+
+    Returns
+    -------
+    iterator
+        Object items or enumerated array elements; empty for scalars.
+    """
+    value_type = type(value)
+    if value_type in OBJECT_TYPES:
+        return iter(value.items())
+    if value_type in ARRAY_TYPES:
+        return enumerate(value)
+    return iter(())
+
+
+def _value_key(value):
+    """
+    Build the typed index key of a scalar value.
+
+    Parameters
+    ----------
+    value : any
+        The value.
+
+    Returns
+    -------
+    str or None
+        A type tag followed by the value's text, or None if the value is
+        not a JSON scalar.
+    """
+    value_type = type(value)
+    if value_type is str:
+        return "s" + value
+    if value is None:
+        return "n"
+    if value_type is bool:
+        return "b1" if value else "b0"
+    if value_type is int:
+        return "i" + str(value)
+    if value_type is float:
+        return "f" + repr(value)
+    return None
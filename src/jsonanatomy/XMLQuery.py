@@ -0,0 +1,296 @@
+"""
+Compiled path queries over parsed XML documents.
+
+This module provides the XMLQuery class, which extracts the values matching
+a path directly from a parsed XML tree. Only the matched elements are
+converted, so reading a few fields from a large document does not require
+``SimpleXML.to_dict`` of the whole tree followed by ``Maybe`` navigation,
+and repeated sibling elements (which ``to_dict`` collapses to the last one)
+are all returned. Documents parsed with lxml are queried with compiled
+XPath expressions, and ElementTree documents with ElementPath.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+
+from .SimpleXML import SimpleXML, _element_to_dict, _import_lxml
+
+_XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+_SELECTOR = re.compile(r"^(?:(.*?)/)?(?:@([\w.\-]+(?::[\w.\-]+)?)|(text\(\)))$")
+
+
+class XMLQuery:
+    """
+    A reusable path query that extracts values from XML documents.
+
+    The path is relative to the root element. It is compiled on first use
+    with each backend and reused, so the same query can be run over many
+    documents. Matched elements with child
+    elements are returned as dictionaries, as ``SimpleXML.to_dict`` would
+    convert them, and other elements as their text. A trailing ``/@name``
+    selects attribute values and a trailing ``/text()`` element text.
+
+    Relative paths in the ElementPath subset (``tag``, ``*``, ``.``, ``..``,
+    ``.//`` and ``[...]`` predicates such as ``[@id='1']`` or ``[2]``), plus
+    those trailing selectors, work with both parser backends. Documents
+    parsed with lxml accept any XPath 1.0 expression, including absolute
+    paths such as ``//item`` and functions such as ``count()``, whose
+    results are returned as they are; ElementTree documents reject these
+    with ValueError.
+
+    Parameters
+    ----------
+    path : str
+        The path to evaluate.
+    namespaces : dict, optional
+        Mapping of namespace prefix to URI used in the path.
+
+    Attributes
+    ----------
+    path : str
+        The query path.
+    namespaces : dict or None
+        The namespace prefixes.
+
+    Raises
+    ------
+    ValueError
+        If the path uses an undefined namespace prefix in an attribute
+        selector.
+
+    Examples
+    --------
+    >>> doc = SimpleXML('<shop><item sku="a1"><price>3</price></item>'
+    ...                 '<item sku="b2"><price>5</price></item></shop>')
+    >>> XMLQuery('item/@sku').find_all(doc)
+    ['a1', 'b2']
+    >>> XMLQuery("item[@sku='b2']/price").first(doc)
+    '5'
+    >>> XMLQuery('item').find_all(doc)
+    [{'price': '3'}, {'price': '5'}]
+    >>> XMLQuery('missing').first(doc, default='n/a')
+    'n/a'
+    """
+    def __init__(self, path, namespaces=None):
+        self.path = path
+        self.namespaces = dict(namespaces) if namespaces else None
+        match = _SELECTOR.match(path)
+        if match is None:
+            self._element_path = path
+            self._attribute = None
+            self._text = False
+        else:
+            self._element_path = match.group(1) or "."
+            self._attribute = self._qualify(match.group(2)) if match.group(2) else None
+            self._text = match.group(3) is not None
+        self._xpath = None
+
+    def __repr__(self):
+        """
+        Return a string representation of the XMLQuery object.
+
+        Returns
+        -------
+        str
+            A formatted string showing the query path.
+        """
+        return f"XMLQuery({self.path!r})"
+
+    def find_all(self, document):
+        """
+        Extract every value matching the path.
+
+        Parameters
+        ----------
+        document : SimpleXML, Element or ElementTree
+            The parsed document, or the element the path is relative to.
+
+        Returns
+        -------
+        list
+            The matched values, in document order.
+
+        Raises
+        ------
+        ValueError
+            If the path is not valid for the document's parser backend.
+        """
+        root = _root(document)
+        if isinstance(root, ET.Element):
+            return list(self._iter_etree(root))
+        return self._evaluate_xpath(root)
+
+    def first(self, document, default=None):
+        """
+        Extract the first value matching the path.
+
+        Parameters
+        ----------
+        document : SimpleXML, Element or ElementTree
+            The parsed document, or the element the path is relative to.
+        default : any, optional
+            The value returned when nothing matches, by default None.
+
+        Returns
+        -------
+        any
+            The first matched value, or ``default``.
+
+        Raises
+        ------
+        ValueError
+            If the path is not valid for the document's parser backend.
+        """
+        root = _root(document)
+        if isinstance(root, ET.Element):
+            return next(iter(self._iter_etree(root)), default)
+        values = self._evaluate_xpath(root)
+        return values[0] if values else default
+
+    def _iter_etree(self, root):
+        """
+        Evaluate the path on an ElementTree element.
+
+        ElementTree caches compiled ElementPath selectors, so only the
+        trailing attribute or text selector is handled here. The path is
+        compiled before the first value is requested, so invalid paths are
+        reported when this is called.
+
+        Parameters
+        ----------
+        root : xml.etree.ElementTree.Element
+            The element the path is relative to.
+
+        Returns
+        -------
+        iterator
+            The matched values.
+
+        Raises
+        ------
+        ValueError
+            If the path is not a valid ElementPath expression.
+        """
+        try:
+            elements = root.iterfind(self._element_path, self.namespaces)
+        except (SyntaxError, TypeError) as error:
+            # ElementPath reports some unterminated predicates ("item[") as
+            # a TypeError while building the selector.
+            raise ValueError(f"Invalid ElementPath expression {self.path!r}: {error}") from error
+        return self._etree_values(elements)
+
+    def _etree_values(self, elements):
+        """
+        Extract the selected values of matched ElementTree elements.
+
+        Parameters
+        ----------
+        elements : iterable of xml.etree.ElementTree.Element
+            The elements matched by the element path.
+
+        Yields
+        ------
+        any
+            The matched values.
+        """
+        attribute = self._attribute
+        for element in elements:
+            if attribute is not None:
+                value = element.get(attribute)
+                if value is not None:
+                    yield value
+            elif self._text:
+                if element.text is not None:
+                    yield element.text
+            else:
+                yield _element_to_dict(element)
+
+    def _evaluate_xpath(self, root):
+        """
+        Evaluate the compiled XPath expression on an lxml element.
+
+        Parameters
+        ----------
+        root : lxml.etree._Element
+            The element the path is relative to.
+
+        Returns
+        -------
+        list
+            The matched values; a scalar XPath result becomes a one-item
+            list.
+
+        Raises
+        ------
+        ValueError
+            If the path is not a valid XPath expression or cannot be
+            evaluated, for example because of an undefined namespace prefix.
+        """
+        lxml_etree = _import_lxml(required=True)
+        try:
+            if self._xpath is None:
+                self._xpath = lxml_etree.XPath(self.path, namespaces=self.namespaces, smart_strings=False)
+            result = self._xpath(root)
+        except lxml_etree.XPathError as error:
+            raise ValueError(f"Invalid XPath expression {self.path!r}: {error}") from error
+        if not isinstance(result, list):
+            return [result]
+        values = []
+        for item in result:
+            if isinstance(item, str):
+                values.append(item)
+            elif isinstance(getattr(item, "tag", None), str):
+                values.append(_element_to_dict(item))
+            else:
+                values.append(getattr(item, "text", item))
+        return values
+
+    def _qualify(self, name):
+        """
+        Expand a prefixed attribute name to ElementTree's ``{uri}name`` form.
+
+        Parameters
+        ----------
+        name : str
+            The attribute name, optionally with a namespace prefix.
+
+        Returns
+        -------
+        str
+            The attribute key used by ElementTree.
+
+        Raises
+        ------
+        ValueError
+            If the prefix is not in ``namespaces``.
+        """
+        if ":" not in name:
+            return name
+        prefix, local = name.split(":", 1)
+        if prefix == "xml":
+            return "{%s}%s" % (_XML_NAMESPACE, local)
+        if not self.namespaces or prefix not in self.namespaces:
+            raise ValueError(f"Namespace prefix {prefix!r} in {self.path!r} is not defined")
+        return "{%s}%s" % (self.namespaces[prefix], local)
+
+
+def _root(document):
+    """
+    Get the element a query is evaluated against.
+
+    Parameters
+    ----------
+    document : SimpleXML, Element or ElementTree
+        The document.
+
+    Returns
+    -------
+    Element
+        The root element of a SimpleXML or ElementTree, or the element
+        itself.
+    """
+    if isinstance(document, SimpleXML):
+        return document.root
+    if hasattr(document, "getroot"):
+        return document.getroot()
+    return document
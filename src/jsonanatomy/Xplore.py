@@ -9,7 +9,6 @@ for exploring and navigating JSON data structures.
 
 from .Maybe import Maybe
 from .Explore import Explore
-from .SimpleXML import SimpleXML
 
 
 class Xplore:
@@ -24,6 +23,11 @@ class Xplore:
     ----------
     data : any
         The input data to be explored. Can be JSON data, XML string, or other data types.
+    cache : DerivedCache, optional
+        A cache shared between explorers (and threads) for resolved items
+        and the derived results of ``explore``. Entries are keyed by
+        ``data`` and the path of each item below it; call
+        ``cache.invalidate(data)`` after modifying it.
 
     Attributes
     ----------
@@ -35,6 +39,8 @@ class Xplore:
         A Maybe instance for safe data access operations.
     xml : SimpleXML or None
         A SimpleXML instance if data is an XML string, None otherwise.
+    cache : DerivedCache or None
+        The shared cache, if any.
 
     Examples
     --------
@@ -55,11 +61,37 @@ class Xplore:
     - Creates a SimpleXML instance only if data is a string starting with "<"
     - The xml attribute will be None if data is not XML-formatted
     """
-    def __init__(self, data):
+    def __init__(self, data, cache=None):
+        self._bind(data, data, (), cache)
+
+    def _bind(self, data, root, path, cache):
+        """
+        Initialize the facade for a value at a path below a cached root.
+
+        Parameters
+        ----------
+        data : any
+            The input data.
+        root : any
+            The document the cache entries of this facade are keyed by.
+        path : tuple
+            The path of ``data`` below ``root``, as ``(type, key)`` pairs so
+            that equal keys of different types stay apart.
+        cache : DerivedCache or None
+            The shared cache.
+        """
         self.data = data
-        self.explore = Explore(data)
+        self.cache = cache
+        self._root = root
+        self._path = path
+        self.explore = Explore._at(data, root, path, cache)
         self.maybe = Maybe(data)
-        self.xml = SimpleXML(data) if isinstance(data, str) and data.strip().startswith("<") else None
+        self.xml = None
+        if isinstance(data, str) and data.strip().startswith("<"):
+            # Imported here so that XML support (and ElementTree) only loads
+            # for XML input.
+            from .SimpleXML import SimpleXML
+            self.xml = SimpleXML(data)
 
     def __repr__(self):
         """
@@ -96,7 +128,14 @@ class Xplore:
         >>> age = xplore['details']['age'].value()  # 30
         >>> missing = xplore['missing'].value()  # None
         """
-        return Xplore(self.maybe[key].value())
+        if self.cache is None:
+            return Xplore(self.maybe[key].value())
+        # Keys are tagged with their type, since 1, 1.0 and True are equal.
+        path = self._path + ((type(key), key),)
+        value = self.cache.get(self._root, "item", path, lambda: self.maybe[key].value())
+        xplore = Xplore.__new__(Xplore)
+        xplore._bind(value, self._root, path, self.cache)
+        return xplore
     
     def keys(self):
         """
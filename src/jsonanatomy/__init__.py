@@ -25,13 +25,47 @@ Xplore : class
     Unified convenience facade combining all exploration tools.
 SimpleXML : class
     Utility for converting XML to nested dictionary structures.
+XMLQuery : class
+    Compiled path query extracting values from parsed XML documents.
+DirectoryProfiler : class
+    Incrementally maintained field counts for a directory of JSON files.
+JSONArrayFile : class
+    Indexed range and batch access to a large top-level JSON array file.
+PathExtractor : class
+    Single-pass extraction of many paths from JSON records.
+Predicate : class
+    Declarative record conditions usable with Maybe.filter and record readers.
+SharedDocument : class
+    Read-only document published once in shared memory for worker processes.
+ValueIndex : class
+    Persistable inverted index from scalar values to the paths where they occur.
+DerivedCache : class
+    Thread-safe, size-bounded LRU of results derived from explored documents.
 
 Functions
 ---------
 get_json_file_paths : function
     Find JSON files in a directory using glob patterns.
+iter_json_file_paths : function
+    Lazily scan a directory tree for JSON files with filters.
 read_json_file : function
     Read and parse JSON files with error handling.
+iter_json_records : function
+    Stream the records of a JSON array or NDJSON file, filtering while reading.
+read_json_records : function
+    Load the records of a JSON array or NDJSON file that match a predicate.
+flatten_record : function
+    Flatten a nested record into a single-level dictionary.
+iter_column_batches : function
+    Convert records into bounded-size column batches keyed by field path.
+write_csv : function
+    Write flattened records to a CSV file in batches.
+write_parquet : function
+    Write flattened records to a Parquet file (requires pyarrow).
+write_arrow : function
+    Write flattened records to an Arrow IPC file (requires pyarrow).
+compact : function
+    Intern keys and strings, and optionally share subtrees, to reduce memory.
 
 Examples
 --------
@@ -42,18 +76,145 @@ Examples
 >>> print(name)  # 'Alice'
 """
 
-from .file_reader import get_json_file_paths, read_json_file
-from .Explore import Explore
-from .Maybe import Maybe
-from .Xplore import Xplore
-from .SimpleXML import SimpleXML
+import sys
+from importlib import import_module
+from types import ModuleType
+
 from ._version import __version__, __author__, __email__
 
+# Public names and the submodules defining them. Submodules are imported on
+# first access, so ``import jsonanatomy`` stays cheap for callers that only
+# use a few of them (see ``scripts/benchmark_import_time.py``).
+_EXPORTS = {
+    "get_json_file_paths": "file_reader",
+    "iter_json_file_paths": "file_reader",
+    "read_json_file": "file_reader",
+    "iter_json_records": "file_reader",
+    "read_json_records": "file_reader",
+    "flatten_record": "flatten",
+    "iter_column_batches": "flatten",
+    "write_csv": "flatten",
+    "write_parquet": "flatten",
+    "write_arrow": "flatten",
+    "compact": "compaction",
+    "Explore": "Explore",
+    "Maybe": "Maybe",
+    "Xplore": "Xplore",
+    "SimpleXML": "SimpleXML",
+    "XMLQuery": "XMLQuery",
+    "DirectoryProfiler": "DirectoryProfiler",
+    "JSONArrayFile": "JSONArrayFile",
+    "PathExtractor": "PathExtractor",
+    "Predicate": "Predicate",
+    "SharedDocument": "SharedDocument",
+    "ValueIndex": "ValueIndex",
+    "DerivedCache": "DerivedCache",
+}
+
+# Submodules reachable as package attributes (``jsonanatomy.file_reader``)
+# without importing them first. Submodules named after their class resolve
+# to the class instead.
+_SUBMODULES = ("file_reader", "flatten", "compaction", "lazy", "cli")
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .file_reader import (
+        get_json_file_paths,
+        iter_json_file_paths,
+        read_json_file,
+        iter_json_records,
+        read_json_records,
+    )
+    from .flatten import flatten_record, iter_column_batches, write_csv, write_parquet, write_arrow
+    from .compaction import compact
+    from .Explore import Explore
+    from .Maybe import Maybe
+    from .Xplore import Xplore
+    from .SimpleXML import SimpleXML
+    from .XMLQuery import XMLQuery
+    from .DirectoryProfiler import DirectoryProfiler
+    from .JSONArrayFile import JSONArrayFile
+    from .PathExtractor import PathExtractor
+    from .Predicate import Predicate
+    from .SharedDocument import SharedDocument
+    from .ValueIndex import ValueIndex
+    from .DerivedCache import DerivedCache
+
+
+def __getattr__(name):
+    """
+    Import the submodule defining a public name, or a submodule, on first access.
+
+    Parameters
+    ----------
+    name : str
+        The attribute name.
+
+    Returns
+    -------
+    any
+        The exported class or function, or the submodule, which is then
+        cached on the package.
+
+    Raises
+    ------
+    AttributeError
+        If ``name`` is neither a public name nor a submodule of the package.
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is not None:
+        value = getattr(import_module("." + module_name, __name__), name)
+    elif name in _SUBMODULES:
+        value = import_module("." + name, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(ModuleType):
+    """
+    Module type of the package that keeps exported classes visible.
+
+    Importing a submodule binds it on the package under its own name. Most
+    classes live in a submodule of the same name (``jsonanatomy.Explore``),
+    so the class is bound instead, as the former eager imports did.
+    """
+    def __setattr__(self, name, value):
+        if isinstance(value, ModuleType) and _EXPORTS.get(name) == name \
+                and value.__name__ == f"{__name__}.{name}":
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
 __all__ = [
     "get_json_file_paths",
+    "iter_json_file_paths",
     "read_json_file",
+    "iter_json_records",
+    "read_json_records",
+    "flatten_record",
+    "iter_column_batches",
+    "write_csv",
+    "write_parquet",
+    "write_arrow",
+    "compact",
     "Explore",
     "Maybe",
     "Xplore",
     "SimpleXML",
+    "XMLQuery",
+    "DirectoryProfiler",
+    "JSONArrayFile",
+    "PathExtractor",
+    "Predicate",
+    "SharedDocument",
+    "ValueIndex",
+    "DerivedCache",
 ]
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""
+Registry of container types treated as JSON objects and arrays.
+
+``Maybe`` and ``Explore`` test container types by exact type membership in
+these sets, which keeps the common ``dict``/``list`` case as fast as a plain
+``type(x) is dict`` check while letting read-only proxy types (such as the
+lazily decoded documents in ``jsonanatomy.lazy``) be navigated the same way.
+Registered object types must implement the read-only mapping protocol and
+array types the read-only sequence protocol.
+"""
+
+OBJECT_TYPES = {dict}
+ARRAY_TYPES = {list}
+
+
+def register_object_type(cls):
+    """
+    Register a mapping type to be navigated like a JSON object.
+
+    Parameters
+    ----------
+    cls : type
+        A type implementing ``__getitem__``, ``__contains__``, ``__len__``,
+        ``keys`` and ``items``.
+
+    Returns
+    -------
+    type
+        The registered type, so this can be used as a class decorator.
+    """
+    OBJECT_TYPES.add(cls)
+    return cls
+
+
+def register_array_type(cls):
+    """
+    Register a sequence type to be navigated like a JSON array.
+
+    Parameters
+    ----------
+    cls : type
+        A type implementing ``__getitem__`` for integer indices, ``__len__``
+        and ``__iter__``.
+
+    Returns
+    -------
+    type
+        The registered type, so this can be used as a class decorator.
+    """
+    ARRAY_TYPES.add(cls)
+    return cls
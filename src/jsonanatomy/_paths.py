@@ -0,0 +1,95 @@
+"""
+Path parsing and resolution helpers shared by the path-based APIs.
+
+A path is either a dotted string such as ``"user.address.city"`` or
+``"items.0.name"``, or a tuple/list of keys such as ``("items", 0, "name")``.
+Resolution follows the ``Maybe`` semantics: object members are looked up by
+key, array elements by non-negative index (digit segments of a dotted path
+are used as indices when the current value is an array), and any missing
+step yields None instead of raising.
+"""
+
+from ._nodes import OBJECT_TYPES, ARRAY_TYPES
+
+
+def parse_path(path):
+    """
+    Normalize a path specification into a tuple of keys.
+
+    Parameters
+    ----------
+    path : str, int, tuple or list
+        A dotted path string, a single integer index, or a sequence of keys.
+        The empty string and the empty tuple denote the value itself.
+
+    Returns
+    -------
+    tuple
+        The path segments.
+
+    Raises
+    ------
+    TypeError
+        If ``path`` is not a supported path specification.
+    """
+    if isinstance(path, str):
+        return tuple(path.split(".")) if path else ()
+    if isinstance(path, int):
+        return (path,)
+    if isinstance(path, (tuple, list)):
+        return tuple(path)
+    raise TypeError(f"Unsupported path specification: {path!r}")
+
+
+def array_index(key):
+    """
+    Convert a path segment to an array index, if it denotes one.
+
+    Parameters
+    ----------
+    key : str or int
+        A path segment.
+
+    Returns
+    -------
+    int or None
+        The non-negative index, or None if the segment is not an index.
+    """
+    if type(key) is int:
+        return key if key >= 0 else None
+    if type(key) is str and key.isdigit():
+        return int(key)
+    return None
+
+
+def resolve_path(data, path):
+    """
+    Resolve a parsed path against a value with ``Maybe`` semantics.
+
+    Parameters
+    ----------
+    data : any
+        The value to start from.
+    path : tuple
+        The path segments, as returned by ``parse_path``.
+
+    Returns
+    -------
+    any
+        The value at the path, or None if any step is missing.
+    """
+    for key in path:
+        data_type = type(data)
+        if data_type in OBJECT_TYPES:
+            try:
+                data = data[key]
+            except (KeyError, TypeError):
+                return None
+        elif data_type in ARRAY_TYPES:
+            index = array_index(key)
+            if index is None or index >= len(data):
+                return None
+            data = data[index]
+        else:
+            return None
+    return data
@@ -0,0 +1,225 @@
+"""
+Byte-level structural scanning of JSON text.
+
+This private module locates the boundaries of the direct children of a JSON
+array or object inside an encoded buffer (bytes or mmap) without
+decoding them. Each child is normally matched by a single regular expression
+call that recognises values nested up to ``_REGEX_DEPTH`` levels deep; deeper
+values fall back to a token loop in which string literals are still skipped
+as a whole, so only structural characters are visited from Python.
+"""
+
+import re
+
+_REGEX_DEPTH = 5
+
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_PLAIN = rb'[^\[\]{}"]*'
+_WHITESPACE = rb"[ \t\n\r]*"
+
+
+def _content_pattern(depth):
+    """
+    Build a pattern for the text between a pair of brackets.
+
+    Parameters
+    ----------
+    depth : int
+        The number of further bracket levels the pattern may contain.
+
+    Returns
+    -------
+    bytes
+        A regular expression in unrolled-loop form (no nested repetition of
+        overlapping alternatives, so failing matches do not backtrack
+        exponentially).
+    """
+    if depth == 0:
+        return _PLAIN + rb"(?:" + _STRING + _PLAIN + rb")*"
+    inner = _content_pattern(depth - 1)
+    nested = rb"(?:" + _STRING + rb"|\{" + inner + rb"\}|\[" + inner + rb"\])"
+    return _PLAIN + rb"(?:" + nested + _PLAIN + rb")*"
+
+
+_VALUE = (rb"(?:" + _STRING + rb"|\{" + _content_pattern(_REGEX_DEPTH) + rb"\}|\["
+          + _content_pattern(_REGEX_DEPTH) + rb"\]|[^\s\[\]{}\",:]+)")
+_ELEMENT = re.compile(_WHITESPACE + _VALUE + _WHITESPACE + rb"(?=[,\]])")
+_MEMBER = re.compile(_WHITESPACE + rb"(" + _STRING + rb")" + _WHITESPACE + rb":"
+                     + _WHITESPACE + _VALUE + _WHITESPACE + rb"(?=[,}])")
+_MEMBER_KEY = re.compile(_WHITESPACE + rb"(" + _STRING + rb")" + _WHITESPACE + rb":")
+_TOKEN = re.compile(_STRING + rb"|[\[\]{},]", re.S)
+_NON_WHITESPACE = re.compile(rb"[^ \t\n\r]")
+
+_QUOTE = ord('"')
+_OPENERS = (ord("["), ord("{"))
+_CLOSERS = (ord("]"), ord("}"))
+_COMMA = ord(",")
+
+
+def skip_whitespace(buf, pos, end=None):
+    """
+    Find the first non-whitespace byte at or after a position.
+
+    Parameters
+    ----------
+    buf : bytes or mmap.mmap
+        The encoded JSON text.
+    pos : int
+        The position to start from.
+    end : int, optional
+        The position to stop at, by default the end of the buffer.
+
+    Returns
+    -------
+    int
+        The position of the first non-whitespace byte, or ``end`` if there
+        is none.
+    """
+    if end is None:
+        end = len(buf)
+    match = _NON_WHITESPACE.search(buf, pos, end)
+    return match.start() if match is not None else end
+
+
+def value_end(buf, pos, end=None):
+    """
+    Find the end of the JSON value starting at a position.
+
+    Parameters
+    ----------
+    buf : bytes or mmap.mmap
+        The encoded JSON text.
+    pos : int
+        The start of the value (leading whitespace is allowed).
+    end : int, optional
+        The position to stop scanning at, by default the end of the buffer.
+
+    Returns
+    -------
+    int
+        The position of the "," or closing bracket that follows the value
+        at the same nesting level.
+
+    Raises
+    ------
+    ValueError
+        If no delimiter follows the value before ``end``.
+    """
+    if end is None:
+        end = len(buf)
+    search = _TOKEN.search
+    depth = 0
+    position = pos
+    while True:
+        match = search(buf, position, end)
+        if match is None:
+            raise ValueError(f"Unterminated JSON value starting at byte {pos}")
+        position = match.end()
+        char = buf[match.start()]
+        if char == _QUOTE:
+            continue
+        if char in _OPENERS:
+            depth += 1
+        elif char in _CLOSERS:
+            if depth == 0:
+                return position - 1
+            depth -= 1
+        elif depth == 0:
+            return position - 1
+
+
+def array_spans(buf, start, end=None):
+    """
+    Yield the byte spans of the elements of a JSON array.
+
+    Parameters
+    ----------
+    buf : bytes or mmap.mmap
+        The encoded JSON text.
+    start : int
+        The position of the opening "[" of the array.
+    end : int, optional
+        The position to stop scanning at, by default the end of the buffer.
+
+    Yields
+    ------
+    tuple of int
+        ``(element_start, element_end)`` for each element. Spans may include
+        surrounding whitespace.
+
+    Raises
+    ------
+    ValueError
+        If the array is not terminated before ``end``.
+    """
+    if end is None:
+        end = len(buf)
+    pos = start + 1
+    first = skip_whitespace(buf, pos, end)
+    if first < end and buf[first] == _CLOSERS[0]:
+        return
+    match_element = _ELEMENT.match
+    while True:
+        match = match_element(buf, pos, end)
+        element_end = match.end() if match is not None else value_end(buf, pos, end)
+        if element_end >= end:
+            break
+        yield (pos, element_end)
+        if buf[element_end] != _COMMA:
+            return
+        pos = element_end + 1
+    raise ValueError(f"Unterminated JSON array starting at byte {start}")
+
+
+def object_spans(buf, start, end=None):
+    """
+    Yield the byte spans of the members of a JSON object.
+
+    Parameters
+    ----------
+    buf : bytes or mmap.mmap
+        The encoded JSON text.
+    start : int
+        The position of the opening "{" of the object.
+    end : int, optional
+        The position to stop scanning at, by default the end of the buffer.
+
+    Yields
+    ------
+    tuple of int
+        ``(key_start, key_end, value_start, value_end)`` for each member.
+        The key span covers the quoted key literal; the value span may
+        include surrounding whitespace.
+
+    Raises
+    ------
+    ValueError
+        If the object is malformed or not terminated before ``end``.
+    """
+    if end is None:
+        end = len(buf)
+    pos = start + 1
+    first = skip_whitespace(buf, pos, end)
+    if first < end and buf[first] == _CLOSERS[1]:
+        return
+    match_member = _MEMBER.match
+    while True:
+        match = match_member(buf, pos, end)
+        if match is not None:
+            key_start, key_end = match.span(1)
+            member_end = match.end()
+            value_start = buf.find(b":", key_end, member_end) + 1
+        else:
+            key = _MEMBER_KEY.match(buf, pos, end)
+            if key is None:
+                raise ValueError(f"Expected an object key at byte {pos}")
+            key_start, key_end = key.span(1)
+            value_start = key.end()
+            member_end = value_end(buf, value_start, end)
+        if member_end >= end:
+            break
+        yield (key_start, key_end, value_start, member_end)
+        if buf[member_end] != _COMMA:
+            return
+        pos = member_end + 1
+    raise ValueError(f"Unterminated JSON object starting at byte {start}")
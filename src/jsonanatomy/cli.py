@@ -0,0 +1,817 @@
+"""
+Command-line profiler for JSON, NDJSON and XML files.
+
+This module implements the ``jsonanatomy`` console command, which reports
+how often each field occurs across the records of one or more files or
+directories, and with which JSON types. The records of a file are the
+children of its top-level value, as for ``Explore.field_counts``: the
+elements of an array (or the lines of an NDJSON file) or the values of an
+object.
+
+Files are read in chunks of ``--chunk-size`` records: arrays through a
+``JSONArrayFile`` index, NDJSON files by line ranges, and top-level objects
+by member ranges located with the byte scanner, so every record is decoded
+once and inputs larger than memory can be profiled. XML documents are
+streamed, one child of the root element at a time. Chunks can be profiled
+by several worker processes, and a random sample of records can be profiled
+instead of every record.
+
+Examples
+--------
+$ jsonanatomy /data/events.json --depth 2
+$ jsonanatomy /data/dumps --recursive --workers 8 --sample 10000 --format json
+$ python -m jsonanatomy feed.xml
+"""
+
+import argparse
+import json
+import mmap
+import os
+import random
+import sys
+
+from ._nodes import OBJECT_TYPES, ARRAY_TYPES
+
+DEFAULT_PATTERNS = ["*.json", "*.jsonl", "*.ndjson", "*.xml"]
+_NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
+_UTF8_BOM = b"\xef\xbb\xbf"
+# Bytes searched at a time for the line breaks that end an NDJSON chunk.
+_BLOCK_BYTES = 64 * 1024
+
+
+def build_parser():
+    """
+    Build the argument parser of the ``jsonanatomy`` command.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        The configured parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="jsonanatomy",
+        description="Profile the fields of JSON, NDJSON and XML files.",
+    )
+    parser.add_argument("inputs", nargs="+", metavar="PATH",
+                        help="files or directories to profile")
+    parser.add_argument("--pattern", action="append", dest="patterns", metavar="GLOB",
+                        help="file name pattern for directory inputs (repeatable); "
+                             f"default: {' '.join(DEFAULT_PATTERNS)}")
+    parser.add_argument("-r", "--recursive", action="store_true",
+                        help="descend into subdirectories of directory inputs")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="treat every JSON input as newline-delimited JSON")
+    parser.add_argument("--format", choices=("text", "json"), default="text",
+                        help="output a human-readable table or a JSON report (default: text)")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="number of worker processes (default: 1)")
+    parser.add_argument("--sample", type=int, metavar="N",
+                        help="profile a random sample of at most N records per file")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="random seed for --sample (default: 0)")
+    parser.add_argument("--depth", type=int, default=1,
+                        help="number of nested object levels to profile; 0 for unlimited (default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=10000, metavar="N",
+                        help="JSON records (array elements, NDJSON lines or object members) "
+                             "decoded per chunk (default: 10000)")
+    return parser
+
+
+def main(argv=None):
+    """
+    Run the ``jsonanatomy`` command.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        The command-line arguments, by default ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        The exit status: 0 on success, 1 if no files were found or some
+        could not be profiled.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.chunk_size < 1 or (args.sample is not None and args.sample < 1):
+        parser.error("--workers, --chunk-size and --sample must be positive")
+
+    depth = args.depth if args.depth > 0 else None
+    report = _Report()
+    rng = random.Random(args.seed)
+    paths = _expand_inputs(args.inputs, args.patterns or DEFAULT_PATTERNS, args.recursive)
+
+    if args.workers > 1:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(args.workers) as executor:
+            futures = {}
+            for path in paths:
+                tasks = _plan_file(path, args, rng, report)
+                for task in tasks:
+                    futures[executor.submit(_profile_task, task, depth)] = path
+            for future in as_completed(futures):
+                try:
+                    report.merge(future.result())
+                except Exception as error:
+                    report.fail(futures[future], error)
+    else:
+        for path in paths:
+            for task in _plan_file(path, args, rng, report):
+                try:
+                    report.merge(_profile_task(task, depth))
+                except Exception as error:
+                    report.fail(path, error)
+                    break
+
+    if not report.files and not report.errors:
+        print("jsonanatomy: no matching files found", file=sys.stderr)
+        return 1
+    try:
+        if args.format == "json":
+            json.dump(report.to_dict(), sys.stdout, indent=2, ensure_ascii=False)
+            sys.stdout.write("\n")
+        else:
+            sys.stdout.write(report.to_text())
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The output was piped into a command that exited early (e.g. head).
+        sys.stdout = open(os.devnull, "w")
+    for path, message in report.errors:
+        print(f"jsonanatomy: {path}: {message}", file=sys.stderr)
+    return 1 if report.errors else 0
+
+
+class _Report:
+    """
+    Merged field statistics of all profiled files.
+
+    Attributes
+    ----------
+    files : set of str
+        The files that contributed records.
+    records : int
+        The number of profiled records.
+    sampled : bool
+        Whether any file was sampled.
+    fields : dict
+        A mapping of field path to ``[count, {type name: count}]``.
+    errors : list of tuple
+        ``(path, message)`` for each file that could not be profiled.
+    """
+    def __init__(self):
+        self.files = set()
+        self.records = 0
+        self.sampled = False
+        self.fields = {}
+        self.errors = []
+
+    def merge(self, result):
+        """
+        Add the result of one profiled chunk.
+
+        Parameters
+        ----------
+        result : tuple
+            ``(path, records, fields)`` as returned by ``_profile_task``.
+        """
+        path, records, fields = result
+        self.files.add(path)
+        self.records += records
+        for field, (count, types) in fields.items():
+            entry = self.fields.get(field)
+            if entry is None:
+                self.fields[field] = [count, types]
+                continue
+            entry[0] += count
+            merged = entry[1]
+            for type_name, type_count in types.items():
+                merged[type_name] = merged.get(type_name, 0) + type_count
+
+    def fail(self, path, error):
+        """
+        Record a file that could not be profiled.
+
+        Parameters
+        ----------
+        path : str
+            The file path.
+        error : Exception
+            The error raised while reading or profiling it. Only the first
+            error of each file is kept.
+        """
+        if any(failed == path for failed, _ in self.errors):
+            return
+        self.errors.append((path, f"{type(error).__name__}: {error}"))
+
+    def sorted_fields(self):
+        """
+        Get the fields ordered by decreasing count, then by path.
+
+        Returns
+        -------
+        list of tuple
+            ``(path, count, types)`` with types ordered by decreasing count.
+        """
+        rows = []
+        for field, (count, types) in self.fields.items():
+            ordered = dict(sorted(types.items(), key=lambda item: (-item[1], item[0])))
+            rows.append((field, count, ordered))
+        rows.sort(key=lambda row: (-row[1], row[0]))
+        return rows
+
+    def to_dict(self):
+        """
+        Build the machine-readable report.
+
+        Returns
+        -------
+        dict
+            The report, as written by ``--format json``.
+        """
+        return {
+            "files": len(self.files),
+            "records": self.records,
+            "sampled": self.sampled,
+            "fields": {field: {"count": count, "types": types} for field, count, types in self.sorted_fields()},
+            "errors": [{"path": path, "error": message} for path, message in self.errors],
+        }
+
+    def to_text(self):
+        """
+        Build the human-readable report.
+
+        Returns
+        -------
+        str
+            A summary line followed by a table of fields.
+        """
+        summary = f"{len(self.files)} file(s), {self.records} record(s)"
+        if self.sampled:
+            summary += " (sampled)"
+        rows = self.sorted_fields()
+        if not rows:
+            return summary + "\nno fields found\n"
+        width = max(len("field"), max(len(field) for field, _, _ in rows))
+        lines = [summary, f"{'field':<{width}}  {'count':>10}  {'%':>6}  types"]
+        for field, count, types in rows:
+            share = 100.0 * count / self.records if self.records else 0.0
+            described = ", ".join(
+                name if len(types) == 1 else f"{name} {type_count}" for name, type_count in types.items()
+            )
+            lines.append(f"{field:<{width}}  {count:>10}  {share:>6.1f}  {described}")
+        return "\n".join(lines) + "\n"
+
+
+def _expand_inputs(inputs, patterns, recursive):
+    """
+    Expand file and directory arguments into file paths.
+
+    Parameters
+    ----------
+    inputs : list of str
+        The paths given on the command line.
+    patterns : list of str
+        The file name patterns for directories.
+    recursive : bool
+        Whether to descend into subdirectories.
+
+    Yields
+    ------
+    str
+        Each file path, once.
+    """
+    from .file_reader import iter_json_file_paths
+
+    seen = set()
+    for path in inputs:
+        if not os.path.isdir(path):
+            if path not in seen:
+                seen.add(path)
+                yield path
+            continue
+        for pattern in patterns:
+            for file_path in iter_json_file_paths(path, pattern, recursive=recursive):
+                if file_path not in seen:
+                    seen.add(file_path)
+                    yield file_path
+
+
+def _plan_file(path, args, rng, report):
+    """
+    Split a file into chunk tasks for ``_profile_task``.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+    args : argparse.Namespace
+        The parsed command-line arguments.
+    rng : random.Random
+        The random generator used for sampling.
+    report : _Report
+        The report, which receives planning errors and is marked as sampled.
+
+    Returns
+    -------
+    list of tuple
+        The tasks; empty if the file could not be read.
+    """
+    try:
+        kind = _file_kind(path, args.ndjson)
+        if kind == "array":
+            return _plan_array(path, args.chunk_size, args.sample, rng, report)
+        if kind == "ndjson":
+            return _plan_ndjson(path, args.chunk_size, args.sample, rng, report)
+        if kind == "json":
+            return _plan_object(path, args.chunk_size, args.sample, rng, report)
+        if args.sample is not None:
+            report.sampled = True
+        return [("xml", path, args.sample, rng.random())]
+    except Exception as error:
+        report.fail(path, error)
+        return []
+
+
+def _file_kind(path, ndjson):
+    """
+    Determine how a file is read.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+    ndjson : bool
+        Whether JSON files are newline-delimited.
+
+    Returns
+    -------
+    str
+        ``"xml"``, ``"ndjson"``, ``"array"`` (a top-level JSON array) or
+        ``"json"`` (any other JSON document).
+
+    Raises
+    ------
+    ValueError
+        If the file is empty.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".xml":
+        return "xml"
+    if ndjson or extension in _NDJSON_EXTENSIONS:
+        return "ndjson"
+    with open(path, "rb") as file:
+        head = file.read(4096)
+        while head and not head.lstrip(_UTF8_BOM + b" \t\r\n"):
+            head = file.read(4096)
+    head = head.lstrip(_UTF8_BOM + b" \t\r\n")
+    if not head:
+        raise ValueError("file is empty")
+    return "array" if head[:1] == b"[" else "json"
+
+
+def _plan_array(path, chunk_size, sample, rng, report):
+    """
+    Split a top-level JSON array into element ranges or sampled spans.
+
+    The elements are located with the byte scanner in one streaming pass,
+    and only the first and last offsets of each chunk are kept, so planning
+    does not build an index of every element.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+    chunk_size : int
+        The number of elements per task.
+    sample : int or None
+        The number of elements to sample, if any.
+    rng : random.Random
+        The random generator used for sampling.
+    report : _Report
+        The report, which is marked as sampled if elements are skipped.
+
+    Returns
+    -------
+    list of tuple
+        ``("range", path, start, end)`` or ``("spans", path, spans)`` tasks.
+
+    Raises
+    ------
+    ValueError
+        If the array is not terminated.
+    """
+    from ._scan import array_spans, skip_whitespace
+
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        start = len(_UTF8_BOM) if buf[:len(_UTF8_BOM)] == _UTF8_BOM else 0
+        start = skip_whitespace(buf, start)
+        if sample is not None:
+            return _plan_sample(path, array_spans(buf, start), chunk_size, sample, rng, report)
+        tasks = []
+        count = 0
+        for element_start, element_end in array_spans(buf, start):
+            if count == 0:
+                chunk_start = element_start
+            count += 1
+            if count == chunk_size:
+                tasks.append(("range", path, chunk_start, element_end))
+                count = 0
+        if count:
+            tasks.append(("range", path, chunk_start, element_end))
+        return tasks or [("spans", path, [])]
+
+
+def _plan_ndjson(path, chunk_size, sample, rng, report):
+    """
+    Split an NDJSON file into ranges of lines or sampled spans.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+    chunk_size : int
+        The number of lines per task.
+    sample : int or None
+        The number of lines to sample, if any.
+    rng : random.Random
+        The random generator used for sampling.
+    report : _Report
+        The report, which is marked as sampled if lines are skipped.
+
+    Returns
+    -------
+    list of tuple
+        ``("lines", path, start, end)`` or ``("spans", path, spans)`` tasks.
+    """
+    from .file_reader import _line_spans
+
+    size = os.path.getsize(path)
+    if size == 0:
+        return [("spans", path, [])]
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        start = len(_UTF8_BOM) if buf[:len(_UTF8_BOM)] == _UTF8_BOM else 0
+        if sample is not None:
+            return _plan_sample(path, _line_spans(buf, start), chunk_size, sample, rng, report)
+        tasks = []
+        while start < size:
+            end = _skip_lines(buf, start, chunk_size, size)
+            tasks.append(("lines", path, start, end))
+            start = end
+        return tasks
+
+
+def _skip_lines(buf, position, count, size):
+    """
+    Find the end of a number of lines.
+
+    Blocks holding fewer line breaks than remain are skipped with one
+    ``bytes.count`` each, so only the lines of the final block are located
+    one by one.
+
+    Parameters
+    ----------
+    buf : mmap.mmap
+        The mapped file.
+    position : int
+        The start of the first line.
+    count : int
+        The number of lines.
+    size : int
+        The size of the file.
+
+    Returns
+    -------
+    int
+        The position after the last of the lines, or ``size`` if the file
+        ends first.
+    """
+    while position < size:
+        block_end = min(position + _BLOCK_BYTES, size)
+        block = buf[position:block_end]
+        breaks = block.count(b"\n")
+        if breaks < count:
+            count -= breaks
+            position = block_end
+            continue
+        offset = 0
+        for _ in range(count):
+            offset = block.find(b"\n", offset) + 1
+        return position + offset
+    return size
+
+
+def _plan_object(path, chunk_size, sample, rng, report):
+    """
+    Split a JSON document other than an array into ranges of object members.
+
+    The members of a top-level object are located with the byte scanner,
+    without decoding them. A top-level scalar has no records.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+    chunk_size : int
+        The number of members per task.
+    sample : int or None
+        The number of members to sample, if any.
+    rng : random.Random
+        The random generator used for sampling.
+    report : _Report
+        The report, which is marked as sampled if members are skipped.
+
+    Returns
+    -------
+    list of tuple
+        ``("members", path, start, end)`` or ``("spans", path, spans)``
+        tasks.
+
+    Raises
+    ------
+    ValueError
+        If the document is malformed.
+    """
+    from ._scan import object_spans, skip_whitespace
+
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        start = len(_UTF8_BOM) if buf[:len(_UTF8_BOM)] == _UTF8_BOM else 0
+        start = skip_whitespace(buf, start)
+        if buf[start:start + 1] != b"{":
+            json.loads(buf[start:])
+            return [("spans", path, [])]
+        if sample is not None:
+            spans = ((value_start, value_end) for _, _, value_start, value_end in object_spans(buf, start))
+            return _plan_sample(path, spans, chunk_size, sample, rng, report)
+        tasks = []
+        count = 0
+        for key_start, _, _, value_end in object_spans(buf, start):
+            if count == 0:
+                chunk_start = key_start
+            count += 1
+            if count == chunk_size:
+                tasks.append(("members", path, chunk_start, value_end))
+                count = 0
+        if count:
+            tasks.append(("members", path, chunk_start, value_end))
+        return tasks or [("spans", path, [])]
+
+
+def _plan_sample(path, spans, chunk_size, sample, rng, report):
+    """
+    Split a random sample of record spans into tasks.
+
+    Uses reservoir sampling, so records are only located, not decoded, and
+    at most ``sample`` spans are held.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+    spans : iterable of tuple
+        The ``(start, end)`` byte spans of the records, in file order.
+    chunk_size : int
+        The number of records per task.
+    sample : int
+        The number of records to sample.
+    rng : random.Random
+        The random generator used for sampling.
+    report : _Report
+        The report, which is marked as sampled if records are skipped.
+
+    Returns
+    -------
+    list of tuple
+        ``("spans", path, spans)`` tasks, in file order.
+    """
+    reservoir = []
+    count = 0
+    for span in spans:
+        count += 1
+        if len(reservoir) < sample:
+            reservoir.append(span)
+        else:
+            slot = rng.randrange(count)
+            if slot < sample:
+                reservoir[slot] = span
+    if count > sample:
+        report.sampled = True
+    reservoir.sort()
+    return [("spans", path, reservoir[i:i + chunk_size]) for i in range(0, len(reservoir), chunk_size)]
+
+
+def _profile_task(task, depth):
+    """
+    Profile the records of one chunk of a file.
+
+    Runs in worker processes, so it only receives picklable task tuples.
+
+    Parameters
+    ----------
+    task : tuple
+        A task created by ``_plan_file``.
+    depth : int or None
+        The number of object levels to profile, or None for unlimited.
+
+    Returns
+    -------
+    tuple
+        ``(path, records, fields)``, where ``fields`` maps field path to
+        ``[count, {type name: count}]``.
+    """
+    path = task[1]
+    counts = {}
+    records = 0
+    for record in _iter_task_records(task):
+        records += 1
+        _profile_record(record, depth, counts)
+    fields = {}
+    for value_type, counter in counts.items():
+        type_name = _type_name(value_type)
+        for field, count in counter.items():
+            entry = fields.get(field)
+            if entry is None:
+                entry = fields[field] = [0, {}]
+            entry[0] += count
+            types = entry[1]
+            types[type_name] = types.get(type_name, 0) + count
+    return (path, records, fields)
+
+
+def _iter_task_records(task):
+    """
+    Decode the records of one task.
+
+    Parameters
+    ----------
+    task : tuple
+        A task created by ``_plan_file``.
+
+    Yields
+    ------
+    any
+        Each record of the chunk.
+    """
+    kind, path = task[0], task[1]
+    if kind == "xml":
+        for record in _iter_xml_records(path, task[2], task[3]):
+            yield record
+        return
+    if kind == "spans" and not task[2]:
+        return
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        if kind == "range":
+            for record in json.loads("[" + buf[task[2]:task[3]].decode("utf-8") + "]"):
+                yield record
+        elif kind == "members":
+            for record in json.loads("{" + buf[task[2]:task[3]].decode("utf-8") + "}").values():
+                yield record
+        elif kind == "spans":
+            for start, end in task[2]:
+                yield json.loads(buf[start:end])
+        else:
+            position, end = task[2], task[3]
+            while position < end:
+                line_end = buf.find(b"\n", position, end)
+                if line_end == -1:
+                    line_end = end
+                line = buf[position:line_end]
+                if line.strip():
+                    yield json.loads(line)
+                position = line_end + 1
+
+
+def _iter_xml_records(path, sample, seed):
+    """
+    Yield the children of the root element of an XML document.
+
+    The document is parsed incrementally and each child is converted as for
+    ``SimpleXML.to_dict`` once it is complete, then removed from the tree, so
+    only one child (or the sampled children) is held at a time. Repeated
+    sibling tags are separate records.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+    sample : int or None
+        The number of children to sample, if any.
+    seed : float
+        The seed of the sampling generator.
+
+    Yields
+    ------
+    any
+        Each (sampled) child, as a dict, a string or None.
+
+    Raises
+    ------
+    xml.etree.ElementTree.ParseError
+        If the document is malformed.
+    """
+    import xml.etree.ElementTree as ET
+
+    from .SimpleXML import _element_to_dict
+
+    rng = random.Random(seed)
+    reservoir = []
+    count = 0
+    root = None
+    level = 0
+    for event, element in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            level += 1
+            continue
+        level -= 1
+        if level != 1:
+            continue
+        record = _element_to_dict(element)
+        # Drop the finished child (and any before it) from the root.
+        root.clear()
+        if sample is None:
+            yield record
+            continue
+        if len(reservoir) < sample:
+            reservoir.append((count, record))
+        else:
+            slot = rng.randrange(count + 1)
+            if slot < sample:
+                reservoir[slot] = (count, record)
+        count += 1
+    reservoir.sort(key=_position)
+    for _, record in reservoir:
+        yield record
+
+
+def _position(entry):
+    """
+    Get the position of a ``(position, record)`` reservoir entry.
+    """
+    return entry[0]
+
+
+def _profile_record(record, depth, counts):
+    """
+    Count the fields of one record and their types.
+
+    Parameters
+    ----------
+    record : any
+        The record; records that are not objects have no fields.
+    depth : int or None
+        The number of object levels to profile, or None for unlimited.
+    counts : dict
+        The mapping of value type to a mapping of field path to count, to
+        update. Keying by type first keeps the inner loop free of type name
+        lookups and per-field allocations.
+    """
+    if type(record) not in OBJECT_TYPES:
+        return
+    stack = [(record, "", 1)]
+    while stack:
+        value, prefix, level = stack.pop()
+        expand = depth is None or level < depth
+        for key, child in value.items():
+            field = prefix + key if type(key) is str else prefix + str(key)
+            child_type = type(child)
+            counter = counts.get(child_type)
+            if counter is None:
+                counter = counts[child_type] = {}
+            counter[field] = counter.get(field, 0) + 1
+            if expand and child_type in OBJECT_TYPES:
+                stack.append((child, field + ".", level + 1))
+
+
+def _type_name(value_type):
+    """
+    Get the JSON type name of a value type.
+
+    Parameters
+    ----------
+    value_type : type
+        The type of a value.
+
+    Returns
+    -------
+    str
+        One of "object", "array", "string", "integer", "number", "boolean"
+        and "null", or the Python type name for other values.
+    """
+    if value_type is str:
+        return "string"
+    if value_type is type(None):
+        return "null"
+    if value_type is bool:
+        return "boolean"
+    if value_type is int:
+        return "integer"
+    if value_type is float:
+        return "number"
+    if value_type in OBJECT_TYPES:
+        return "object"
+    if value_type in ARRAY_TYPES:
+        return "array"
+    return value_type.__name__
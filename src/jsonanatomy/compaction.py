@@ -0,0 +1,328 @@
+"""
+Memory compaction of loaded JSON documents.
+
+This module interns dictionary keys and short string values and, on
+request, hash-conses identical small subtrees, so that a document with
+millions of repeated keys and repeated small objects (for example the same
+currency descriptor in every record) keeps one shared copy of each. The
+result is made of ordinary dicts and lists, so ``Maybe``, ``Explore`` and
+``Xplore`` navigate it unchanged.
+
+Interning strings is invisible to callers, since strings are immutable.
+Shared subtrees are the same Python objects in several places of the
+document, so subtree sharing is opt-in (``share_subtrees=True``) and a
+document compacted with it must be treated as read-only: mutating a shared
+subtree changes it everywhere it occurs.
+"""
+
+import json
+import sys
+
+
+def compact(data, intern_strings=True, share_subtrees=False, max_string_length=64, max_subtree_size=32,
+            measure=True):
+    """
+    Build a compacted copy of a JSON document.
+
+    Parameters
+    ----------
+    data : any
+        The document, as returned by ``read_json_file``.
+    intern_strings : bool, optional
+        If True, intern dictionary keys and share equal string values of at
+        most ``max_string_length`` characters, by default True.
+    share_subtrees : bool, optional
+        If True, replace equal objects and arrays of at most
+        ``max_subtree_size`` members by one shared instance, by default
+        False. The result must then be treated as read-only, since changing
+        a shared subtree changes every place it occurs.
+    max_string_length : int, optional
+        The longest string value that is shared, by default 64.
+    max_subtree_size : int, optional
+        The largest number of direct members of a shared subtree, by
+        default 32. Subtrees are compared bottom-up, so a small object whose
+        members are themselves shared is matched in constant time per member.
+    measure : bool, optional
+        If True, compute the memory footprint before and after compaction
+        (an extra traversal of each document), by default True.
+
+    Returns
+    -------
+    tuple
+        ``(compacted, report)``, where ``report`` is a dict with the keys
+        ``'bytes_before'``, ``'bytes_after'`` and ``'bytes_saved'`` (None if
+        ``measure`` is False), ``'shared_strings'`` and ``'shared_subtrees'``
+        (the number of string values and subtrees replaced by shared
+        instances).
+
+    Examples
+    --------
+    >>> price = {'currency': 'USD', 'unit': 'cents'}
+    >>> records = [{'id': i, 'price': dict(price)} for i in range(3)]
+    >>> compacted, report = compact(records, share_subtrees=True)
+    >>> compacted[0]['price'] is compacted[2]['price']
+    True
+    >>> report['shared_subtrees']
+    2
+    >>> Maybe(compacted)[1]['price']['unit'].value()
+    'cents'
+    """
+    compactor = _Compactor(intern_strings, share_subtrees, max_string_length, max_subtree_size)
+    bytes_before = deep_sizeof(data) if measure else None
+    compacted = compactor.value(data)
+    bytes_after = deep_sizeof(compacted) if measure else None
+    report = {
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "bytes_saved": bytes_before - bytes_after if measure else None,
+        "shared_strings": compactor.shared_strings,
+        "shared_subtrees": compactor.shared_subtrees,
+    }
+    return compacted, report
+
+
+def load_compact(file_path, encoding="utf-8", intern_strings=True, share_subtrees=False, max_string_length=64,
+                 max_subtree_size=32, batch_size=10000):
+    """
+    Read a JSON file and compact it while it is loaded.
+
+    A file whose top-level value is an array is decoded in batches through a
+    ``JSONArrayFile`` and each batch is compacted before the next one is
+    read, so the fully decoded document is never held in memory at once:
+    the peak is the compacted result plus the sharing tables and one batch.
+    Other files are decoded in one piece and then compacted.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the JSON file.
+    encoding : str, optional
+        The file encoding, by default "utf-8".
+    intern_strings, share_subtrees, max_string_length, max_subtree_size : optional
+        As for ``compact``.
+    batch_size : int, optional
+        The number of array elements decoded at a time, by default 10000.
+
+    Returns
+    -------
+    any
+        The compacted document.
+
+    Examples
+    --------
+    >>> records = load_compact('/path/to/records.json')
+    >>> Xplore(records)[0]['price']['currency'].value()
+    'USD'
+    """
+    from .JSONArrayFile import JSONArrayFile
+
+    compactor = _Compactor(intern_strings, share_subtrees, max_string_length, max_subtree_size)
+    try:
+        array_file = JSONArrayFile(file_path, encoding)
+    except ValueError:
+        array_file = None
+    if array_file is None:
+        with open(file_path, "r", encoding=encoding) as file:
+            return compactor.value(json.load(file))
+    with array_file:
+        items = []
+        for batch in array_file.iter_batches(batch_size):
+            items.extend(compactor.value(element) for element in batch)
+    return compactor.sequence(items)
+
+
+def deep_sizeof(data):
+    """
+    Estimate the memory footprint of a document.
+
+    Every distinct object reachable from ``data`` is counted once with
+    ``sys.getsizeof``, so shared keys, strings and subtrees are not counted
+    repeatedly.
+
+    Parameters
+    ----------
+    data : any
+        The document to measure.
+
+    Returns
+    -------
+    int
+        The total size in bytes.
+
+    Examples
+    --------
+    >>> deep_sizeof({'a': [1, 2]}) > 0
+    True
+    """
+    seen = set()
+    total = 0
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        total += sys.getsizeof(value)
+        value_type = type(value)
+        if value_type is dict:
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif value_type is list:
+            stack.extend(value)
+    return total
+
+
+class _Compactor:
+    """
+    Interning and hash-consing tables for one compaction.
+
+    Parameters
+    ----------
+    intern_strings, share_subtrees, max_string_length, max_subtree_size
+        As for ``compact``.
+    """
+    def __init__(self, intern_strings, share_subtrees, max_string_length, max_subtree_size):
+        self.intern_strings = intern_strings
+        self.share_subtrees = share_subtrees
+        self.max_string_length = max_string_length
+        self.max_subtree_size = max_subtree_size
+        self.strings = {}
+        self.subtrees = {}
+        self.shared_strings = 0
+        self.shared_subtrees = 0
+
+    def value(self, value):
+        """
+        Compact a value recursively.
+
+        Parameters
+        ----------
+        value : any
+            The value to compact.
+
+        Returns
+        -------
+        any
+            The compacted value.
+        """
+        value_type = type(value)
+        if value_type is str:
+            return self.string(value)
+        if value_type is dict:
+            return self.mapping([(self.key(key), self.value(child)) for key, child in value.items()])
+        if value_type is list:
+            return self.sequence([self.value(child) for child in value])
+        return value
+
+    def key(self, key):
+        """
+        Intern a dictionary key.
+
+        Parameters
+        ----------
+        key : str
+            The key.
+
+        Returns
+        -------
+        str
+            The interned key.
+        """
+        if self.intern_strings and type(key) is str:
+            return sys.intern(key)
+        return key
+
+    def string(self, value):
+        """
+        Share a short string value.
+
+        Parameters
+        ----------
+        value : str
+            The string.
+
+        Returns
+        -------
+        str
+            The shared instance of an equal string.
+        """
+        if not self.intern_strings or len(value) > self.max_string_length:
+            return value
+        shared = self.strings.setdefault(value, value)
+        if shared is not value:
+            self.shared_strings += 1
+        return shared
+
+    def mapping(self, pairs):
+        """
+        Build an object from compacted pairs, sharing an equal instance.
+
+        Parameters
+        ----------
+        pairs : list of tuple
+            The compacted ``(key, value)`` pairs.
+
+        Returns
+        -------
+        dict
+            The new object or a previously built equal one.
+        """
+        if not self.share_subtrees or len(pairs) > self.max_subtree_size:
+            return dict(pairs)
+        signature = (dict,) + tuple((key, _identity(child)) for key, child in pairs)
+        shared = self.subtrees.get(signature)
+        if shared is None:
+            shared = dict(pairs)
+            self.subtrees[signature] = shared
+        else:
+            self.shared_subtrees += 1
+        return shared
+
+    def sequence(self, items):
+        """
+        Build an array from compacted items, sharing an equal instance.
+
+        Parameters
+        ----------
+        items : list
+            The compacted items.
+
+        Returns
+        -------
+        list
+            The given list or a previously built equal one.
+        """
+        if not self.share_subtrees or len(items) > self.max_subtree_size:
+            return items
+        signature = (list,) + tuple(_identity(child) for child in items)
+        shared = self.subtrees.get(signature)
+        if shared is None:
+            self.subtrees[signature] = items
+            return items
+        self.shared_subtrees += 1
+        return shared
+
+
+def _identity(value):
+    """
+    Get the hash-consing signature of an already compacted child.
+
+    Parameters
+    ----------
+    value : any
+        The child value.
+
+    Returns
+    -------
+    tuple
+        ``(type, id)`` for containers, which are canonical instances once
+        compacted, and ``(type, value)`` for scalars so that equal values of
+        different types (``1``, ``1.0`` and ``True``) are kept apart. Floats
+        use their ``repr``, which also tells ``0.0`` from ``-0.0``.
+    """
+    value_type = type(value)
+    if value_type is dict or value_type is list:
+        return (value_type, id(value))
+    if value_type is float:
+        return (value_type, repr(value))
+    return (value_type, value)
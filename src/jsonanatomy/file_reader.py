@@ -5,20 +5,36 @@ This module provides utility functions for finding and reading JSON files
 from the filesystem with proper error handling.
 """
 
+import fnmatch
 import glob
 import json
 import os
+import queue
+import threading
 
-def get_json_file_paths(base_path, pattern="*.json"):
+SYMLINK_POLICIES = ("files", "follow", "skip")
+
+def get_json_file_paths(base_path, pattern="*.json", recursive=False, include=None, exclude=None,
+                        min_size=None, max_size=None, modified_after=None, modified_before=None,
+                        symlinks="files", workers=None):
     """
     Find JSON files in a directory using glob patterns.
 
+    This is the list-returning form of ``iter_json_file_paths``; see that
+    function for a description of the filtering options.
+
     Parameters
     ----------
     base_path : str
         The base directory path to search for JSON files.
     pattern : str, optional
-        The glob pattern to match files, by default "*.json".
+        The glob pattern to match files, by default "*.json". With
+        ``recursive=True``, a pattern containing a path separator is matched
+        against the path relative to ``base_path``.
+    recursive : bool, optional
+        If True, also search all nested subdirectories, by default False.
+    include, exclude, min_size, max_size, modified_after, modified_before, symlinks, workers : optional
+        Filtering and scanning options forwarded to ``iter_json_file_paths``.
 
     Returns
     -------
@@ -34,11 +50,373 @@ def get_json_file_paths(base_path, pattern="*.json"):
     >>> custom_files = get_json_file_paths('/path/to/data', 'config*.json')
     >>> print(custom_files)
     ['/path/to/data/config_dev.json', '/path/to/data/config_prod.json']
+
+    >>> nested_files = get_json_file_paths('/path/to/data', recursive=True, exclude=['tmp'])
+    >>> print(nested_files)
+    ['/path/to/data/file1.json', '/path/to/data/2024/01/events.json']
     """
-    json_files = glob.glob(os.path.join(base_path, pattern))
-    return json_files
+    if not recursive and (os.sep in pattern or "/" in pattern):
+        # Patterns spanning directories keep their original glob semantics.
+        return glob.glob(os.path.join(base_path, pattern))
+    return list(iter_json_file_paths(
+        base_path, pattern, recursive=recursive, include=include, exclude=exclude,
+        min_size=min_size, max_size=max_size, modified_after=modified_after,
+        modified_before=modified_before, symlinks=symlinks, workers=workers,
+    ))
 
-def read_json_file(file_path, encoding="utf-8"):
+def iter_json_file_paths(base_path, pattern="*.json", recursive=True, include=None, exclude=None,
+                         min_size=None, max_size=None, modified_after=None, modified_before=None,
+                         symlinks="files", workers=None):
+    """
+    Lazily scan a directory tree for JSON files using ``os.scandir``.
+
+    Paths are yielded as soon as they are found, so loading can start before
+    the scan finishes. Each directory is listed with a single ``scandir``
+    call and file metadata is only requested when a size or time filter is
+    active. Hidden entries (names starting with ".") are skipped unless the
+    pattern itself starts with ".", matching the behavior of ``glob``.
+
+    Parameters
+    ----------
+    base_path : str
+        The base directory path to search for JSON files.
+    pattern : str, optional
+        The glob pattern matched against file names, by default "*.json".
+        A pattern containing a path separator, such as "sub/*.json", is
+        matched against the path relative to ``base_path`` instead (using
+        "/" as separator; as with ``include``, "*" also matches "/").
+    recursive : bool, optional
+        If True, descend into nested subdirectories, by default True.
+    include : list of str, optional
+        Glob patterns matched against the path relative to ``base_path``
+        (using "/" as separator). When given, a file must match at least one.
+    exclude : list of str, optional
+        Glob patterns matched against both the entry name and its relative
+        path. Matching files are skipped and matching directories are not
+        descended into.
+    min_size, max_size : int, optional
+        Inclusive bounds on the file size in bytes.
+    modified_after, modified_before : float, optional
+        Exclusive bounds on the file modification time, as a POSIX timestamp.
+    symlinks : {"files", "follow", "skip"}, optional
+        How symbolic links are treated, by default "files": symlinked files
+        are yielded but symlinked directories are not descended into.
+        "follow" also descends into symlinked directories (each directory is
+        visited at most once), and "skip" ignores all symlinks.
+    workers : int, optional
+        If greater than 1 and ``recursive`` is True, the top-level
+        subdirectories are scanned concurrently by this many threads. Paths
+        are then yielded in no particular order.
+
+    Yields
+    ------
+    str
+        The path of each matching file, joined onto ``base_path``.
+
+    Raises
+    ------
+    ValueError
+        If ``symlinks`` is not one of the supported policies.
+
+    Examples
+    --------
+    >>> for path in iter_json_file_paths('/data/events', exclude=['_tmp*']):
+    ...     data = read_json_file(path)
+
+    >>> recent = iter_json_file_paths('/data/events', modified_after=1735689600, workers=8)
+    >>> first = next(recent)  # Available before the scan has finished
+
+    Notes
+    -----
+    Directories that cannot be listed (for example due to permissions, or
+    because ``base_path`` does not exist) are silently skipped, as ``glob``
+    does.
+    """
+    if symlinks not in SYMLINK_POLICIES:
+        raise ValueError(f"symlinks must be one of {SYMLINK_POLICIES}, got {symlinks!r}")
+    path_filter = _PathFilter(pattern, include, exclude, min_size, max_size,
+                              modified_after, modified_before, symlinks)
+    if symlinks == "follow":
+        try:
+            path_filter.visit(os.stat(base_path))
+        except OSError:
+            pass
+    if workers is not None and workers > 1 and recursive:
+        return _scan_parallel(base_path, path_filter, workers)
+    return _scan_tree(base_path, "", path_filter, recursive)
+
+class _PathFilter:
+    """
+    Compiled file and directory selection rules for the directory scanner.
+
+    Parameters
+    ----------
+    pattern : str
+        The glob pattern matched against file names, or against relative
+        paths if it contains a path separator.
+    include, exclude : list of str or None
+        Glob patterns matched against relative paths (and names for exclude).
+    min_size, max_size : int or None
+        Inclusive bounds on the file size in bytes.
+    modified_after, modified_before : float or None
+        Exclusive bounds on the modification time.
+    symlinks : str
+        The symlink policy, one of ``SYMLINK_POLICIES``.
+    """
+    def __init__(self, pattern, include, exclude, min_size, max_size,
+                 modified_after, modified_before, symlinks):
+        self.pattern = pattern.replace(os.sep, "/")
+        self.match_path = "/" in self.pattern
+        self.include = list(include) if include else None
+        self.exclude = list(exclude) if exclude else None
+        self.min_size = min_size
+        self.max_size = max_size
+        self.modified_after = modified_after
+        self.modified_before = modified_before
+        self.symlinks = symlinks
+        self.show_hidden = pattern.startswith(".")
+        self.needs_stat = any(bound is not None for bound in (min_size, max_size, modified_after, modified_before))
+        self.visited = set()
+        self.visited_lock = threading.Lock()
+
+    def is_excluded(self, name, rel_path):
+        """
+        Check whether an entry is hidden or matches an exclude pattern.
+
+        Parameters
+        ----------
+        name : str
+            The entry name.
+        rel_path : str
+            The entry path relative to the scan root.
+
+        Returns
+        -------
+        bool
+            True if the entry should be skipped.
+        """
+        if not self.show_hidden and name.startswith("."):
+            return True
+        if self.exclude:
+            for exclude in self.exclude:
+                if fnmatch.fnmatch(name, exclude) or fnmatch.fnmatch(rel_path, exclude):
+                    return True
+        return False
+
+    def descend(self, entry):
+        """
+        Check whether the scanner should list a directory entry.
+
+        Parameters
+        ----------
+        entry : os.DirEntry
+            A directory entry of the directory being scanned.
+
+        Returns
+        -------
+        bool
+            True if the entry is a directory that should be scanned.
+        """
+        try:
+            if entry.is_symlink():
+                if self.symlinks != "follow" or not entry.is_dir():
+                    return False
+                return self.visit(entry.stat())
+            if not entry.is_dir(follow_symlinks=False):
+                return False
+            if self.symlinks == "follow":
+                # Real directories are recorded too, so a link to a sibling
+                # or back to an ancestor is not scanned a second time.
+                return self.visit(entry.stat(follow_symlinks=False))
+            return True
+        except OSError:
+            return False
+
+    def visit(self, stat):
+        """
+        Record a directory as visited when following symlinks.
+
+        Parameters
+        ----------
+        stat : os.stat_result
+            The status of the directory.
+
+        Returns
+        -------
+        bool
+            True if the directory had not been visited before.
+        """
+        key = (stat.st_dev, stat.st_ino)
+        with self.visited_lock:
+            if key in self.visited:
+                return False
+            self.visited.add(key)
+        return True
+
+    def match_file(self, entry, rel_path):
+        """
+        Check whether a directory entry is a file that should be yielded.
+
+        Parameters
+        ----------
+        entry : os.DirEntry
+            A directory entry of the directory being scanned.
+        rel_path : str
+            The entry path relative to the scan root.
+
+        Returns
+        -------
+        bool
+            True if the entry matches the pattern and all filters.
+        """
+        if not fnmatch.fnmatch(rel_path if self.match_path else entry.name, self.pattern):
+            return False
+        if self.include and not any(fnmatch.fnmatch(rel_path, include) for include in self.include):
+            return False
+        try:
+            if entry.is_symlink() and self.symlinks == "skip":
+                return False
+            if not entry.is_file():
+                return False
+            if self.needs_stat:
+                stat = entry.stat()
+                if self.min_size is not None and stat.st_size < self.min_size:
+                    return False
+                if self.max_size is not None and stat.st_size > self.max_size:
+                    return False
+                if self.modified_after is not None and stat.st_mtime <= self.modified_after:
+                    return False
+                if self.modified_before is not None and stat.st_mtime >= self.modified_before:
+                    return False
+        except OSError:
+            return False
+        return True
+
+def _scan_tree(directory, rel_prefix, path_filter, recursive, stop=None):
+    """
+    Depth-first generator over the matching files below a directory.
+
+    Parameters
+    ----------
+    directory : str
+        The directory to scan.
+    rel_prefix : str
+        The path of ``directory`` relative to the scan root ("" for the root).
+    path_filter : _PathFilter
+        The selection rules to apply.
+    recursive : bool
+        If True, descend into subdirectories.
+    stop : threading.Event, optional
+        When set, the scan ends at the next directory boundary.
+
+    Yields
+    ------
+    str
+        The path of each matching file.
+    """
+    stack = [(directory, rel_prefix)]
+    while stack:
+        if stop is not None and stop.is_set():
+            return
+        current, prefix = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    rel_path = prefix + entry.name
+                    if path_filter.is_excluded(entry.name, rel_path):
+                        continue
+                    if recursive and path_filter.descend(entry):
+                        subdirs.append((entry.path, rel_path + "/"))
+                    elif path_filter.match_file(entry, rel_path):
+                        yield entry.path
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+def _scan_parallel(base_path, path_filter, workers, batch_size=256):
+    """
+    Scan the top-level subdirectories of ``base_path`` concurrently.
+
+    Files directly inside ``base_path`` are yielded first; each top-level
+    subdirectory is then walked by a worker thread that hands batches of
+    paths back through a bounded queue.
+
+    Parameters
+    ----------
+    base_path : str
+        The directory to scan.
+    path_filter : _PathFilter
+        The selection rules to apply.
+    workers : int
+        The number of worker threads.
+    batch_size : int, optional
+        The number of paths handed over per queue item, by default 256.
+
+    Yields
+    ------
+    str
+        The path of each matching file, in no particular order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    subdirs = []
+    try:
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                if path_filter.is_excluded(entry.name, entry.name):
+                    continue
+                if path_filter.descend(entry):
+                    subdirs.append((entry.path, entry.name + "/"))
+                elif path_filter.match_file(entry, entry.name):
+                    yield entry.path
+    except OSError:
+        return
+    if not subdirs:
+        return
+
+    results = queue.Queue(maxsize=workers * 4)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def scan_subdir(directory, rel_prefix):
+        try:
+            batch = []
+            for path in _scan_tree(directory, rel_prefix, path_filter, True, stop):
+                batch.append(path)
+                if len(batch) >= batch_size:
+                    put(batch)
+                    batch = []
+            if batch:
+                put(batch)
+        finally:
+            put(done)
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for directory, rel_prefix in subdirs:
+            executor.submit(scan_subdir, directory, rel_prefix)
+        remaining = len(subdirs)
+        while remaining:
+            item = results.get()
+            if item is done:
+                remaining -= 1
+                continue
+            for path in item:
+                yield path
+    finally:
+        stop.set()
+        executor.shutdown(wait=False)
+
+def read_json_file(file_path, encoding="utf-8", lazy=False, compact=False):
     """
     Read and parse a JSON file with error handling.
 
@@ -48,11 +426,21 @@ def read_json_file(file_path, encoding="utf-8"):
         The absolute path to the JSON file to read.
     encoding : str, optional
         The file encoding to use when reading, by default "utf-8".
+    lazy : bool, optional
+        If True, memory-map the file and return a lazily decoded proxy
+        (see ``jsonanatomy.lazy``) instead of decoding the whole document,
+        by default False. Lazy loading requires a UTF-8 encoded file, and
+        malformed JSON is only reported when the affected part is accessed.
+    compact : bool, optional
+        If True, intern keys and short strings while loading (see
+        ``jsonanatomy.compaction.load_compact``, which can also share
+        identical small subtrees), by default False.
 
     Returns
     -------
     dict or list
-        The parsed JSON data structure.
+        The parsed JSON data structure, or a ``LazyObject``/``LazyArray``
+        proxy when ``lazy`` is True.
 
     Raises
     ------
@@ -60,6 +448,9 @@ def read_json_file(file_path, encoding="utf-8"):
         If the specified file does not exist.
     json.JSONDecodeError
         If the file contents are not valid JSON.
+    ValueError
+        If ``lazy`` is True and ``encoding`` is not UTF-8, or both ``lazy``
+        and ``compact`` are True.
 
     Examples
     --------
@@ -70,10 +461,262 @@ def read_json_file(file_path, encoding="utf-8"):
     >>> data = read_json_file('/path/to/array.json')
     >>> print(type(data))
     <class 'list'>
+
+    >>> doc = read_json_file('/path/to/large.json', lazy=True)
+    >>> name = Maybe(doc)['users'][0]['name'].value()  # Decodes only this path
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found at {file_path}")
 
+    if lazy:
+        if compact:
+            raise ValueError("lazy and compact loading cannot be combined")
+        return _read_json_file_lazy(file_path, encoding)
+
+    if compact:
+        from .compaction import load_compact
+        return load_compact(file_path, encoding)
+
     with open(file_path, "r", encoding=encoding) as file:
         data = json.load(file)
     return data
+
+def _read_json_file_lazy(file_path, encoding):
+    """
+    Memory-map a JSON file and wrap it in lazily decoded proxies.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the JSON file to map.
+    encoding : str
+        The declared file encoding, which must be UTF-8.
+
+    Returns
+    -------
+    LazyObject, LazyArray or any
+        The lazily decoded document.
+    """
+    import mmap
+    from .lazy import load_lazy
+
+    if encoding.lower().replace("-", "").replace("_", "") not in ("utf8", "utf8sig"):
+        raise ValueError(f"Lazy loading requires UTF-8 encoded files, got encoding={encoding!r}")
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise json.JSONDecodeError("Expecting value", "", 0)
+        # The map keeps its own handle, so it outlives the file object.
+        buf = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return load_lazy(buf)
+
+def iter_json_records(file_path, where=None, encoding="utf-8", ndjson=None):
+    """
+    Stream the records of a JSON array or NDJSON file, filtering as they are read.
+
+    The file is memory-mapped and records are located at the byte level. When
+    a declarative predicate is given, each record's raw text is first checked
+    for the keys and string values the predicate requires, so most
+    non-matching records are skipped without being decoded at all. Remaining
+    candidates are decoded (large ones lazily, so only the tested paths are
+    materialized first) and tested with ``Predicate.matches``.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to a file whose top-level value is an array of records, or
+        a newline-delimited JSON file with one record per line.
+    where : dict or Predicate, optional
+        The conditions records must satisfy (see ``Predicate``). By default
+        every record is yielded.
+    encoding : str, optional
+        The file encoding, by default "utf-8". Must be UTF-8.
+    ndjson : bool, optional
+        Whether the file is newline-delimited JSON. By default this is
+        inferred from a ".ndjson" or ".jsonl" file extension.
+
+    Yields
+    ------
+    any
+        Each matching record, fully decoded, in file order.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the specified file does not exist.
+    ValueError
+        If the encoding is not UTF-8, or a non-NDJSON file does not contain a
+        top-level array.
+    json.JSONDecodeError
+        If a candidate record is not valid JSON.
+
+    Examples
+    --------
+    >>> for order in iter_json_records('/data/orders.json', where={'status': 'refunded'}):
+    ...     print(order['id'])
+
+    >>> recent = iter_json_records('/data/events.jsonl', where={'ts': {'>=': 1735689600}})
+    """
+    import mmap
+    from ._scan import array_spans, skip_whitespace
+    from .Predicate import Predicate
+
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found at {file_path}")
+    if encoding.lower().replace("-", "").replace("_", "") not in ("utf8", "utf8sig"):
+        raise ValueError(f"Record streaming requires UTF-8 encoded files, got encoding={encoding!r}")
+    if where is not None and not isinstance(where, Predicate):
+        where = Predicate(where)
+    if ndjson is None:
+        ndjson = os.path.splitext(file_path)[1].lower() in (".ndjson", ".jsonl")
+
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            if ndjson:
+                return
+            raise json.JSONDecodeError("Expecting value", "", 0)
+        buf = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        start = 3 if buf[:3] == b"\xef\xbb\xbf" else 0
+        if ndjson:
+            needle = where.required_needle() if where is not None else None
+            spans = _line_spans(buf, start) if needle is None else _candidate_line_spans(buf, start, needle)
+        else:
+            start = skip_whitespace(buf, start)
+            if buf[start:start + 1] != b"[":
+                raise ValueError(f"File at {file_path} does not contain a top-level JSON array")
+            spans = array_spans(buf, start)
+        for record_start, record_end in spans:
+            record = _decode_record(buf, record_start, record_end, where)
+            if record is not _SKIPPED:
+                yield record
+    finally:
+        buf.close()
+
+def read_json_records(file_path, where=None, encoding="utf-8", ndjson=None):
+    """
+    Load the records of a JSON array or NDJSON file that match a predicate.
+
+    This is the list-returning form of ``iter_json_records``. The result is
+    the same as ``Maybe(read_json_file(file_path)).filter(Predicate(where)).value()``
+    for a top-level array, but non-matching records are skipped while the
+    file is scanned instead of being built and thrown away.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to a JSON array or NDJSON file.
+    where : dict or Predicate, optional
+        The conditions records must satisfy. By default all records are read.
+    encoding : str, optional
+        The file encoding, by default "utf-8". Must be UTF-8.
+    ndjson : bool, optional
+        Whether the file is newline-delimited JSON; inferred from the file
+        extension by default.
+
+    Returns
+    -------
+    list
+        The matching records in file order.
+
+    Examples
+    --------
+    >>> active = read_json_records('/data/users.json', where={'status': 'active', 'age': {'>=': 18}})
+    >>> Maybe(active).array(lambda i, user: user['name'])
+    """
+    return list(iter_json_records(file_path, where, encoding, ndjson))
+
+_SKIPPED = object()
+_LAZY_RECORD_BYTES = 64 * 1024
+
+def _line_spans(buf, start):
+    """
+    Yield the spans of the non-blank lines of an NDJSON buffer.
+
+    Parameters
+    ----------
+    buf : mmap.mmap
+        The mapped file.
+    start : int
+        The position to start from.
+
+    Yields
+    ------
+    tuple of int
+        ``(line_start, line_end)`` for each line containing a record.
+    """
+    size = len(buf)
+    while start < size:
+        end = buf.find(b"\n", start)
+        if end == -1:
+            end = size
+        if buf[start:end].strip():
+            yield (start, end)
+        start = end + 1
+
+def _candidate_line_spans(buf, start, needle):
+    """
+    Yield the spans of the NDJSON lines that contain a needle.
+
+    Lines without the needle are skipped by a substring search over the
+    whole buffer, without being visited individually.
+
+    Parameters
+    ----------
+    buf : mmap.mmap
+        The mapped file.
+    start : int
+        The position to start from.
+    needle : bytes
+        A byte string every candidate record contains.
+
+    Yields
+    ------
+    tuple of int
+        ``(line_start, line_end)`` for each line containing the needle.
+    """
+    size = len(buf)
+    pos = start
+    while True:
+        hit = buf.find(needle, pos)
+        if hit == -1:
+            return
+        line_start = max(buf.rfind(b"\n", start, hit) + 1, start)
+        line_end = buf.find(b"\n", hit)
+        if line_end == -1:
+            line_end = size
+        yield (line_start, line_end)
+        pos = line_end + 1
+
+def _decode_record(buf, start, end, where):
+    """
+    Decode one record, or skip it if it cannot match the predicate.
+
+    Parameters
+    ----------
+    buf : mmap.mmap
+        The mapped file.
+    start, end : int
+        The byte span of the record.
+    where : Predicate or None
+        The predicate to apply.
+
+    Returns
+    -------
+    any
+        The decoded record, or ``_SKIPPED`` if it does not match.
+    """
+    if where is None:
+        return json.loads(buf[start:end])
+    if not where.prefilter(buf, start, end):
+        return _SKIPPED
+    raw = buf[start:end]
+    if len(raw) > _LAZY_RECORD_BYTES:
+        from .lazy import load_lazy, materialize
+        record = load_lazy(raw)
+        if not where.matches(record):
+            return _SKIPPED
+        return materialize(record)
+    record = json.loads(raw)
+    if not where.matches(record):
+        return _SKIPPED
+    return record
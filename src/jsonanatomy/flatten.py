@@ -0,0 +1,579 @@
+"""
+Flattening and columnar export of nested JSON records.
+
+This module turns collections of nested records into column batches keyed by
+field path (``"user.address.city"``) and writes them to CSV or, when pyarrow
+is installed, to Arrow IPC or Parquet files. Records are consumed in bounded
+batches from any iterable - a list, a ``JSONArrayFile`` or a streaming reader
+such as ``iter_json_records`` - so memory use does not grow with the input.
+Column values are extracted with a ``PathExtractor``, i.e. one traversal per
+record for all columns.
+"""
+
+import csv
+import json
+import os
+from itertools import islice
+
+from ._nodes import OBJECT_TYPES, ARRAY_TYPES
+from ._paths import parse_path
+from .PathExtractor import PathExtractor
+
+
+def flatten_record(record, sep=".", max_depth=None):
+    """
+    Flatten a nested record into a single-level dictionary.
+
+    Nested objects are expanded into dotted keys; arrays and objects deeper
+    than ``max_depth`` are kept as values.
+
+    Parameters
+    ----------
+    record : dict
+        The record to flatten.
+    sep : str, optional
+        The separator placed between path segments, by default ".".
+    max_depth : int, optional
+        The maximum number of object levels to expand, by default unlimited.
+
+    Returns
+    -------
+    dict
+        A mapping of flattened key to leaf value.
+
+    Raises
+    ------
+    ValueError
+        If two leaf paths flatten to the same key, such as a key ``"a.b"``
+        next to the nested path ``a`` -> ``b``.
+
+    Examples
+    --------
+    >>> flatten_record({'id': 1, 'user': {'name': 'Alice', 'tags': ['a']}})
+    {'id': 1, 'user.name': 'Alice', 'user.tags': ['a']}
+    """
+    leaves = list(_iter_leaves(record, (), max_depth))
+    names = _column_names([path for path, _ in leaves], sep)
+    return dict(zip(names, (value for _, value in leaves)))
+
+
+def infer_columns(records, max_depth=None):
+    """
+    Collect the leaf field paths of a collection of records.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        The records to inspect.
+    max_depth : int, optional
+        The maximum number of object levels to expand, by default unlimited.
+
+    Returns
+    -------
+    list of tuple
+        The leaf paths in order of first appearance. A path that is an
+        object in some records and a scalar (such as null) in others is
+        represented only by its nested paths.
+
+    Examples
+    --------
+    >>> infer_columns([{'a': 1, 'b': None}, {'a': 2, 'b': {'c': 3}}])
+    [('a',), ('b', 'c')]
+    """
+    seen = {}
+    for record in records:
+        for path, _ in _iter_leaves(record, (), max_depth):
+            if path not in seen:
+                seen[path] = None
+    prefixes = {path[:length] for path in seen for length in range(1, len(path))}
+    return [path for path in seen if path not in prefixes]
+
+
+def iter_column_batches(records, columns=None, batch_size=10000, sep=".", max_depth=None):
+    """
+    Convert records into column batches of bounded size.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        The records to convert. Only one batch is held in memory at a time.
+    columns : list, optional
+        The columns to extract, as dotted strings or tuples of keys. By
+        default they are inferred from the first batch, and a record with a
+        non-null field outside those columns raises ValueError rather than
+        losing the value; pass the columns (for example from
+        ``infer_columns`` over all records) when fields vary across the
+        input.
+    batch_size : int, optional
+        The maximum number of records per batch, by default 10000.
+    sep : str, optional
+        The separator used to build column names from paths, by default ".".
+    max_depth : int, optional
+        The maximum number of object levels to expand when inferring
+        columns, by default unlimited.
+
+    Yields
+    ------
+    dict
+        A mapping of column name to the list of values for the batch's
+        records, with None for missing fields.
+
+    Raises
+    ------
+    ValueError
+        If ``batch_size`` is not positive, if two columns have the same
+        name (a key containing ``sep`` next to a nested path spelling the
+        same name), or if ``columns`` was inferred and a record has a
+        non-null field that is not a column.
+
+    Examples
+    --------
+    >>> records = [{'id': 1, 'user': {'name': 'Alice'}}, {'id': 2}]
+    >>> next(iter_column_batches(records))
+    {'id': [1, 2], 'user.name': ['Alice', None]}
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+    iterator = iter(records)
+    extractor = None
+    names = None
+    inferred = None
+    if columns is not None:
+        paths = [parse_path(column) for column in columns]
+        extractor = PathExtractor(paths)
+        names = _column_names(paths, sep)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        if extractor is None:
+            paths = infer_columns(batch, max_depth)
+            extractor = PathExtractor(paths)
+            names = _column_names(paths, sep)
+            inferred = (set(paths), {path[:length] for path in paths for length in range(1, len(path))})
+        if inferred is not None:
+            _check_columns(batch, inferred[0], inferred[1], max_depth, sep)
+        rows = extractor.extract_many(batch)
+        if rows and names:
+            yield dict(zip(names, (list(values) for values in zip(*rows))))
+        else:
+            yield {name: [] for name in names}
+
+
+def write_csv(records, file_path, columns=None, batch_size=10000, sep=".", max_depth=None, encoding="utf-8"):
+    """
+    Write records to a CSV file, one flattened record per row.
+
+    Missing values are written as empty cells, booleans as ``true`` and
+    ``false``, and arrays or unexpanded objects as JSON text.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        The records to write.
+    file_path : str
+        The path of the CSV file to create.
+    columns, batch_size, sep, max_depth : optional
+        Column selection and batching options, as for ``iter_column_batches``.
+    encoding : str, optional
+        The file encoding, by default "utf-8".
+
+    Returns
+    -------
+    int
+        The number of rows written (excluding the header).
+
+    Raises
+    ------
+    ValueError
+        If records were read but have no columns to write, or as for
+        ``iter_column_batches``.
+
+    Examples
+    --------
+    >>> write_csv(read_json_file('/path/to/users.json'), '/path/to/users.csv')
+    1500
+    """
+    count = 0
+    try:
+        with open(file_path, "w", encoding=encoding, newline="") as file:
+            writer = csv.writer(file)
+            header_written = False
+            for batch in iter_column_batches(records, columns, batch_size, sep, max_depth):
+                if not batch:
+                    raise ValueError("The records have no fields to write as CSV columns")
+                if not header_written:
+                    writer.writerow(list(batch))
+                    header_written = True
+                cells = [[_csv_cell(value) for value in values] for values in batch.values()]
+                rows = list(zip(*cells)) if cells else []
+                writer.writerows(rows)
+                count += len(rows)
+    except Exception:
+        _remove_partial(file_path)
+        raise
+    return count
+
+
+def write_parquet(records, file_path, columns=None, batch_size=10000, sep=".", max_depth=None, schema=None):
+    """
+    Write records to a Parquet file in bounded-size row groups.
+
+    Requires the optional ``pyarrow`` dependency.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        The records to write.
+    file_path : str
+        The path of the Parquet file to create.
+    columns, batch_size, sep, max_depth : optional
+        Column selection and batching options, as for ``iter_column_batches``.
+    schema : pyarrow.Schema, optional
+        The schema to write. By default it is inferred from the first batch,
+        with all-null columns typed as strings; later batches whose values
+        do not fit that schema raise ValueError.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    ValueError
+        If a batch does not fit the schema, or as for
+        ``iter_column_batches``. The partially written file is removed.
+
+    Examples
+    --------
+    >>> write_parquet(iter_json_records('/path/to/events.jsonl'), '/path/to/events.parquet')
+    2000000
+    """
+    pa = _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    return _write_arrow_batches(
+        records, file_path, columns, batch_size, sep, max_depth, schema,
+        lambda batch_schema: pq.ParquetWriter(file_path, batch_schema),
+        lambda writer, table: writer.write_table(table),
+        pa,
+    )
+
+
+def write_arrow(records, file_path, columns=None, batch_size=10000, sep=".", max_depth=None, schema=None):
+    """
+    Write records to an Arrow IPC file, one record batch per input batch.
+
+    Requires the optional ``pyarrow`` dependency.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        The records to write.
+    file_path : str
+        The path of the Arrow file to create.
+    columns, batch_size, sep, max_depth, schema : optional
+        As for ``write_parquet``.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    ValueError
+        As for ``write_parquet``.
+    """
+    pa = _import_pyarrow()
+
+    return _write_arrow_batches(
+        records, file_path, columns, batch_size, sep, max_depth, schema,
+        lambda batch_schema: pa.ipc.new_file(file_path, batch_schema),
+        lambda writer, table: writer.write_table(table),
+        pa,
+    )
+
+
+def _write_arrow_batches(records, file_path, columns, batch_size, sep, max_depth, schema, open_writer, write, pa):
+    """
+    Convert column batches to Arrow tables and hand them to a writer.
+
+    Parameters
+    ----------
+    records, file_path, columns, batch_size, sep, max_depth, schema
+        As for ``write_parquet``.
+    open_writer : callable
+        Creates the writer from the final schema.
+    write : callable
+        Writes one table with the writer.
+    pa : module
+        The imported pyarrow module.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+
+    Raises
+    ------
+    ValueError
+        If a batch does not fit the schema, or as for
+        ``iter_column_batches``. The partially written file is removed.
+    """
+    count = 0
+    writer = None
+    try:
+        for batch in iter_column_batches(records, columns, batch_size, sep, max_depth):
+            arrays = {name: [_arrow_cell(value) for value in values] for name, values in batch.items()}
+            if schema is None:
+                inferred = pa.Table.from_pydict(arrays).schema
+                schema = pa.schema([
+                    pa.field(field.name, pa.string()) if pa.types.is_null(field.type) else field
+                    for field in inferred
+                ])
+            try:
+                table = pa.Table.from_pydict(arrays, schema=schema)
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as error:
+                raise ValueError(
+                    f"Records after row {count} do not fit the Arrow schema; pass a schema that covers "
+                    f"every record ({error})"
+                ) from error
+            if writer is None:
+                writer = open_writer(schema)
+            write(writer, table)
+            count += table.num_rows
+    except Exception:
+        if writer is not None:
+            writer.close()
+            writer = None
+        _remove_partial(file_path)
+        raise
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+def _remove_partial(file_path):
+    """
+    Delete a partially written output file, if it exists.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file.
+    """
+    try:
+        os.remove(file_path)
+    except OSError:
+        pass
+
+
+def _import_pyarrow():
+    """
+    Import pyarrow, raising a helpful error if it is not installed.
+
+    Returns
+    -------
+    module
+        The pyarrow module.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+    except ImportError as error:
+        raise ImportError(
+            "Arrow and Parquet export require pyarrow; install it with 'pip install json-anatomy[arrow]'"
+        ) from error
+    return pyarrow
+
+
+def _iter_leaves(value, path, max_depth):
+    """
+    Yield the leaf paths and values of a nested record.
+
+    Parameters
+    ----------
+    value : any
+        The value to walk.
+    path : tuple
+        The path of ``value`` from the record root.
+    max_depth : int or None
+        The remaining number of object levels to expand.
+
+    Yields
+    ------
+    tuple
+        ``(path, value)`` for each leaf. Non-empty objects are expanded;
+        everything else, including arrays, is a leaf.
+    """
+    if type(value) in OBJECT_TYPES and value and (max_depth is None or len(path) < max_depth):
+        for key, child in value.items():
+            for leaf in _iter_leaves(child, path + (key,), max_depth):
+                yield leaf
+    elif path:
+        yield (path, value)
+
+
+def _check_columns(batch, known, prefixes, max_depth, sep):
+    """
+    Check that inferred columns hold every non-null field of a batch.
+
+    Parameters
+    ----------
+    batch : list
+        The records of the batch.
+    known : set of tuple
+        The inferred column paths.
+    prefixes : set of tuple
+        The proper prefixes of the column paths, whose empty objects are
+        not data.
+    max_depth : int or None
+        The maximum number of object levels expanded.
+    sep : str
+        The separator used in column names.
+
+    Raises
+    ------
+    ValueError
+        If a record has a non-null leaf that no column extracts.
+    """
+    for record in batch:
+        for path, value in _iter_leaves(record, (), max_depth):
+            if path in known or value is None or (path in prefixes and type(value) in OBJECT_TYPES):
+                continue
+            raise ValueError(
+                f"Field {_column_name(path, sep)!r} is not one of the {len(known)} columns inferred from the "
+                f"first batch and would be lost; pass columns explicitly (for example from infer_columns)"
+            )
+
+
+def _column_names(paths, sep):
+    """
+    Join paths into column names, rejecting paths that share a name.
+
+    Parameters
+    ----------
+    paths : list of tuple
+        The column paths.
+    sep : str
+        The segment separator.
+
+    Returns
+    -------
+    list of str
+        The column names, in the order of ``paths``.
+
+    Raises
+    ------
+    ValueError
+        If two paths have the same name, which would make one of their
+        columns overwrite the other.
+    """
+    names = []
+    owners = {}
+    for path in paths:
+        name = _column_name(path, sep)
+        other = owners.setdefault(name, path)
+        if other != path:
+            raise ValueError(
+                f"Paths {other!r} and {path!r} both flatten to the column {name!r}; "
+                f"choose a separator that does not occur in the keys"
+            )
+        names.append(name)
+    return names
+
+
+def _column_name(path, sep):
+    """
+    Join a path into a column name.
+
+    Parameters
+    ----------
+    path : tuple
+        The column path.
+    sep : str
+        The segment separator.
+
+    Returns
+    -------
+    str
+        The column name.
+    """
+    return sep.join(str(key) for key in path)
+
+
+def _to_json(value):
+    """
+    Encode a container value as JSON text, materializing lazy proxies.
+
+    Parameters
+    ----------
+    value : any
+        A dict, list or registered container proxy.
+
+    Returns
+    -------
+    str
+        The compact JSON encoding.
+    """
+    if type(value) is not dict and type(value) is not list:
+        value = value.materialize()
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _csv_cell(value):
+    """
+    Convert a value to its CSV cell representation.
+
+    Parameters
+    ----------
+    value : any
+        The extracted value.
+
+    Returns
+    -------
+    str or int or float
+        The cell value.
+    """
+    if value is None:
+        return ""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    value_type = type(value)
+    if value_type in OBJECT_TYPES or value_type in ARRAY_TYPES:
+        return _to_json(value)
+    return value
+
+
+def _arrow_cell(value):
+    """
+    Convert a value to a type pyarrow can store in a flat column.
+
+    Parameters
+    ----------
+    value : any
+        The extracted value.
+
+    Returns
+    -------
+    any
+        The value, with arrays and objects encoded as JSON text.
+    """
+    value_type = type(value)
+    if value_type in OBJECT_TYPES or value_type in ARRAY_TYPES:
+        return _to_json(value)
+    return value
@@ -0,0 +1,333 @@
+"""
+Lazily decoded JSON documents.
+
+This module provides read-only proxy types for JSON objects and arrays that
+decode their members only when they are accessed. A proxy records the byte
+spans of its direct children on first use; scalar values are decoded and
+nested containers wrapped in new proxies on demand, and every decoded value
+is cached. ``Maybe``, ``Explore`` and ``Xplore`` navigate the proxies exactly
+like ``dict`` and ``list`` values.
+"""
+
+import json
+from array import array
+from collections.abc import Mapping, Sequence
+
+from ._nodes import register_array_type, register_object_type
+from ._scan import array_spans, object_spans, skip_whitespace
+
+_OPEN_OBJECT = ord("{")
+_OPEN_ARRAY = ord("[")
+_BACKSLASH = b"\\"
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def load_lazy(buf):
+    """
+    Wrap an encoded JSON document in lazily decoded proxies.
+
+    Parameters
+    ----------
+    buf : bytes or mmap.mmap
+        The UTF-8 encoded JSON text. The buffer must stay open for as long
+        as any proxy created from it is in use.
+
+    Returns
+    -------
+    LazyObject, LazyArray or any
+        A proxy for a top-level object or array, or the decoded value for a
+        top-level scalar.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the document is empty or its top-level scalar is not valid JSON.
+
+    Examples
+    --------
+    >>> doc = load_lazy(b'{"users": [{"name": "Alice"}], "meta": {"v": 1}}')
+    >>> Maybe(doc)['users'][0]['name'].value()  # Only this branch is decoded
+    'Alice'
+    """
+    start = len(_UTF8_BOM) if buf[:len(_UTF8_BOM)] == _UTF8_BOM else 0
+    start = skip_whitespace(buf, start)
+    if start >= len(buf):
+        raise json.JSONDecodeError("Expecting value", "", 0)
+    return _decode_span(buf, start, len(buf))
+
+
+def materialize(value):
+    """
+    Fully decode a lazy proxy into plain Python objects.
+
+    Parameters
+    ----------
+    value : any
+        A ``LazyObject``, ``LazyArray`` or any other value.
+
+    Returns
+    -------
+    any
+        A ``dict`` or ``list`` decoded from the proxy's text, or ``value``
+        unchanged if it is not a proxy.
+
+    Examples
+    --------
+    >>> doc = load_lazy(b'{"a": [1, 2]}')
+    >>> materialize(doc['a'])
+    [1, 2]
+    """
+    if isinstance(value, (LazyObject, LazyArray)):
+        return value.materialize()
+    return value
+
+
+def _decode_span(buf, start, end):
+    """
+    Decode the JSON value in ``buf[start:end]``, wrapping containers.
+
+    Parameters
+    ----------
+    buf : bytes or mmap.mmap
+        The encoded JSON text.
+    start : int
+        The start of the value span (leading whitespace is skipped).
+    end : int
+        The end of the value span.
+
+    Returns
+    -------
+    LazyObject, LazyArray or any
+        A proxy for containers, or the decoded scalar value.
+    """
+    start = skip_whitespace(buf, start, end)
+    char = buf[start]
+    if char == _OPEN_OBJECT:
+        return LazyObject(buf, start, end)
+    if char == _OPEN_ARRAY:
+        return LazyArray(buf, start, end)
+    return json.loads(buf[start:end])
+
+
+def _decode_key(buf, start, end):
+    """
+    Decode a quoted object key, avoiding the JSON parser for plain keys.
+
+    Parameters
+    ----------
+    buf : bytes or mmap.mmap
+        The encoded JSON text.
+    start : int
+        The position of the opening quote.
+    end : int
+        The position one past the closing quote.
+
+    Returns
+    -------
+    str
+        The decoded key.
+    """
+    raw = buf[start + 1:end - 1]
+    if _BACKSLASH in raw:
+        return json.loads(buf[start:end])
+    return raw.decode("utf-8")
+
+
+@register_object_type
+class LazyObject(Mapping):
+    """
+    A read-only mapping over a JSON object that decodes members on access.
+
+    Member keys and value spans are located on first use with a single
+    structural scan of the object's text; values are decoded individually
+    when they are read and then cached.
+
+    Parameters
+    ----------
+    buf : bytes or mmap.mmap
+        The encoded JSON text containing the object.
+    start : int
+        The position of the object's opening "{".
+    end : int
+        The position the object's text ends at (or any later position).
+
+    Examples
+    --------
+    >>> doc = load_lazy(b'{"name": "Alice", "tags": ["a", "b"]}')
+    >>> doc['name']
+    'Alice'
+    >>> 'tags' in doc  # Membership does not decode the value
+    True
+    """
+    __slots__ = ("_buf", "_start", "_end", "_members", "_cache")
+
+    def __init__(self, buf, start, end):
+        self._buf = buf
+        self._start = start
+        self._end = end
+        self._members = None
+        self._cache = {}
+
+    def __repr__(self):
+        """
+        Return a string representation of the LazyObject.
+
+        Returns
+        -------
+        str
+            A formatted string showing the number of members and how many
+            have been decoded.
+        """
+        return f"LazyObject[size={len(self._spans())}, decoded={len(self._cache)}]"
+
+    def _spans(self):
+        """
+        Get the mapping of keys to value spans, scanning on first use.
+
+        Returns
+        -------
+        dict
+            A mapping of decoded key to ``(value_start, value_end)``.
+        """
+        if self._members is None:
+            buf = self._buf
+            members = {}
+            for key_start, key_end, value_start, value_end in object_spans(buf, self._start, self._end):
+                members[_decode_key(buf, key_start, key_end)] = (value_start, value_end)
+            self._members = members
+        return self._members
+
+    def __getitem__(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        value_start, value_end = self._spans()[key]
+        value = _decode_span(self._buf, value_start, value_end)
+        self._cache[key] = value
+        return value
+
+    def __contains__(self, key):
+        return key in self._spans()
+
+    def __iter__(self):
+        return iter(self._spans())
+
+    def __len__(self):
+        return len(self._spans())
+
+    def materialize(self):
+        """
+        Decode the whole object into a plain dictionary.
+
+        Returns
+        -------
+        dict
+            The object decoded with a single ``json.loads`` call.
+        """
+        return json.loads(self._buf[self._start:self._end])
+
+
+@register_array_type
+class LazyArray(Sequence):
+    """
+    A read-only sequence over a JSON array that decodes elements on access.
+
+    Element spans are located on first use with a single structural scan of
+    the array's text; elements are decoded individually when they are read
+    and then cached.
+
+    Parameters
+    ----------
+    buf : bytes or mmap.mmap
+        The encoded JSON text containing the array.
+    start : int
+        The position of the array's opening "[".
+    end : int
+        The position the array's text ends at (or any later position).
+
+    Examples
+    --------
+    >>> doc = load_lazy(b'[{"id": 1}, {"id": 2}, {"id": 3}]')
+    >>> len(doc)
+    3
+    >>> doc[-1]['id']
+    3
+    """
+    __slots__ = ("_buf", "_start", "_end", "_starts", "_ends", "_cache")
+
+    def __init__(self, buf, start, end):
+        self._buf = buf
+        self._start = start
+        self._end = end
+        self._starts = None
+        self._ends = None
+        self._cache = {}
+
+    def __repr__(self):
+        """
+        Return a string representation of the LazyArray.
+
+        Returns
+        -------
+        str
+            A formatted string showing the number of elements and how many
+            have been decoded.
+        """
+        return f"LazyArray[size={len(self)}, decoded={len(self._cache)}]"
+
+    def _index(self):
+        """
+        Scan the array's element spans on first use.
+        """
+        if self._starts is None:
+            starts = array("q")
+            ends = array("q")
+            for element_start, element_end in array_spans(self._buf, self._start, self._end):
+                starts.append(element_start)
+                ends.append(element_end)
+            self._starts = starts
+            self._ends = ends
+
+    def __len__(self):
+        self._index()
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        try:
+            return self._cache[index]
+        except KeyError:
+            pass
+        size = len(self)
+        position = index + size if index < 0 else index
+        if not 0 <= position < size:
+            raise IndexError("LazyArray index out of range")
+        if position in self._cache:
+            return self._cache[position]
+        value = _decode_span(self._buf, self._starts[position], self._ends[position])
+        self._cache[position] = value
+        return value
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self[position]
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, LazyArray)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def materialize(self):
+        """
+        Decode the whole array into a plain list.
+
+        Returns
+        -------
+        list
+            The array decoded with a single ``json.loads`` call.
+        """
+        return json.loads(self._buf[self._start:self._end])
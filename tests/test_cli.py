@@ -0,0 +1,116 @@
+import json
+import random
+
+import pytest
+
+from jsonanatomy import cli
+
+OBJECT = {"a": {"x": 1}, "b": {"x": 2, "y": "s"}, "c": 3, "d\"}": {"y": None}}
+RECORDS = [{"x": 1}, {"x": 2, "y": 1}, {"z": None}, {"x": 3, "y": [1]}, "scalar"]
+XML = (
+    '<?xml version="1.0"?><users><!-- comment --><user id="1"><name>A</name></user>'
+    "<user><name>B</name><age>3</age></user><user>text</user><group><user><name>C</name></user></group></users>"
+)
+
+
+def profile(capsys, *argv):
+    assert cli.main([*map(str, argv), "--format", "json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    return report["records"], {field: entry["count"] for field, entry in report["fields"].items()}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 100])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_object_members_are_records(tmp_path, capsys, chunk_size, workers):
+    path = tmp_path / "doc.json"
+    path.write_bytes(b"\xef\xbb\xbf \n" + json.dumps(OBJECT).encode("utf-8"))
+    assert profile(capsys, path, "--chunk-size", chunk_size, "--workers", workers) == (4, {"x": 2, "y": 2})
+
+
+def test_object_tasks_honor_chunk_size(tmp_path):
+    path = tmp_path / "doc.json"
+    path.write_text(json.dumps(OBJECT))
+    tasks = cli._plan_object(str(path), 3, None, random.Random(0), cli._Report())
+    assert [task[0] for task in tasks] == ["members", "members"]
+    assert [len(list(cli._iter_task_records(task))) for task in tasks] == [3, 1]
+
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 100])
+def test_array_tasks_honor_chunk_size(tmp_path, capsys, chunk_size):
+    path = tmp_path / "items.json"
+    path.write_bytes(b"\xef\xbb\xbf\n[ " + b" , ".join(json.dumps(record).encode("utf-8") for record in RECORDS) + b" ]\n")
+    tasks = cli._plan_array(str(path), chunk_size, None, random.Random(0), cli._Report())
+    assert [task[0] for task in tasks] == ["range"] * -(-len(RECORDS) // chunk_size)
+    assert [len(list(cli._iter_task_records(task))) for task in tasks][:-1] == [chunk_size] * (len(tasks) - 1)
+    assert [record for task in tasks for record in cli._iter_task_records(task)] == RECORDS
+    assert profile(capsys, path, "--chunk-size", chunk_size) == (5, {"x": 3, "y": 2, "z": 1})
+
+
+def test_empty_array_has_no_records(tmp_path, capsys):
+    path = tmp_path / "empty.json"
+    path.write_text(" [ ] ")
+    assert cli._plan_array(str(path), 2, None, random.Random(0), cli._Report()) == [("spans", str(path), [])]
+    assert profile(capsys, path) == (0, {})
+
+
+def test_unterminated_array_is_reported(tmp_path, capsys):
+    path = tmp_path / "bad.json"
+    path.write_text('[{"x": 1}, {"x": 2}')
+    assert cli.main([str(path)]) == 1
+    assert "bad.json" in capsys.readouterr().err
+
+def test_scalar_document_has_no_records(tmp_path, capsys):
+    path = tmp_path / "scalar.json"
+    path.write_text(' "text" ')
+    assert profile(capsys, path) == (0, {})
+
+
+def test_malformed_object_is_reported(tmp_path, capsys):
+    path = tmp_path / "bad.json"
+    path.write_text('{"a": {"x": 1}, "b": ')
+    assert cli.main([str(path)]) == 1
+    assert "bad.json" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+def test_ndjson_tasks_honor_chunk_size(tmp_path, capsys, monkeypatch, chunk_size):
+    monkeypatch.setattr(cli, "_BLOCK_BYTES", 8)
+    path = tmp_path / "records.jsonl"
+    path.write_text("\n".join(json.dumps(record) for record in RECORDS) + "\n\n")
+    lines = len(RECORDS) + 1
+    tasks = cli._plan_ndjson(str(path), chunk_size, None, random.Random(0), cli._Report())
+    assert len(tasks) == -(-lines // chunk_size)
+    assert [record for task in tasks for record in cli._iter_task_records(task)] == RECORDS
+    assert profile(capsys, path, "--chunk-size", chunk_size) == (5, {"x": 3, "y": 2, "z": 1})
+
+
+def test_xml_streams_every_root_child(tmp_path, capsys):
+    path = tmp_path / "users.xml"
+    path.write_text(XML)
+    assert list(cli._iter_xml_records(str(path), None, 0)) == [
+        {"name": "A"}, {"name": "B", "age": "3"}, "text", {"user": {"name": "C"}},
+    ]
+    assert profile(capsys, path, "--depth", 0) == (4, {"name": 2, "age": 1, "user": 1, "user.name": 1})
+
+
+def test_xml_sample_keeps_document_order(tmp_path):
+    path = tmp_path / "items.xml"
+    path.write_text("<items>" + "".join(f"<item><n>{i}</n></item>" for i in range(50)) + "</items>")
+    sampled = [int(record["n"]) for record in cli._iter_xml_records(str(path), 10, 0.5)]
+    assert len(sampled) == 10
+    assert sampled == sorted(set(sampled))
+
+
+@pytest.mark.parametrize("name, text", [
+    ("doc.json", json.dumps(OBJECT)),
+    ("records.jsonl", "\n".join(json.dumps(record) for record in RECORDS)),
+    ("items.json", json.dumps(RECORDS)),
+])
+def test_sample_profiles_at_most_n_records(tmp_path, capsys, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    assert cli.main([str(path), "--sample", "2", "--format", "json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["records"] == 2
+    assert report["sampled"] is True
@@ -0,0 +1,53 @@
+import importlib
+import json
+import math
+
+import jsonanatomy
+from jsonanatomy import compact, read_json_file
+
+RECORDS = [
+    {"id": i, "price": {"currency": "USD", "unit": "cents"}, "tags": ["a", "b"], "zero": [0.0] if i % 2 else [-0.0]}
+    for i in range(4)
+]
+
+
+def test_compact_preserves_signed_zero():
+    compacted, _ = compact([[0.0], [-0.0], {"x": -0.0}, {"x": 0.0}], share_subtrees=True)
+    assert [math.copysign(1.0, value[0] if isinstance(value, list) else value["x"]) for value in compacted] == [
+        1.0, -1.0, -1.0, 1.0
+    ]
+
+
+def test_compact_keeps_equal_scalars_of_different_types_apart():
+    compacted, _ = compact([[1], [1.0], [True]], share_subtrees=True)
+    assert [type(value[0]) for value in compacted] == [int, float, bool]
+
+
+def test_compact_does_not_share_subtrees_by_default():
+    compacted, report = compact(RECORDS)
+    assert compacted == RECORDS
+    assert report["shared_subtrees"] == 0
+    compacted[0]["price"]["currency"] = "EUR"
+    assert compacted[1]["price"]["currency"] == "USD"
+
+
+def test_compact_shares_subtrees_on_request():
+    compacted, report = compact(RECORDS, share_subtrees=True)
+    assert compacted == RECORDS
+    assert compacted[0]["price"] is compacted[3]["price"]
+    assert report["shared_subtrees"] > 0
+    assert report["bytes_saved"] > 0
+
+
+def test_load_compact_matches_json_load(tmp_path):
+    path = tmp_path / "records.json"
+    path.write_text(json.dumps(RECORDS))
+    loaded = read_json_file(str(path), compact=True)
+    assert loaded == RECORDS
+    assert [math.copysign(1.0, record["zero"][0]) for record in loaded] == [-1.0, 1.0, -1.0, 1.0]
+
+
+def test_compaction_module_is_reachable_from_package():
+    module = importlib.import_module("jsonanatomy.compaction")
+    assert jsonanatomy.compaction is module
+    assert jsonanatomy.compact is module.compact
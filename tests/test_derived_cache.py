@@ -0,0 +1,137 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jsonanatomy import DerivedCache, Explore, Xplore
+
+DOCUMENT = {
+    "items": ["zero", "one", "two"],
+    "map": {1: "int", "1": "str", 2.5: "float"},
+    "users": [{"name": "Alice"}, {"name": "Bob", "age": 30}],
+}
+KEYS = [1, 1.0, True, "1", 2.5, -1]
+
+
+@pytest.mark.parametrize("order", [KEYS, KEYS[::-1]], ids=["forward", "reverse"])
+def test_xplore_keys_of_different_types_do_not_collide(order):
+    cache = DerivedCache()
+    for container in ("items", "map"):
+        for key in order:
+            expected = Xplore(DOCUMENT)[container][key].value()
+            assert Xplore(DOCUMENT, cache=cache)[container][key].value() == expected, (container, key)
+
+
+@pytest.mark.parametrize("order", [[1, True, "1"], ["1", True, 1]], ids=["forward", "reverse"])
+def test_explore_keys_of_different_types_do_not_collide(order):
+    cache = DerivedCache()
+    for key in order:
+        expected = Explore(DOCUMENT).child("map").child(key).data
+        assert Explore(DOCUMENT, cache=cache).child("map").child(key).data == expected, key
+
+
+def test_cached_results_match_uncached():
+    cache = DerivedCache()
+    for _ in range(2):
+        users = Xplore(DOCUMENT, cache=cache)["users"]
+        assert users.explore.field_counts() == {"name": 2, "age": 1}
+        assert users.keys() == [0, 1]
+        assert users[1]["age"].value() == 30
+        assert Explore(DOCUMENT, cache=cache).child("users").child(0).child("name").data == "Alice"
+    assert cache.hits > 0
+
+
+def test_invalidate_drops_results_of_a_document():
+    cache = DerivedCache()
+    document = {"users": [{"name": "Alice"}]}
+    other = {"users": []}
+    assert Explore(document, cache=cache).child("users").field_counts() == {"name": 1}
+    Explore(other, cache=cache).child("users").field_counts()
+    document["users"].append({"email": "b@example.com"})
+    removed = cache.invalidate(document)
+    assert removed > 0
+    assert len(cache) > 0
+    assert Explore(document, cache=cache).child("users").field_counts() == {"name": 1, "email": 1}
+
+
+def test_budget_bounds_cached_results():
+    cache = DerivedCache(max_bytes=2000)
+    document = {f"k{i}": {"v": i} for i in range(100)}
+    for key in document:
+        Explore(document, cache=cache).child(key).field_counts()
+    assert 0 < cache.size <= cache.max_bytes
+    assert len(cache) < 300
+    cache.clear()
+    assert (len(cache), cache.size, cache.hits, cache.misses) == (0, 0, 0, 0)
+
+
+def test_resolved_children_are_charged():
+    cache = DerivedCache(max_bytes=5000)
+    document = {f"k{i}": i for i in range(1000)}
+    explore = Explore(document)
+    for key in document:
+        explore_cached = Explore(document, cache=cache)
+        assert explore_cached.child(key).data == explore.child(key).data
+    assert 0 < cache.size <= cache.max_bytes
+    assert len(cache) < 50
+
+
+def test_documents_kept_alive_are_capped():
+    cache = DerivedCache(max_documents=2)
+    documents = [{"users": [{"id": i}]} for i in range(5)]
+    for document in documents:
+        Xplore(document, cache=cache)["users"][0]["id"].value()
+    assert "documents=2/2" in repr(cache)
+    assert cache.invalidate(documents[0]) == 0
+    assert cache.invalidate(documents[4]) > 0
+    assert cache.invalidate(documents[4]) == 0
+
+
+def test_hits_keep_a_document_alive():
+    cache = DerivedCache(max_documents=2)
+    first, second, third = ({"v": i} for i in range(3))
+    Explore(first, cache=cache).child("v")
+    Explore(second, cache=cache).child("v")
+    Explore(first, cache=cache).child("v")
+    Explore(third, cache=cache).child("v")
+    assert cache.invalidate(second) == 0
+    assert cache.invalidate(first) > 0
+
+
+def test_released_documents_are_collected():
+    import gc
+    import weakref
+
+    class Document(dict):
+        pass
+
+    cache = DerivedCache(max_documents=1)
+    document = Document(a=1)
+    alive = weakref.ref(document)
+    Explore(document, cache=cache).child("a")
+    Explore({"b": 2}, cache=cache).child("b")
+    del document
+    gc.collect()
+    assert alive() is None
+
+
+def test_max_documents_must_be_positive():
+    with pytest.raises(ValueError):
+        DerivedCache(max_documents=0)
+
+
+def test_results_larger_than_budget_are_not_cached():
+    cache = DerivedCache(max_bytes=100)
+    assert cache.get("doc", "big", (), lambda: list(range(1000))) == list(range(1000))
+    assert len(cache) == 0
+
+
+def test_threads_share_one_cache():
+    cache = DerivedCache()
+
+    def request(index):
+        records = Xplore(DOCUMENT, cache=cache)["users"]
+        return records.explore.field_counts(), records[index % 2]["name"].value()
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(request, range(200)))
+    assert results == [({"name": 2, "age": 1}, ["Alice", "Bob"][index % 2]) for index in range(200)]
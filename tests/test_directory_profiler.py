@@ -0,0 +1,90 @@
+import json
+import os
+
+from jsonanatomy import DirectoryProfiler
+
+
+def write(path, data, mtime=None):
+    path.write_text(data if isinstance(data, str) else json.dumps(data))
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+def test_add_modify_remove(tmp_path):
+    a = tmp_path / "a.json"
+    b = tmp_path / "b.json"
+    write(a, [{"name": "x", "age": 1}, {"name": "y"}])
+    write(b, {"one": {"name": "z", "email": "e"}})
+    profiler = DirectoryProfiler(str(tmp_path))
+
+    assert profiler.refresh() == {"added": [str(a), str(b)], "modified": [], "removed": [], "failed": []}
+    assert profiler.field_counts() == {"name": 3, "age": 1, "email": 1}
+    assert profiler.file_counts(str(a)) == {"name": 2, "age": 1}
+    assert profiler.refresh() == {"added": [], "modified": [], "removed": [], "failed": []}
+
+    write(a, [{"name": "x", "phone": 2}], mtime=10 ** 18)
+    assert profiler.refresh() == {"added": [], "modified": [str(a)], "removed": [], "failed": []}
+    assert profiler.field_counts() == {"name": 2, "phone": 1, "email": 1}
+
+    b.unlink()
+    assert profiler.refresh() == {"added": [], "modified": [], "removed": [str(b)], "failed": []}
+    assert profiler.field_counts() == {"name": 1, "phone": 1}
+    assert profiler.file_counts(str(b)) is None
+
+
+def test_removed_files_are_subtracted_to_zero(tmp_path):
+    for i in range(3):
+        write(tmp_path / f"{i}.json", [{"shared": i, f"only{i}": i}])
+    profiler = DirectoryProfiler(str(tmp_path))
+    profiler.refresh()
+    assert profiler.field_counts() == {"shared": 3, "only0": 1, "only1": 1, "only2": 1}
+    for i in range(3):
+        (tmp_path / f"{i}.json").unlink()
+    assert len(profiler.refresh()["removed"]) == 3
+    assert profiler.field_counts() == {}
+
+
+def test_invalid_file_is_recorded_and_does_not_block_refresh(tmp_path):
+    good = tmp_path / "good.json"
+    bad = tmp_path / "bad.json"
+    gone = tmp_path / "gone.json"
+    write(good, [{"a": 1}])
+    write(bad, [{"b": 1}])
+    write(gone, [{"c": 1}])
+    profiler = DirectoryProfiler(str(tmp_path))
+    profiler.refresh()
+
+    write(bad, '[{"b": 1}, {"b":', mtime=10 ** 18)
+    gone.unlink()
+    changes = profiler.refresh()
+    assert changes == {"added": [], "modified": [], "removed": [str(gone)], "failed": [str(bad)]}
+    assert list(profiler.errors) == [str(bad)]
+    assert profiler.field_counts() == {"a": 1}
+
+    assert profiler.refresh() == {"added": [], "modified": [], "removed": [], "failed": []}
+
+    write(bad, [{"b": 1}, {"b": 2}], mtime=2 * 10 ** 18)
+    assert profiler.refresh()["added"] == [str(bad)]
+    assert profiler.errors == {}
+    assert profiler.field_counts() == {"a": 1, "b": 2}
+
+
+def test_deleted_invalid_file_is_forgotten(tmp_path):
+    bad = tmp_path / "bad.json"
+    bad.write_bytes(b"\xff\xfe not json")
+    profiler = DirectoryProfiler(str(tmp_path))
+    assert profiler.refresh()["failed"] == [str(bad)]
+    bad.unlink()
+    assert profiler.refresh()["removed"] == [str(bad)]
+    assert profiler.errors == {}
+
+
+def test_recursive_pattern(tmp_path):
+    (tmp_path / "sub").mkdir()
+    write(tmp_path / "top.json", [{"a": 1}])
+    write(tmp_path / "sub" / "nested.json", [{"b": 1}])
+    write(tmp_path / "sub" / "skip.txt", [{"c": 1}])
+    assert DirectoryProfiler(str(tmp_path)).refresh()["added"] == [str(tmp_path / "top.json")]
+    profiler = DirectoryProfiler(str(tmp_path), recursive=True)
+    profiler.refresh()
+    assert profiler.field_counts() == {"a": 1, "b": 1}
@@ -0,0 +1,97 @@
+import os
+
+import pytest
+
+from jsonanatomy import get_json_file_paths, iter_json_file_paths
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "a.json").write_text("{}")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.json").write_text("{}")
+    os.symlink(tmp_path / "sub", tmp_path / "link")
+    os.symlink(tmp_path, tmp_path / "sub" / "loop")
+    return tmp_path
+
+
+def relative(paths, root):
+    return sorted(os.path.relpath(path, root).replace(os.sep, "/") for path in paths)
+
+
+@pytest.mark.parametrize("workers", [None, 4])
+def test_follow_visits_each_directory_once(tree, workers):
+    paths = relative(iter_json_file_paths(str(tree), symlinks="follow", workers=workers), tree)
+    assert "a.json" in paths
+    assert len(paths) == 2
+    assert sorted(os.path.basename(path) for path in paths) == ["a.json", "b.json"]
+
+
+def test_files_policy_does_not_descend_links(tree):
+    assert relative(iter_json_file_paths(str(tree)), tree) == ["a.json", "sub/b.json"]
+
+
+def test_skip_policy_ignores_symlinked_files(tree):
+    (tree / "file_link.json").symlink_to(tree / "a.json")
+    assert relative(iter_json_file_paths(str(tree)), tree) == ["a.json", "file_link.json", "sub/b.json"]
+    assert relative(iter_json_file_paths(str(tree), symlinks="skip"), tree) == ["a.json", "sub/b.json"]
+
+
+def test_unknown_symlink_policy_raises(tree):
+    with pytest.raises(ValueError):
+        iter_json_file_paths(str(tree), symlinks="maybe")
+
+
+@pytest.fixture
+def nested(tmp_path):
+    for rel_path, size in [("a.json", 2), ("big.json", 200), ("sub/b.json", 2), ("sub/c.txt", 2),
+                           ("sub/deep/d.json", 2), ("tmp/e.json", 2), ("other/sub/f.json", 2)]:
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("{" + " " * (size - 2) + "}")
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers", [None, 4])
+def test_include_and_exclude_patterns(nested, workers):
+    def scan(**options):
+        return relative(iter_json_file_paths(str(nested), workers=workers, **options), nested)
+
+    assert scan(include=["sub/*"]) == ["sub/b.json", "sub/deep/d.json"]
+    assert scan(exclude=["tmp", "deep"]) == ["a.json", "big.json", "other/sub/f.json", "sub/b.json"]
+    assert scan(exclude=["sub/deep"]) == ["a.json", "big.json", "other/sub/f.json", "sub/b.json", "tmp/e.json"]
+    assert scan(include=["*.json"], exclude=["b*"]) == [
+        "a.json", "other/sub/f.json", "sub/deep/d.json", "tmp/e.json",
+    ]
+
+
+@pytest.mark.parametrize("workers", [None, 4])
+def test_size_and_mtime_filters(nested, workers):
+    os.utime(nested / "a.json", (1000, 1000))
+    os.utime(nested / "sub" / "b.json", (3000, 3000))
+
+    def scan(**options):
+        return relative(iter_json_file_paths(str(nested), workers=workers, **options), nested)
+
+    assert scan(min_size=100) == ["big.json"]
+    assert scan(max_size=2, exclude=["tmp", "other", "deep"]) == ["a.json", "sub/b.json"]
+    assert scan(modified_before=2000) == ["a.json"]
+    assert scan(modified_after=1000, modified_before=4000) == ["sub/b.json"]
+
+
+@pytest.mark.parametrize("workers", [None, 4])
+def test_workers_find_the_same_files(nested, workers):
+    expected = ["a.json", "big.json", "other/sub/f.json", "sub/b.json", "sub/deep/d.json", "tmp/e.json"]
+    assert relative(iter_json_file_paths(str(nested), workers=workers), nested) == expected
+    assert relative(iter_json_file_paths(str(nested), recursive=False, workers=workers), nested) == [
+        "a.json", "big.json",
+    ]
+
+
+@pytest.mark.parametrize("workers", [None, 4])
+def test_patterns_with_separators_match_relative_paths(nested, workers):
+    paths = get_json_file_paths(str(nested), "sub/*.json", recursive=True, workers=workers)
+    assert relative(paths, nested) == ["sub/b.json", "sub/deep/d.json"]
+    paths = get_json_file_paths(str(nested), "*/sub/*.json", recursive=True, workers=workers)
+    assert relative(paths, nested) == ["other/sub/f.json"]
+    assert relative(get_json_file_paths(str(nested), "sub/*.json"), nested) == ["sub/b.json"]
@@ -0,0 +1,101 @@
+import csv
+
+import pytest
+
+from jsonanatomy import flatten_record, iter_column_batches, write_csv
+
+RECORDS = [{"a": 1}, {"a": 2}, {"a": 3, "b": {"c": 4}}]
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as file:
+        return list(csv.reader(file))
+
+
+def test_inferred_columns_reject_fields_first_seen_in_a_later_batch():
+    with pytest.raises(ValueError, match="b.c"):
+        list(iter_column_batches(RECORDS, batch_size=2))
+
+
+def test_inferred_columns_reject_scalars_at_object_paths():
+    records = [{"b": {"c": 1}}, {"b": 5}]
+    with pytest.raises(ValueError, match="'b'"):
+        list(iter_column_batches(records))
+
+
+def test_inferred_columns_accept_nulls_and_empty_objects():
+    records = [{"a": 1, "b": {"c": 1}}, {"a": None, "b": {}}, {"b": None, "d": None}]
+    batches = list(iter_column_batches(records, batch_size=1))
+    assert [batch["b.c"] for batch in batches] == [[1], [None], [None]]
+
+
+def test_explicit_columns_keep_later_fields():
+    batches = list(iter_column_batches(RECORDS, columns=["a", "b.c"], batch_size=2))
+    assert batches == [{"a": [1, 2], "b.c": [None, None]}, {"a": [3], "b.c": [4]}]
+
+
+def test_write_csv_removes_partial_file_on_unknown_field(tmp_path):
+    path = tmp_path / "out.csv"
+    with pytest.raises(ValueError):
+        write_csv(RECORDS, str(path), batch_size=2)
+    assert not path.exists()
+
+
+def test_write_csv_with_columns(tmp_path):
+    path = tmp_path / "out.csv"
+    assert write_csv(RECORDS, str(path), columns=["a", "b.c"], batch_size=2) == 3
+    assert read_rows(path) == [["a", "b.c"], ["1", ""], ["2", ""], ["3", "4"]]
+
+
+def test_write_csv_without_fields_raises(tmp_path):
+    path = tmp_path / "out.csv"
+    with pytest.raises(ValueError):
+        write_csv([{}, {}], str(path))
+    assert not path.exists()
+
+
+def test_write_csv_of_no_records(tmp_path):
+    path = tmp_path / "out.csv"
+    assert write_csv([], str(path)) == 0
+
+
+def test_write_parquet_type_change_fails_without_partial_file(tmp_path):
+    pytest.importorskip("pyarrow")
+    from jsonanatomy import write_parquet
+
+    path = tmp_path / "out.parquet"
+    with pytest.raises(ValueError, match="schema"):
+        write_parquet([{"a": 1}, {"a": "x"}], str(path), batch_size=1)
+    assert not path.exists()
+    assert write_parquet([{"a": 1}, {"a": 2}], str(path), batch_size=1) == 2
+
+
+COLLIDING = [{"a.b": 1, "a": {"b": 2}}]
+
+
+def test_inferred_columns_reject_colliding_names():
+    with pytest.raises(ValueError, match="'a.b'"):
+        list(iter_column_batches(COLLIDING))
+
+
+def test_explicit_columns_reject_colliding_names():
+    with pytest.raises(ValueError, match="'a.b'"):
+        list(iter_column_batches(COLLIDING, columns=[("a.b",), "a.b"]))
+
+
+def test_later_batch_with_colliding_name_raises():
+    with pytest.raises(ValueError, match="'a.b'"):
+        list(iter_column_batches([{"a": {"b": 2}}, {"a.b": 1}], batch_size=1))
+
+
+def test_flatten_record_rejects_colliding_names():
+    with pytest.raises(ValueError):
+        flatten_record(COLLIDING[0])
+
+
+def test_other_separator_keeps_both_columns(tmp_path):
+    assert list(iter_column_batches(COLLIDING, sep="/")) == [{"a.b": [1], "a/b": [2]}]
+    path = tmp_path / "out.csv"
+    with pytest.raises(ValueError):
+        write_csv(COLLIDING, str(path))
+    assert not path.exists()
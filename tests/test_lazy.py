@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from jsonanatomy import Maybe
+from jsonanatomy.lazy import LazyArray, LazyObject, load_lazy, materialize
+
+from .test_scan import ARRAYS, DEEP, OBJECTS
+
+
+@pytest.mark.parametrize("bom", [b"", b"\xef\xbb\xbf"], ids=["plain", "bom"])
+@pytest.mark.parametrize("text", list(ARRAYS.values()) + list(OBJECTS.values()),
+                         ids=["array-" + key for key in ARRAYS] + ["object-" + key for key in OBJECTS])
+def test_lazy_documents_match_json_loads(text, bom):
+    expected = json.loads(text)
+    document = load_lazy(bom + text.encode("utf-8"))
+    assert isinstance(document, (LazyObject, LazyArray))
+    assert materialize(document) == expected
+    assert len(document) == len(expected)
+    if isinstance(expected, dict):
+        for key, value in expected.items():
+            assert materialize(document[key]) == value
+            assert materialize(Maybe(document)[key].value()) == value
+    else:
+        for index, value in enumerate(expected):
+            assert materialize(document[index]) == value
+
+
+def test_lazy_deep_navigation():
+    document = load_lazy(json.dumps({"deep": DEEP}).encode("utf-8"))
+    value, lazy = DEEP, document["deep"]
+    while isinstance(value, (dict, list)):
+        key = "k" if isinstance(value, dict) else 0
+        value, lazy = value[key], lazy[key]
+    assert lazy == value == "leaf"
+
+
+@pytest.mark.parametrize("text", ["1", " -2.5 ", '"a\\"b"', "null", "\n true"])
+def test_lazy_top_level_scalars(text):
+    assert load_lazy(text.encode("utf-8")) == json.loads(text)
@@ -0,0 +1,105 @@
+import pytest
+
+from jsonanatomy import Maybe
+
+MIXED = [
+    {"id": 1, "v": 3},
+    {"id": 2, "v": "x"},
+    {"id": 3, "v": [1, 2]},
+    {"id": 4, "v": True},
+    {"id": 5},
+    {"id": 6, "v": float("nan")},
+    {"id": 7, "v": 9.5},
+    {"id": 8, "v": {"a": 1}},
+    {"id": 9, "v": "a"},
+]
+
+
+def ids(result):
+    return [record["id"] for record in result.value()]
+
+
+def test_top_k_skips_unrankable_values_and_ranks_numbers_first():
+    assert ids(Maybe(MIXED).top_k(3, "v")) == [7, 1, 2]
+    assert ids(Maybe(MIXED).top_k(3, "v", largest=False)) == [1, 7, 9]
+    assert ids(Maybe(MIXED).top_k(10, "v")) == [7, 1, 2, 9]
+
+
+def test_top_k_keeps_ties_in_order():
+    records = [{"id": i, "v": i % 2} for i in range(6)]
+    assert ids(Maybe(records).top_k(3, "v")) == [1, 3, 5]
+
+
+def test_aggregations_ignore_incomparable_values():
+    result = Maybe([record for record in MIXED if record["id"] != 6]).aggregate({
+        "rows": "count",
+        "present": ("count", "v"),
+        "low": ("min", "v"),
+        "high": ("max", "v"),
+        "total": ("sum", "v"),
+        "avg": ("mean", "v"),
+    }).value()
+    assert result == {"rows": 8, "present": 7, "low": 3, "high": 9.5, "total": 12.5, "avg": 6.25}
+
+
+def test_min_max_of_strings():
+    result = Maybe([{"v": "b"}, {"v": "a"}, {"v": None}, {"v": False}]).aggregate(
+        {"low": ("min", "v"), "high": ("max", "v"), "total": ("sum", "v"), "avg": ("mean", "v")}
+    ).value()
+    assert result == {"low": "a", "high": "b", "total": 0, "avg": None}
+
+
+def test_group_by_unhashable_keys():
+    records = [{"k": [1, 2], "n": 1}, {"k": {"a": 1}, "n": 2}, {"k": [1, 2], "n": 3}, {"n": 4}]
+    groups = Maybe(records).group_by("k").value()
+    assert groups == {
+        ("array", 1, 2): [records[0], records[2]],
+        frozenset({("a", 1)}): [records[1]],
+        None: [records[3]],
+    }
+    totals = Maybe(records).group_by("k", {"total": ("sum", "n")}).value()
+    assert totals == {("array", 1, 2): {"total": 4}, frozenset({("a", 1)}): {"total": 2}, None: {"total": 4}}
+
+
+def test_join_on_unhashable_keys():
+    left = [{"k": [1, 2], "x": 1}, {"k": {"a": [3]}, "x": 2}, {"k": "s", "x": 3}, {"x": 4}]
+    right = [{"k": [1, 2], "y": 1}, {"k": {"a": [3]}, "y": 2}, {"k": [2, 1], "y": 3}]
+    assert Maybe(left).join(right, "k").value() == [
+        {"k": [1, 2], "x": 1, "y": 1},
+        {"k": {"a": [3]}, "x": 2, "y": 2},
+    ]
+    assert len(Maybe(left).join(right, "k", how="left").value()) == 4
+
+
+def test_unknown_aggregation_raises():
+    with pytest.raises(ValueError):
+        Maybe([{"v": 1}]).aggregate({"x": ("median", "v")})
+
+
+def test_distinct_keeps_equal_values_of_different_types():
+    assert Maybe([1, True, 1.0, 1, "1", True]).distinct().value() == [1, True, 1.0, "1"]
+    assert Maybe([[1], [True], {"a": 0}, {"a": False}, [1]]).distinct().value() == [[1], [True], {"a": 0}, {"a": False}]
+    records = [{"id": 1}, {"id": True}, {"id": 1.0}, {"id": 1}]
+    assert [record["id"] for record in Maybe(records).distinct("id").value()] == [1, True, 1.0]
+
+
+def test_group_by_rejects_equal_values_of_different_types():
+    records = [{"k": 1}, {"k": True}, {"k": 1.0}]
+    with pytest.raises(ValueError, match="different types"):
+        Maybe(records).group_by("k")
+    with pytest.raises(ValueError, match="different types"):
+        Maybe(records).group_by("k", {"n": "count"})
+
+
+def test_group_by_separates_types_that_differ():
+    records = [{"k": 1}, {"k": "1"}, {"k": 1}, {"k": False}]
+    assert Maybe(records).group_by("k", {"n": "count"}).value() == {1: {"n": 2}, "1": {"n": 1}, False: {"n": 1}}
+
+
+def test_join_matches_only_keys_of_the_same_type():
+    left = [{"id": 1, "x": 1}, {"id": True, "x": 2}, {"id": [1], "x": 3}]
+    right = [{"id": True, "y": "bool"}, {"id": 1.0, "y": "float"}, {"id": 1, "y": "int"}, {"id": [True], "y": "list"}]
+    assert Maybe(left).join(right, "id").value() == [
+        {"id": 1, "x": 1, "y": "int"},
+        {"id": True, "x": 2, "y": "bool"},
+    ]
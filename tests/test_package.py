@@ -0,0 +1,90 @@
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+import jsonanatomy
+
+
+def run_fresh(code):
+    """Run code in a fresh interpreter, so the package is imported from scratch."""
+    env = dict(os.environ)
+    package_root = os.path.dirname(os.path.dirname(jsonanatomy.__file__))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+# Standard library modules only some features need; see scripts/benchmark_import_time.py.
+HEAVY_MODULES = ["json", "glob", "mmap", "multiprocessing", "xml.etree.ElementTree"]
+
+
+def test_bare_import_loads_no_submodules():
+    run_fresh(
+        "import sys\n"
+        "before = set(sys.modules)\n"
+        "import jsonanatomy\n"
+        "loaded = set(sys.modules) - before\n"
+        "submodules = sorted(name for name in loaded if name.startswith('jsonanatomy.'))\n"
+        "assert submodules == ['jsonanatomy._version'], submodules\n"
+        f"heavy = sorted(loaded.intersection({HEAVY_MODULES!r}))\n"
+        "assert not heavy, heavy\n"
+    )
+
+
+def test_importing_one_class_loads_only_its_dependencies():
+    run_fresh(
+        "import sys\n"
+        "before = set(sys.modules)\n"
+        "from jsonanatomy import Maybe\n"
+        "loaded = set(sys.modules) - before\n"
+        "assert 'jsonanatomy.Maybe' in loaded\n"
+        "unexpected = sorted(loaded.intersection(['jsonanatomy.Explore', 'jsonanatomy.file_reader', "
+        "'jsonanatomy._scan', 'jsonanatomy.cli']))\n"
+        "assert not unexpected, unexpected\n"
+        f"heavy = sorted(loaded.intersection({HEAVY_MODULES!r}))\n"
+        "assert not heavy, heavy\n"
+    )
+
+@pytest.mark.parametrize("name", jsonanatomy.__all__)
+def test_public_names_resolve_lazily(name):
+    run_fresh(
+        "import sys, jsonanatomy\n"
+        f"value = getattr(jsonanatomy, {name!r})\n"
+        f"assert value.__name__ == {name!r}, value\n"
+        f"assert value.__module__ == 'jsonanatomy.' + jsonanatomy._EXPORTS[{name!r}]\n"
+        f"assert jsonanatomy.{name} is value\n"
+    )
+
+
+@pytest.mark.parametrize("name", jsonanatomy._SUBMODULES)
+def test_submodules_are_attributes_after_bare_import(name):
+    run_fresh(
+        "import sys, types, jsonanatomy\n"
+        f"module = jsonanatomy.{name}\n"
+        "assert isinstance(module, types.ModuleType), module\n"
+        f"assert module is sys.modules['jsonanatomy.{name}']\n"
+    )
+
+
+def test_submodule_functions_are_reachable():
+    run_fresh(
+        "import jsonanatomy\n"
+        "assert jsonanatomy.file_reader.read_json_file is jsonanatomy.read_json_file\n"
+        "assert jsonanatomy.flatten.write_csv is jsonanatomy.write_csv\n"
+        "assert jsonanatomy.compaction.load_compact\n"
+        "assert jsonanatomy.lazy.load_lazy\n"
+    )
+
+
+def test_class_submodules_resolve_to_classes():
+    import jsonanatomy.Explore  # noqa: F401
+
+    assert isinstance(jsonanatomy.Explore, type)
+    assert isinstance(jsonanatomy.file_reader, types.ModuleType)
+
+
+def test_unknown_attribute_raises():
+    assert not hasattr(jsonanatomy, "no_such_name")
+    assert not hasattr(jsonanatomy, "_scan_missing")
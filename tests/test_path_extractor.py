@@ -0,0 +1,107 @@
+import pytest
+
+from jsonanatomy import Maybe, PathExtractor
+
+RECORDS = [
+    {
+        "id": 7,
+        "user": {"name": "Alice", "tags": ["a", "b"], "address": {"city": "Oslo", "zip": "0150"}},
+        "items": [{"sku": "x1", "qty": 2}, {"sku": "y2"}],
+        "codes": {"0": "zero", "1": "one", 2: "int two"},
+        "flag": False,
+    },
+    {"id": 8, "user": {"name": "Bob", "tags": []}, "items": [], "codes": ["first", "second"]},
+    {"id": 9, "user": "anonymous", "items": {"0": {"sku": "from dict"}}},
+    {},
+    ["not", "a", "record"],
+    "scalar",
+]
+
+PATHS = [
+    "id",
+    "user.name",
+    "user.tags.0",
+    "user.tags.1",
+    "user.tags.2",
+    "user.address.city",
+    "user.address.zip",
+    "user.address.country",
+    "items.0.sku",
+    "items.0.qty",
+    "items.1.sku",
+    "items.1.qty",
+    "codes.0",
+    "codes.1",
+    ("codes", 2),
+    ("codes", -1),
+    "flag",
+    "missing.deeper.still",
+    "0",
+]
+
+
+def chained(record, path):
+    """Resolve a dotted or tuple path with one Maybe lookup per segment."""
+    maybe = Maybe(record)
+    for key in ([path] if isinstance(path, int) else path.split(".") if isinstance(path, str) else path):
+        if isinstance(maybe.value(), list) and isinstance(key, str) and key.isdigit():
+            key = int(key)
+        maybe = maybe[key]
+    return maybe.value()
+
+
+@pytest.mark.parametrize("record", RECORDS, ids=range(len(RECORDS)))
+def test_extract_matches_chained_maybe(record):
+    assert PathExtractor(PATHS).extract(record) == tuple(chained(record, path) for path in PATHS)
+
+
+def test_extract_many_matches_extract():
+    extractor = PathExtractor(PATHS)
+    assert extractor.extract_many(RECORDS) == [extractor.extract(record) for record in RECORDS]
+    assert extractor.extract_many(iter(RECORDS)) == extractor.extract_many(RECORDS)
+    assert extractor.extract_many([]) == []
+
+
+@pytest.mark.parametrize("path", ["", ()])
+def test_empty_path_returns_the_record(path):
+    extractor = PathExtractor([path, "id"])
+    assert extractor.extract_many(RECORDS[:2]) == [(RECORDS[0], 7), (RECORDS[1], 8)]
+    assert extractor.extract("scalar") == ("scalar", None)
+
+
+def test_numeric_segments_on_lists_and_dicts():
+    record = {"list": ["a", "b"], "strs": {"0": "s0"}, "ints": {0: "i0"}}
+    extractor = PathExtractor(["list.1", ("list", 1), "strs.0", ("strs", 0), "ints.0", ("ints", 0), ("list", -1)])
+    assert extractor.extract(record) == ("b", "b", "s0", None, None, "i0", None)
+
+
+def test_missing_paths_use_default():
+    extractor = PathExtractor(["id", "user.email", "items.5.sku", "user.name.first"], default="n/a")
+    assert extractor.extract(RECORDS[0]) == (7, "n/a", "n/a", "n/a")
+    assert extractor.extract({"id": None, "user": {"email": None}}) == (None, None, "n/a", "n/a")
+    assert extractor.extract(None) == ("n/a",) * 4
+
+
+def test_dict_paths_return_dicts_in_name_order():
+    extractor = PathExtractor({"name": "user.name", "city": ("user", "address", "city"), "first": "items.0.sku"})
+    assert extractor.names == ["name", "city", "first"]
+    assert extractor.extract_many(RECORDS[:3]) == [
+        {"name": "Alice", "city": "Oslo", "first": "x1"},
+        {"name": "Bob", "city": None, "first": None},
+        {"name": None, "city": None, "first": "from dict"},
+    ]
+
+
+def test_paths_sharing_a_prefix():
+    paths = ["user", "user.address", "user.address.city", "user.address", "user.tags.0", "user.tags"]
+    extractor = PathExtractor(paths)
+    assert repr(extractor) == "PathExtractor([paths=6])"
+    for record in RECORDS:
+        assert extractor.extract(record) == tuple(chained(record, path) for path in paths)
+    user = RECORDS[0]["user"]
+    assert extractor.extract(RECORDS[0]) == (user, user["address"], "Oslo", user["address"], "a", ["a", "b"])
+
+
+def test_unsupported_path_raises():
+    with pytest.raises(TypeError):
+        PathExtractor([1.5])
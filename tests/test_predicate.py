@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from jsonanatomy import JSONArrayFile, Maybe, Predicate, iter_json_records, read_json_records
+
+RECORDS = [
+    {"id": 1, "status": "a<b", "tags": ["x&y"], "user": {"age": 30, "name": "Ann"}},
+    {"id": 2, "status": "active", "user": {"age": 17, "name": "O'Neil"}},
+    {"id": 3, "status": "active", "note": "say \"hi\"", "user": {"age": 45}},
+    {"id": 4, "status": "café", "k<e>y": "v&w", "user": None},
+    {"id": 5, "status": "pending", "path": "a/b\\c", "user": {"age": "n/a"}},
+    {"id": 6, "status": "a<b", "tab\tkey": 1, "user": {"age": 18, "name": "Zoë"}},
+    {"id": 7},
+]
+
+PREDICATES = [
+    {"status": "a<b"},
+    {"status": "active"},
+    {"status": "café"},
+    {"status": {"in": ["a<b", "pending"]}},
+    {"status": {"in": ["active", "café"]}},
+    {"k<e>y": "v&w"},
+    {"k<e>y": {"exists": True}},
+    {"tab\tkey": {"exists": True}},
+    {"user.name": "O'Neil"},
+    {"user.name": "Zoë"},
+    {"note": 'say "hi"'},
+    {"path": "a/b\\c"},
+    {"user.age": {">=": 18}},
+    {"user.age": {"<": 18}, "status": "active"},
+    {"user": None},
+    {"user.name": {"exists": False}},
+    {"status": {"!=": "active"}},
+    {"tags": ["x&y"]},
+    {"missing": {"exists": True}},
+]
+
+
+def html_safe(text):
+    """Escape like Go's encoder and HTML-safe serializers."""
+    return text.replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026").replace("'", "\\u0027")
+
+
+ENCODINGS = {
+    "ascii": lambda record: json.dumps(record),
+    "utf8": lambda record: json.dumps(record, ensure_ascii=False),
+    "html_safe": lambda record: html_safe(json.dumps(record)),
+    "compact": lambda record: json.dumps(record, separators=(",", ":"), ensure_ascii=False),
+}
+
+
+def write_array(path, encode):
+    path.write_text("[\n" + ",\n".join(encode(record) for record in RECORDS) + "\n]", encoding="utf-8")
+
+
+def write_ndjson(path, encode):
+    path.write_text("\n".join(encode(record) for record in RECORDS) + "\n", encoding="utf-8")
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS.keys())
+@pytest.mark.parametrize("where", PREDICATES, ids=[json.dumps(where, ensure_ascii=False) for where in PREDICATES])
+def test_pushed_down_filter_matches_plain_filter(tmp_path, encoding, where):
+    encode = ENCODINGS[encoding]
+    predicate = Predicate(where)
+    expected = [record for record in RECORDS if predicate.matches(record)]
+
+    array_path = tmp_path / "records.json"
+    write_array(array_path, encode)
+    assert json.loads(array_path.read_text(encoding="utf-8")) == RECORDS
+    assert read_json_records(str(array_path), where=where) == expected
+    assert Maybe(RECORDS).filter(predicate).value() == expected
+    with JSONArrayFile(str(array_path)) as array_file:
+        assert list(array_file.filter(predicate)) == expected
+
+    ndjson_path = tmp_path / "records.jsonl"
+    write_ndjson(ndjson_path, encode)
+    assert list(iter_json_records(str(ndjson_path), where=predicate)) == expected
+
+
+def test_prefilter_rejects_records_without_required_text():
+    predicate = Predicate({"status": "active"})
+    assert not predicate.prefilter(b'{"status": "pending"}')
+    assert predicate.prefilter(b'{"status": "active"}')
+
+
+def test_prefilter_accepts_html_escaped_values():
+    predicate = Predicate({"status": "a<b"})
+    assert predicate.prefilter(b'{"status": "a\\u003cb"}')
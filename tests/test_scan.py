@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from jsonanatomy import JSONArrayFile
+from jsonanatomy._scan import _REGEX_DEPTH, array_spans, object_spans, skip_whitespace
+
+
+def nested(depth):
+    value = "leaf"
+    for level in range(depth):
+        value = [value, {"level": level}] if level % 2 else {"k": value, "s": "]}[{"}
+    return value
+
+
+DEEP = nested(_REGEX_DEPTH + 4)
+
+ARRAYS = {
+    "empty": "[]",
+    "empty_spaced": "[ \n\t ]",
+    "empty_members": '[[], {}, [ ], { }, ""]',
+    "scalars": '[1, -2.5e3, true, false, null, "x"]',
+    "escaped_quotes": r'["a\"b", {"k\"": "v\\"}, "\\\\", "\\\"", "\""]',
+    "brackets_in_strings": r'["]", "}", "[{", {"a]": "}{", "b": ["\"]"]}]',
+    "unicode": '["café", "\\u00e9", {"ü": "😀"}]',
+    "whitespace": '\n\t [ 1 ,\n 2\r\n,\t{ "a" : [ 3 , 4 ] } ] \n',
+    "deep": json.dumps([DEEP, DEEP, 1]),
+    "deep_compact": json.dumps([DEEP, {"x": DEEP}], separators=(",", ":")),
+}
+
+OBJECTS = {
+    "empty": "{}",
+    "empty_spaced": "{ \n }",
+    "escaped_keys": r'{"a\"b": 1, "c\\": {"d\"": "e\\"}, "f": []}',
+    "whitespace": '\n {\n "a" :\t1 ,\r\n"b":{ } }\n',
+    "deep": json.dumps({"deep": DEEP, "after": [1, 2]}),
+}
+
+
+def decode_spans(buf, spans):
+    return [json.loads(buf[start:end]) for start, end in spans]
+
+
+@pytest.mark.parametrize("text", ARRAYS.values(), ids=ARRAYS.keys())
+def test_array_spans_match_json_loads(text):
+    buf = text.encode("utf-8")
+    start = skip_whitespace(buf, 0)
+    assert decode_spans(buf, array_spans(buf, start)) == json.loads(text)
+
+
+@pytest.mark.parametrize("text", OBJECTS.values(), ids=OBJECTS.keys())
+def test_object_spans_match_json_loads(text):
+    buf = text.encode("utf-8")
+    start = skip_whitespace(buf, 0)
+    members = {
+        json.loads(buf[key_start:key_end]): json.loads(buf[value_start:value_end])
+        for key_start, key_end, value_start, value_end in object_spans(buf, start)
+    }
+    assert members == json.loads(text)
+
+
+@pytest.mark.parametrize("text", ['[1, 2', '[{"a": "]"', '[[[[[[[[1]]]]]]]'])
+def test_unterminated_array_raises(text):
+    buf = text.encode("utf-8")
+    with pytest.raises(ValueError):
+        list(array_spans(buf, 0))
+
+
+@pytest.mark.parametrize("text", ['[1, 2', '["\\"]', '[{"a": 1,}]'])
+def test_malformed_array_file_raises(tmp_path, text):
+    path = tmp_path / "bad.json"
+    path.write_text(text)
+    with JSONArrayFile(str(path)) as array_file:
+        with pytest.raises(ValueError):
+            list(array_file)
+
+
+@pytest.mark.parametrize("bom", [b"", b"\xef\xbb\xbf"], ids=["plain", "bom"])
+@pytest.mark.parametrize("text", ARRAYS.values(), ids=ARRAYS.keys())
+def test_json_array_file_matches_json_loads(tmp_path, text, bom):
+    path = tmp_path / "data.json"
+    path.write_bytes(bom + text.encode("utf-8"))
+    expected = json.loads(text)
+    with JSONArrayFile(str(path)) as array_file:
+        assert len(array_file) == len(expected)
+        assert list(array_file) == expected
+        assert array_file[1:] == expected[1:]
+        assert [value for batch in array_file.iter_batches(batch_size=2) for value in batch] == expected
+        if expected:
+            assert array_file[-1] == expected[-1]
+            assert array_file.read_range(0, 1) == expected[:1]
+
+
+def test_json_array_file_rejects_other_documents(tmp_path):
+    path = tmp_path / "object.json"
+    path.write_text('{"a": [1]}')
+    with pytest.raises(ValueError):
+        JSONArrayFile(str(path))
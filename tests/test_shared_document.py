@@ -0,0 +1,100 @@
+import math
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+pytest.importorskip("multiprocessing.shared_memory")
+
+from jsonanatomy import Maybe, SharedDocument, Xplore  # noqa: E402
+
+SCALARS = [
+    None, True, False, 0, -1, 2 ** 63 - 1, -2 ** 63, 2 ** 63, -(10 ** 30), 0.0, -0.0, 1.5, -2.5e-300, 1e308,
+    "", "x", "café", "😀 \u0000 \"quoted\" \\", "long " * 40,
+]
+
+SHARED = {"currency": "USD"}
+DOCUMENT = {
+    "empty_object": {},
+    "empty_array": [],
+    "scalars": SCALARS,
+    "nested": [[[]], [{"a": [{"b": {}}]}], {"": {"": None}}],
+    "repeated": [SHARED, SHARED, {"currency": "USD"}],
+    "keys": {"ü": 1, "a\"b": 2, "k" * 100: 3},
+    "records": [{"id": i, "total": i * 1.5, "tags": ["t%d" % (i % 3)]} for i in range(50)],
+}
+
+
+def assert_same(actual, expected):
+    """Compare like ``==`` but also tell bool from int and -0.0 from 0.0."""
+    assert type(actual) is type(expected)
+    if isinstance(expected, dict):
+        assert list(actual) == list(expected)
+        for key in expected:
+            assert_same(actual[key], expected[key])
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected)
+        for a, b in zip(actual, expected):
+            assert_same(a, b)
+    elif isinstance(expected, float):
+        assert actual == expected and math.copysign(1.0, actual) == math.copysign(1.0, expected)
+    else:
+        assert actual == expected
+
+
+@pytest.mark.parametrize("value", SCALARS, ids=[repr(value)[:20] for value in SCALARS])
+def test_scalar_round_trip(value):
+    with SharedDocument.publish(value) as doc:
+        assert_same(doc.root, value)
+        assert_same(doc.materialize(), value)
+
+
+@pytest.mark.parametrize("value", [{}, [], [[]], {"a": {}}], ids=["object", "array", "nested_array", "nested_object"])
+def test_empty_container_round_trip(value):
+    with SharedDocument.publish(value) as doc:
+        assert doc.root == value
+        assert_same(doc.materialize(), value)
+
+
+def test_document_round_trip():
+    with SharedDocument.publish(DOCUMENT) as doc:
+        assert doc.root == DOCUMENT
+        assert_same(doc.materialize(), DOCUMENT)
+        assert_same(doc.root["nested"].materialize(), DOCUMENT["nested"])
+        assert_same(doc.root["keys"].materialize(), DOCUMENT["keys"])
+        assert doc.root["scalars"][-3:] == SCALARS[-3:]
+        assert doc.root["records"][-1]["tags"][0] == "t1"
+        assert Maybe(doc.root)["records"][7]["total"].value() == 10.5
+        assert Xplore(doc.root)["keys"]["ü"].value() == 1
+
+
+def test_tuples_decode_as_lists():
+    with SharedDocument.publish({"pair": (1, (2, 3))}) as doc:
+        assert_same(doc.materialize(), {"pair": [1, [2, 3]]})
+
+
+def test_publish_rejects_non_json_values():
+    with pytest.raises(TypeError):
+        SharedDocument.publish({"when": object()})
+
+
+def test_pickle_attaches_to_segment():
+    with SharedDocument.publish(DOCUMENT) as doc:
+        copy = pickle.loads(pickle.dumps(doc))
+        try:
+            assert copy.name == doc.name
+            assert_same(copy.materialize(), DOCUMENT)
+        finally:
+            copy.close()
+
+
+def summarize(doc, index):
+    record = doc.root["records"][index]
+    return record["id"], record["total"], doc.root["repeated"][0]["currency"], doc.materialize() == DOCUMENT
+
+
+def test_process_pool_workers_attach():
+    with SharedDocument.publish(DOCUMENT) as doc:
+        with ProcessPoolExecutor(2) as pool:
+            results = list(pool.map(summarize, [doc] * 4, [0, 1, 25, 49]))
+    assert results == [(i, i * 1.5, "USD", True) for i in [0, 1, 25, 49]]
@@ -0,0 +1,98 @@
+import pytest
+
+from jsonanatomy import Explore, ValueIndex
+
+DOCUMENT = {
+    "orders": [
+        {"id": "abc123", "note": "Refund for ABC123, see ticket", "qty": 1},
+        {"id": "abd999", "parent": "abc123", "qty": 1.0, "paid": True},
+        {"id": "xyz", "qty": "1", "paid": False, "coupon": None},
+    ],
+    "meta": {"count": 3, "ratio": 0.5, "tags": ["refund", "ab"], "empty": {}, "none": []},
+}
+
+
+@pytest.fixture
+def index():
+    return ValueIndex(DOCUMENT, tokens=True)
+
+
+def test_exact_lookups_are_typed(index):
+    assert index.lookup(1) == [("orders", 0, "qty")]
+    assert index.lookup(1.0) == [("orders", 1, "qty")]
+    assert index.lookup(True) == [("orders", 1, "paid")]
+    assert index.lookup("1") == [("orders", 2, "qty")]
+    assert index.lookup(False) == [("orders", 2, "paid")]
+    assert index.lookup(0) == []
+    assert index.lookup(None) == [("orders", 2, "coupon")]
+    assert index.lookup(3) == [("meta", "count")]
+    assert index.lookup(3.0) == []
+    assert index.lookup("abc123") == [("orders", 0, "id"), ("orders", 1, "parent")]
+    assert index.lookup("ABC123") == []
+    assert index.lookup([1]) == []
+    assert 1 in index and 1.0 in index and "1" in index and True in index
+    assert 2 not in index and 0 not in index and "missing" not in index
+
+
+def test_containers_are_not_values(index):
+    assert index.lookup({}) == []
+    assert index.lookup([]) == []
+    assert len(index) == len({"abc123", "abd999", "xyz", "Refund for ABC123, see ticket", "refund", "ab"}) + 8
+    assert repr(index).startswith("ValueIndex[values=")
+
+
+def test_prefix_lookups_are_in_document_order_and_limited(index):
+    assert index.lookup_prefix("ab") == [
+        ("orders", 0, "id"), ("orders", 1, "id"), ("orders", 1, "parent"), ("meta", "tags", 1),
+    ]
+    assert index.lookup_prefix("ab", limit=2) == [("orders", 0, "id"), ("orders", 1, "id")]
+    assert index.lookup_prefix("ab", limit=0) == []
+    assert index.lookup_prefix("abc") == [("orders", 0, "id"), ("orders", 1, "parent")]
+    assert index.lookup_prefix("1") == [("orders", 2, "qty")]
+    assert index.lookup_prefix("AB") == []
+    assert index.lookup_prefix("") == index.lookup_prefix("", limit=100)
+    assert len(index.lookup_prefix("")) == 8
+
+
+def test_token_lookups(index):
+    assert index.lookup_token("refund") == [("orders", 0, "note"), ("meta", "tags", 0)]
+    assert index.lookup_token("ABC123") == [("orders", 0, "id"), ("orders", 0, "note"), ("orders", 1, "parent")]
+    assert index.lookup_token("tick") == []
+    assert index.lookup_token("tick", prefix=True) == [("orders", 0, "note")]
+    assert index.lookup_token("ab", prefix=True, limit=3) == [
+        ("orders", 0, "id"), ("orders", 0, "note"), ("orders", 1, "id"),
+    ]
+    assert index.lookup_token("refund", limit=1) == [("orders", 0, "note")]
+
+
+def test_token_lookups_require_tokens():
+    with pytest.raises(ValueError):
+        ValueIndex(DOCUMENT).lookup_token("refund")
+
+
+def test_save_and_load_round_trip(index, tmp_path):
+    path = tmp_path / "orders.index.json"
+    index.save(str(path))
+    loaded = ValueIndex.load(str(path))
+    assert loaded.tokens is True
+    assert len(loaded) == len(index)
+    for value in [1, 1.0, True, False, "1", None, 3, 0.5, "abc123", "missing"]:
+        assert loaded.lookup(value) == index.lookup(value), value
+        assert (value in loaded) == (value in index)
+    assert loaded.lookup_prefix("ab", limit=3) == index.lookup_prefix("ab", limit=3)
+    assert loaded.lookup_token("ab", prefix=True) == index.lookup_token("ab", prefix=True)
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('{"orders": []}')
+    with pytest.raises(ValueError):
+        ValueIndex.load(str(path))
+
+
+def test_explore_value_index_is_relative_to_the_node():
+    explore = Explore(DOCUMENT)
+    assert explore.value_index().lookup("abc123") == ValueIndex(DOCUMENT).lookup("abc123")
+    orders = explore.child("orders").value_index(tokens=True)
+    assert orders.lookup("abc123") == [(0, "id"), (1, "parent")]
+    assert orders.lookup_token("refund") == [(0, "note")]
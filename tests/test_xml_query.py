@@ -0,0 +1,77 @@
+import pytest
+
+from jsonanatomy import SimpleXML, XMLQuery
+
+XML = (
+    '<shop><item sku="a1"><price>3</price></item><box><item sku="b2"><price>5</price></item></box>'
+    "<item><name>plain</name></item></shop>"
+)
+
+
+def backends():
+    yield "etree"
+    try:
+        SimpleXML("<a/>", parser="lxml")
+    except ImportError:
+        yield pytest.param("lxml", marks=pytest.mark.skip(reason="lxml is not installed"))
+    else:
+        yield "lxml"
+
+
+@pytest.fixture(params=list(backends()))
+def document(request):
+    return SimpleXML(XML, parser=request.param)
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("item/@sku", ["a1"]),
+    (".//item/@sku", ["a1", "b2"]),
+    ("item[@sku='a1']/price", ["3"]),
+    (".//price/text()", ["3", "5"]),
+    ("item", [{"price": "3"}, {"name": "plain"}]),
+    ("box/item[1]/price", ["5"]),
+    ("missing", []),
+])
+def test_shared_paths_match_on_both_backends(document, path, expected):
+    query = XMLQuery(path)
+    assert query.find_all(document) == expected
+    assert query.first(document, default="none") == (expected[0] if expected else "none")
+
+
+@pytest.mark.parametrize("path", ["item[", "item[@sku=]", "x:item"])
+def test_invalid_paths_raise_value_error(document, path):
+    query = XMLQuery(path)
+    with pytest.raises(ValueError):
+        query.find_all(document)
+    with pytest.raises(ValueError):
+        query.first(document)
+
+
+def test_absolute_paths_raise_value_error_on_etree():
+    document = SimpleXML(XML, parser="etree")
+    with pytest.raises(ValueError):
+        XMLQuery("//item/@sku").find_all(document)
+
+
+def test_absolute_paths_and_functions_on_lxml():
+    pytest.importorskip("lxml")
+    document = SimpleXML(XML, parser="lxml")
+    assert XMLQuery("//item/@sku").find_all(document) == ["a1", "b2"]
+    assert XMLQuery("count(//item)").first(document) == 3.0
+
+
+def test_lxml_parses_deep_documents_with_huge_tree():
+    pytest.importorskip("lxml")
+    from xml.etree.ElementTree import ParseError
+
+    depth = 300
+    text = "<a>" * depth + "x" + "</a>" * depth
+    with pytest.raises(ParseError):
+        SimpleXML(text, parser="lxml")
+    document = SimpleXML(text, parser="lxml", huge_tree=True)
+    assert XMLQuery("." + "/a" * (depth - 1) + "/text()").first(document) == "x"
+
+
+def test_etree_ignores_huge_tree():
+    document = SimpleXML("<a><b>x</b></a>", parser="etree", huge_tree=True)
+    assert document.to_dict() == {"b": "x"}